@@ -1,15 +1,180 @@
+"""Benchmarks.
+
+Run with pytest-benchmark:
+
+    pytest etc/bench.py
+
+By default calendar-specific benchmarks are run for a representative
+sample of calendars. Set the environment variable XCALS_BENCH_CALENDARS
+to a comma-separated list of calendar names, or to 'all', to define the
+calendars to benchmark.
+
+Baselines and regression comparison
+-----------------------------------
+Save a baseline, for example for a release:
+
+    pytest etc/bench.py --benchmark-save=<release>
+
+Compare against the most recently saved baseline, failing if the mean
+time of any benchmark has regressed by more than 10%:
+
+    pytest etc/bench.py --benchmark-compare --benchmark-compare-fail=mean:10%
+
+Compare against a specific saved baseline by passing its id (for example
+--benchmark-compare=0001). Saved baselines can be compared with each
+other with `pytest-benchmark compare`. Baselines are saved to the
+directory defined by --benchmark-storage (default ./.benchmarks).
+
+Peak memory
+-----------
+`test_peak_memory` records the peak memory allocated when creating a
+calendar and evaluating its minutes. The peak is stored to the
+benchmark's 'extra_info' (key 'peak_memory_mb') and is reported with the
+saved or json output.
+
+Pickling
+--------
+`test_pickle_round_trip` compares pickling a calendar with pickling its
+full `__dict__` (i.e. including all evaluated minutes). The size of the
+pickled payload is stored to 'extra_info' (key 'payload_mb').
+"""
+
+import functools
 import itertools
+import os
+import pickle
+import subprocess
+import sys
+import tracemalloc
 
+import numpy as np
 import pandas as pd
+import pytest
 
-from exchange_calendars import get_calendar
-from exchange_calendars.calendar_helpers import UTC
+from exchange_calendars import get_calendar, schedule_cache
+from exchange_calendars.calendar_helpers import (
+    NANOSECONDS_PER_MINUTE,
+    NP_NAT,
+    UTC,
+    compute_minutes,
+)
 from exchange_calendars.calendar_utils import (
     ExchangeCalendarDispatcher,
     _default_calendar_aliases,
     _default_calendar_factories,
+    default_calendar_names,
 )
 
+_bench_calendars = os.environ.get("XCALS_BENCH_CALENDARS")
+if _bench_calendars is None:
+    CALENDAR_NAMES = ["XNYS", "CMES", "XHKG", "XLON", "XTAE", "24/7"]
+elif _bench_calendars == "all":
+    CALENDAR_NAMES = default_calendar_names
+else:
+    CALENDAR_NAMES = _bench_calendars.split(",")
+
+# Trading index options as (intervals, closed).
+TRADING_INDEX_OPTIONS = [
+    (True, "left"),
+    (True, "right"),
+    (False, "left"),
+    (False, "right"),
+    (False, "both"),
+    (False, "neither"),
+]
+
+
+@pytest.fixture(autouse=True, scope="module")
+def no_schedule_cache():
+    """Ensure calendar construction benchmarks evaluate schedules."""
+    path = schedule_cache.get_path()
+    schedule_cache.disable()
+    yield
+    if path is not None:
+        schedule_cache.enable(path)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_calendar(name):
+    """Get calendar with default arguments, constructing once only."""
+    return _default_calendar_factories[name]()
+
+
+def _scalar_query_args(cal):
+    """Map of scalar query methods to arguments with which to call them."""
+    i = len(cal.sessions) // 2
+    session = cal.sessions[i]
+    session_later = cal.sessions[i + 20]
+    date = session - pd.Timedelta(1, "D")
+    trading_minute = cal.session_first_minute(session) + pd.Timedelta(1, "min")
+    minute = cal.session_last_minute(session) + pd.Timedelta(2, "min")
+    minute_later = cal.session_last_minute(session_later)
+    return {
+        # methods that interrogate a given session
+        "session_open": (session,),
+        "session_close": (session,),
+        "session_break_start": (session,),
+        "session_break_end": (session,),
+        "session_open_close": (session,),
+        "session_break_start_end": (session,),
+        "session_first_minute": (session,),
+        "session_last_minute": (session,),
+        "session_last_am_minute": (session,),
+        "session_first_pm_minute": (session,),
+        "session_first_last_minute": (session,),
+        "session_has_break": (session,),
+        "next_session": (session,),
+        "previous_session": (session,),
+        "session_minutes": (session,),
+        "session_offset": (session, 5),
+        # methods that interrogate a date
+        "is_session": (date,),
+        "date_to_session": (date, "next"),
+        # methods that interrogate a given minute
+        "is_trading_minute": (trading_minute,),
+        "is_break_minute": (trading_minute,),
+        "is_open_on_minute": (trading_minute,),
+        "is_open_at_time": (trading_minute,),
+        "next_open": (minute,),
+        "next_close": (minute,),
+        "previous_open": (minute,),
+        "previous_close": (minute,),
+        "next_minute": (minute,),
+        "previous_minute": (minute,),
+        "minute_to_session": (minute,),
+        "minute_to_past_session": (minute,),
+        "minute_to_future_session": (minute,),
+        "minute_to_trading_minute": (minute, "next"),
+        "minute_offset": (trading_minute, 5),
+        "minute_offset_by_sessions": (trading_minute, 2),
+        # methods that evaluate or interrogate a range of minutes
+        "minutes_in_range": (trading_minute, minute_later),
+        "minutes_window": (trading_minute, 30),
+        "minutes_distance": (trading_minute, minute_later),
+        # methods that evaluate or interrogate a range of sessions
+        "sessions_in_range": (session, session_later),
+        "sessions_has_break": (session, session_later),
+        "sessions_window": (session, 20),
+        "sessions_distance": (session, session_later),
+        "sessions_minutes": (session, session_later),
+        "sessions_minutes_count": (session, session_later),
+    }
+
+
+SCALAR_QUERY_METHODS = list(_scalar_query_args(get_calendar("XNYS")))
+
+
+@pytest.mark.benchmark(group="import")
+@pytest.mark.parametrize("module", ["pandas", "exchange_calendars"])
+def test_import_time(benchmark, module):
+    """Time to import a module in a new interpreter.
+
+    Import time of exchange_calendars should be close to that of pandas.
+    Calendar modules should not be imported until a calendar is requested.
+    """
+    args = [sys.executable, "-c", f"import {module}"]
+    benchmark.pedantic(subprocess.run, args=(args,), kwargs={"check": True}, rounds=5)
+
 
 def construct_all_calendars():
     dispatcher = ExchangeCalendarDispatcher(
@@ -47,3 +212,246 @@ def test_is_open_on_minute(benchmark):
         pd.Timestamp("2019-10-11 08:01:00", tz=UTC),  # post close
     ]
     benchmark(is_open_on_minute_bench, xhkg, timestamps)
+
+
+def compute_minutes_loop(opens, break_starts, break_ends, closes, side):
+    """Per-session implementation of `compute_minutes`, for comparison."""
+    start_ext = 0 if side in ["left", "both"] else NANOSECONDS_PER_MINUTE
+    end_ext = NANOSECONDS_PER_MINUTE if side in ["right", "both"] else 0
+    pieces = []
+    for open_, break_start, break_end, close in zip(
+        opens, break_starts, break_ends, closes
+    ):
+        if break_start != NP_NAT:
+            pieces.append(
+                np.arange(
+                    open_ + start_ext, break_start + end_ext, NANOSECONDS_PER_MINUTE
+                )
+            )
+            pieces.append(
+                np.arange(
+                    break_end + start_ext, close + end_ext, NANOSECONDS_PER_MINUTE
+                )
+            )
+        else:
+            pieces.append(
+                np.arange(open_ + start_ext, close + end_ext, NANOSECONDS_PER_MINUTE)
+            )
+    return np.concatenate(pieces).view("datetime64[ns]")
+
+
+@pytest.mark.benchmark(group="compute_minutes")
+@pytest.mark.parametrize("name", ["XNYS", "CMES", "XHKG"])
+@pytest.mark.parametrize("func", [compute_minutes, compute_minutes_loop])
+def test_compute_minutes(benchmark, name, func):
+    cal = get_calendar(name)
+    args = (
+        cal.opens_nanos,
+        cal.break_starts_nanos,
+        cal.break_ends_nanos,
+        cal.closes_nanos,
+        cal.side,
+    )
+    benchmark(func, *args)
+
+
+@pytest.mark.benchmark(group="construction")
+@pytest.mark.parametrize("name", CALENDAR_NAMES)
+def test_construction(benchmark, name):
+    """Time to construct a calendar with default arguments."""
+    factory = _default_calendar_factories[name].resolve()
+    benchmark.pedantic(factory, rounds=3)
+
+
+@pytest.mark.benchmark(group="minutes_first_access")
+@pytest.mark.parametrize("attr", ["minutes", "minutes_nanos"])
+@pytest.mark.parametrize("name", CALENDAR_NAMES)
+def test_minutes_first_access(benchmark, name, attr):
+    """Time to first access `minutes` or `minutes_nanos`."""
+    cal = _get_calendar(name)
+
+    def setup():
+        for cached in ("minutes", "minutes_nanos", "_minute_index"):
+            cal.__dict__.pop(cached, None)
+
+    benchmark.pedantic(getattr, args=(cal, attr), setup=setup, rounds=5)
+
+
+@pytest.mark.benchmark(group="scalar_query")
+@pytest.mark.parametrize("method", SCALAR_QUERY_METHODS)
+@pytest.mark.parametrize("name", CALENDAR_NAMES)
+def test_scalar_query(benchmark, name, method):
+    """Time to call a scalar query method with pd.Timestamp input."""
+    cal = _get_calendar(name)
+    args = _scalar_query_args(cal)[method]
+    benchmark(getattr(cal, method), *args)
+
+
+@pytest.mark.benchmark(group="scalar_query_nanos")
+@pytest.mark.parametrize(
+    "method",
+    [
+        "is_trading_minute",
+        "is_open_on_minute",
+        "is_open_at_time",
+        "next_open",
+        "previous_close",
+        "minute_to_session",
+    ],
+)
+@pytest.mark.parametrize("name", CALENDAR_NAMES)
+def test_scalar_query_nanos(benchmark, name, method):
+    """Time to call a scalar query method with int nanoseconds input."""
+    cal = _get_calendar(name)
+    args = tuple(
+        arg.value if isinstance(arg, pd.Timestamp) else arg
+        for arg in _scalar_query_args(cal)[method]
+    )
+    benchmark(getattr(cal, method), *args)
+
+
+@pytest.mark.benchmark(group="trading_index")
+@pytest.mark.parametrize("intervals, closed", TRADING_INDEX_OPTIONS)
+@pytest.mark.parametrize("period", ["1min", "5min", "1h", "1D"])
+@pytest.mark.parametrize("name", CALENDAR_NAMES)
+def test_trading_index(benchmark, name, period, intervals, closed):
+    """Time to evaluate a trading index over a year of sessions."""
+    cal = _get_calendar(name)
+    start, end = cal.sessions[-300], cal.sessions[-50]
+    kwargs = dict(intervals=intervals, closed=closed, force=True)
+    if intervals:
+        kwargs["curtail_overlaps"] = True
+    benchmark(cal.trading_index, start, end, period, **kwargs)
+
+
+@pytest.mark.benchmark(group="trading_index_20_years")
+@pytest.mark.parametrize("as_nanos", [False, True])
+@pytest.mark.parametrize("force", [False, True])
+@pytest.mark.parametrize("intervals", [False, True])
+@pytest.mark.parametrize("name", ["XHKG", "CMES"])
+def test_trading_index_20_years(benchmark, name, intervals, force, as_nanos):
+    """Time to evaluate a 1 minute trading index over 20 years of sessions."""
+    cal = get_calendar(name, start="2004-01-01", end="2024-01-01")
+    start, end = cal.sessions[0], cal.sessions[-1]
+    benchmark(
+        cal.trading_index,
+        start,
+        end,
+        "1min",
+        intervals=intervals,
+        closed="right",
+        force=force,
+        curtail_overlaps=True,
+        as_nanos=as_nanos,
+    )
+
+
+@pytest.mark.benchmark(group="trading_index_cache")
+@pytest.mark.parametrize("subrange", [False, True])
+@pytest.mark.parametrize("name", CALENDAR_NAMES)
+def test_trading_index_cache(benchmark, name, subrange):
+    """Time to serve a trading index from the trading index cache."""
+    cal = _get_calendar(name).slice()
+    cal.trading_index_cache_enable()
+    start, end = cal.sessions[-300], cal.sessions[-50]
+    cal.trading_index(start, end, "1min", force=True)
+    if subrange:
+        start, end = cal.sessions[-200], cal.sessions[-100]
+    benchmark(cal.trading_index, start, end, "1min", force=True)
+
+
+@pytest.fixture(scope="module")
+def many_minutes():
+    """Large inputs of minutes, key as calendar name."""
+
+    @functools.lru_cache(maxsize=None)
+    def get(name):
+        cal = _get_calendar(name)
+        # NB end short of last session to allow for evaluating next opens
+        trading_minutes = cal.minutes[-1_100_000:-100_000]
+        # minutes over the same period that are not all trading minutes
+        minutes = pd.date_range(
+            trading_minutes[0], trading_minutes[-1], periods=1_000_000
+        ).floor("min")
+        return trading_minutes, minutes
+
+    return get
+
+
+@pytest.mark.benchmark(group="minutes_to_sessions")
+@pytest.mark.parametrize("name", CALENDAR_NAMES)
+def test_minutes_to_sessions(benchmark, name, many_minutes):
+    """Time to evaluate sessions of 1 million trading minutes."""
+    cal = _get_calendar(name)
+    trading_minutes, _ = many_minutes(name)
+    benchmark(cal.minutes_to_sessions, trading_minutes)
+
+
+@pytest.mark.benchmark(group="array_query")
+@pytest.mark.parametrize(
+    "method",
+    [
+        "is_trading_minutes",
+        "is_open_on_minutes",
+        "is_open_at_times",
+        "minutes_to_session_indices",
+        "next_opens_nanos",
+    ],
+)
+@pytest.mark.parametrize("name", CALENDAR_NAMES)
+def test_array_query(benchmark, name, method, many_minutes):
+    """Time to query 1 million minutes with an array query method."""
+    cal = _get_calendar(name)
+    _, minutes = many_minutes(name)
+    benchmark(getattr(cal, method), minutes)
+
+
+@pytest.mark.benchmark(group="pickle")
+@pytest.mark.parametrize("payload", ["compact", "full"])
+@pytest.mark.parametrize("name", CALENDAR_NAMES)
+def test_pickle_round_trip(benchmark, name, payload):
+    """Time to pickle and unpickle a calendar with evaluated minutes.
+
+    'compact' pickles the calendar. 'full' pickles the calendar's
+    `__dict__`, as pickled prior to the calendar defining a compact
+    state. Size of pickled payload recorded to `extra_info` as
+    'payload_mb'.
+    """
+    cal = _get_calendar(name)
+    cal.minutes, cal.minutes_nanos, cal.day  # evaluate derived data
+    if payload == "compact":
+        obj = cal
+    else:
+        obj = dict(cal.__dict__)
+        obj.pop("_trading_index_cache", None)  # has a lock, cannot be pickled
+
+    def round_trip():
+        return pickle.loads(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+    benchmark(round_trip)
+    payload_size = len(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+    benchmark.extra_info["payload_mb"] = round(payload_size / 2**20, 3)
+
+
+def construct_and_evaluate_minutes(factory):
+    cal = factory()
+    cal.minutes_nanos
+    return cal
+
+
+@pytest.mark.benchmark(group="peak_memory")
+@pytest.mark.parametrize("name", CALENDAR_NAMES)
+def test_peak_memory(benchmark, name):
+    """Peak memory allocated to create a calendar and evaluate its minutes.
+
+    Peak memory recorded to `extra_info` as 'peak_memory_mb'.
+    """
+    factory = _default_calendar_factories[name].resolve()
+    factory()  # import and initialise anything that is initialised once only
+    tracemalloc.start()
+    try:
+        benchmark.pedantic(construct_and_evaluate_minutes, args=(factory,), rounds=1)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_memory_mb"] = round(peak / 2**20, 2)
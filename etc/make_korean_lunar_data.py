@@ -0,0 +1,123 @@
+"""
+This script generates the module exchange_calendars/pandas_extensions/
+korean_lunar_data.py which provides the lookup table used to convert between
+dates of the Korean lunar calendar and the (Gregorian) solar calendar.
+
+Data is sourced from the korean_lunar_calendar library, which is required to
+run this script (but is not required by exchange_calendars at runtime). See
+etc/requirements_korean_lunar_data.txt.
+
+This script can be run from the root of the repository with:
+    $ python etc/make_korean_lunar_data.py
+
+The table covers lunar years from 1583, the first lunar year that the library
+fully represents with Gregorian solar dates (the library's solar dates prior to
+1582-10-15 are Julian), to the library's last supported lunar year.
+"""
+
+import datetime
+import pathlib
+
+from korean_lunar_calendar import KoreanLunarCalendar
+
+FIRST_YEAR = 1583
+EPOCH = datetime.date(1970, 1, 1)
+PER_LINE = 8
+
+path = (
+    pathlib.Path(__file__)
+    .parents[1]
+    .joinpath("exchange_calendars", "pandas_extensions", "korean_lunar_data.py")
+)
+
+calendar = KoreanLunarCalendar()
+last_year = KoreanLunarCalendar.KOREAN_LUNAR_MAX_VALUE // 10000
+
+
+def get_lunar_data(year: int) -> int:
+    return calendar._KoreanLunarCalendar__getLunarData(year)
+
+
+def get_intercalation_month(year: int) -> int:
+    return calendar._KoreanLunarCalendar__getLunarIntercalationMonth(
+        get_lunar_data(year)
+    )
+
+
+def get_lunar_days(year: int, month: int, is_intercalation: bool) -> int:
+    return calendar._KoreanLunarCalendar__getLunarDays(year, month, is_intercalation)
+
+
+def lunar_to_days(year: int, month: int, day: int) -> int:
+    assert calendar.setLunarDate(year, month, day, False)
+    solar = datetime.date(calendar.solarYear, calendar.solarMonth, calendar.solarDay)
+    return (solar - EPOCH).days
+
+
+new_years, month_data = [], []
+for year in range(FIRST_YEAR, last_year + 1):
+    leap_month = get_intercalation_month(year)
+    months = [(month, False) for month in range(1, 13)]
+    if leap_month:
+        months.insert(leap_month, (leap_month, True))
+    long_months = 0
+    for i, (month, is_intercalation) in enumerate(months):
+        days = get_lunar_days(year, month, is_intercalation)
+        assert days in (29, 30)
+        long_months |= (days == 30) << i
+    new_years.append(lunar_to_days(year, 1, 1))
+    month_data.append(leap_month << 13 | long_months)
+    if year > FIRST_YEAR:
+        prev_lengths = [
+            29 + (month_data[-2] >> i & 1)
+            for i in range(12 + bool(month_data[-2] >> 13))
+        ]
+        assert new_years[-1] - new_years[-2] == sum(prev_lengths)
+
+
+def render(values: list[int]) -> str:
+    lines = [
+        "    " + " ".join(f"{v}," for v in values[i : i + PER_LINE])
+        for i in range(0, len(values), PER_LINE)
+    ]
+    return "\n".join(lines)
+
+
+solar_max = KoreanLunarCalendar.KOREAN_SOLAR_MAX_VALUE
+lunar_max = KoreanLunarCalendar.KOREAN_LUNAR_MAX_VALUE
+
+content = f'''"""Korean lunar calendar data.
+
+Generated by etc/make_korean_lunar_data.py from korean_lunar_calendar. Do not
+edit by hand.
+
+Data describes each lunar year from `FIRST_YEAR` through `LAST_YEAR`.
+`NEW_YEARS` has the solar date of each lunar new year, as days since
+1970-01-01. `MONTH_DATA` has for each year an int of which bits 0-12 indicate
+if each month of the year, in chronological order and including any
+intercalary month, is long (30 days) or short (29 days) and bits 13-16 give
+the month that is followed by an intercalary month (0 if none).
+"""
+
+FIRST_YEAR = {FIRST_YEAR}
+LAST_YEAR = {last_year}
+
+# Supported range of dates, as yyyymmdd
+LUNAR_MIN_VALUE = {FIRST_YEAR}0101
+LUNAR_MAX_VALUE = {lunar_max}
+SOLAR_MIN_VALUE = {(EPOCH + datetime.timedelta(new_years[0])).strftime("%Y%m%d")}
+SOLAR_MAX_VALUE = {solar_max}
+
+# fmt: off
+NEW_YEARS = (
+{render(new_years)}
+)
+
+MONTH_DATA = (
+{render(month_data)}
+)
+# fmt: on
+'''
+
+path.write_text(content)
+print(f"Written {last_year - FIRST_YEAR + 1} years of data to {path}")
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Iterator
 import contextlib
+import copy
 import datetime
+import threading
 import typing
-from typing import Literal
+from typing import Literal, NamedTuple
 from zoneinfo import ZoneInfo
 
 import numpy as np
@@ -22,7 +26,7 @@ NP_NAT = pd.NaT.value
 
 # Use Date type where input does not need to represent an actual session
 # and will be parsed by parse_date.
-Date = typing.Union[pd.Timestamp, str, int, float, datetime.datetime]
+Date = typing.Union[pd.Timestamp, str, int, float, datetime.datetime, np.datetime64]
 
 # Use Session type where input should represent an actual session and will
 # be parsed by parse_session.
@@ -30,12 +34,20 @@ Session = Date
 
 # Use Minute type where input does not need to represent an actual trading
 # minute and will be parsed by parse_timestamp.
-Minute = typing.Union[pd.Timestamp, str, int, float, datetime.datetime]
+Minute = typing.Union[pd.Timestamp, str, int, float, datetime.datetime, np.datetime64]
 
 # Use TradingMinute where input should represent a trading minute and will
 # be parsed by parse_trading_minute.
 TradingMinute = Minute
 
+# Use Dates type where input represents multiple dates and will be parsed
+# by parse_dates.
+Dates = typing.Union[pd.DatetimeIndex, pd.Series, np.ndarray, typing.Sequence[Date]]
+
+# Use Minutes type where input represents multiple minutes and will be
+# parsed by parse_timestamps.
+Minutes = Dates
+
 
 def next_divider_idx(dividers: np.ndarray, minute_val: int) -> int:
     divider_idx = np.searchsorted(dividers, minute_val, side="right")
@@ -57,48 +69,233 @@ def previous_divider_idx(dividers: np.ndarray, minute_val: int) -> int:
     return divider_idx - 1
 
 
-def compute_minutes(
+def concat_aranges(starts: np.ndarray, counts: np.ndarray, step: int) -> np.ndarray:
+    """Return concatenation of multiple arithmetic sequences.
+
+    Vectorised equivalent of::
+
+        np.concatenate(
+            [np.arange(s, s + c * step, step) for s, c in zip(starts, counts)]
+        )
+
+    Parameters
+    ----------
+    starts
+        int64 array of first value of each sequence.
+
+    counts
+        Number of values in each sequence. Sequences with a count of 0 (or
+        less) are omitted.
+
+    step
+        Difference between consecutive values of each sequence.
+
+    Returns
+    -------
+    np.ndarray
+        int64 array.
+    """
+    nonempty = counts > 0
+    if not nonempty.all():
+        starts, counts = starts[nonempty], counts[nonempty]
+    out = np.full(counts.sum(), step, dtype=np.int64)
+    if not out.size:
+        return out
+    # set first value of each sequence such that cumsum resets to its start
+    firsts_idx = np.cumsum(counts) - counts
+    lasts = starts + (counts - 1) * step
+    out[0] = starts[0]
+    out[firsts_idx[1:]] = starts[1:] - lasts[:-1]
+    return np.cumsum(out, out=out)
+
+
+def minute_blocks(
     opens_in_ns: np.ndarray,
     break_starts_in_ns: np.ndarray,
     break_ends_in_ns: np.ndarray,
     closes_in_ns: np.ndarray,
     side: Literal["left", "right", "both", "neither"] = "both",
-) -> np.ndarray:
-    """Return array of trading minutes."""
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return first trading minute and number of trading minutes of subsessions.
+
+    Each session is represented by an am and a pm subsession. Sessions
+    without a break are represented by an am subsession that runs from
+    open to close and an empty pm subsession.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        [0] int64 array of first trading minute of each subsession, in
+            order [session0_am, session0_pm, session1_am, ...].
+        [1] int64 array of number of trading minutes in each subsession.
+            0 for pm subsessions of sessions without a break.
+    """
     start_ext = 0 if side in ["left", "both"] else NANOSECONDS_PER_MINUTE
     # NOTE: Add an extra minute to ending boundaries (break_start and close)
-    # so we include the last bar (arange doesn't include its stop).
+    # so we include the last bar (range doesn't include its stop).
     end_ext = NANOSECONDS_PER_MINUTE if side in ["right", "both"] else 0
 
-    pieces = []
-    for open_time, break_start_time, break_end_time, close_time in zip(
-        opens_in_ns, break_starts_in_ns, break_ends_in_ns, closes_in_ns
+    has_break = break_starts_in_ns != NP_NAT
+    am_stops = np.where(has_break, break_starts_in_ns, closes_in_ns)
+    pm_starts = np.where(has_break, break_ends_in_ns, closes_in_ns)
+
+    starts = np.column_stack((opens_in_ns, pm_starts)).ravel() + start_ext
+    stops = np.column_stack((am_stops, closes_in_ns)).ravel() + end_ext
+    # number of minutes in each subsession, as length of np.arange(start, stop)
+    counts = -((starts - stops) // NANOSECONDS_PER_MINUTE)
+    counts[counts < 0] = 0
+    counts[1::2][~has_break] = 0
+    return starts, counts
+
+
+def compute_minutes(
+    opens_in_ns: np.ndarray,
+    break_starts_in_ns: np.ndarray,
+    break_ends_in_ns: np.ndarray,
+    closes_in_ns: np.ndarray,
+    side: Literal["left", "right", "both", "neither"] = "both",
+) -> np.ndarray:
+    """Return array of trading minutes."""
+    starts, counts = minute_blocks(
+        opens_in_ns, break_starts_in_ns, break_ends_in_ns, closes_in_ns, side
+    )
+    minutes = concat_aranges(starts, counts, NANOSECONDS_PER_MINUTE)
+    return minutes.view("datetime64[ns]")
+
+
+class _MinuteIndex:
+    """Virtual index of trading minutes.
+
+    Behaves as a sorted int64 array of all trading minutes (as would be
+    returned by `compute_minutes`) although only stores the first minute
+    and number of minutes of each subsession. Positions and values are
+    evaluated arithmetically from these 'blocks' such that lookups are
+    O(log sessions) and memory is O(sessions).
+
+    Parameters
+    ----------
+    As `minute_blocks`.
+    """
+
+    def __init__(
+        self,
+        opens_in_ns: np.ndarray,
+        break_starts_in_ns: np.ndarray,
+        break_ends_in_ns: np.ndarray,
+        closes_in_ns: np.ndarray,
+        side: Literal["left", "right", "both", "neither"],
     ):
-        if break_start_time != NP_NAT:
-            pieces.append(
-                np.arange(
-                    open_time + start_ext,
-                    break_start_time + end_ext,
-                    NANOSECONDS_PER_MINUTE,
-                )
-            )
-            pieces.append(
-                np.arange(
-                    break_end_time + start_ext,
-                    close_time + end_ext,
-                    NANOSECONDS_PER_MINUTE,
-                )
-            )
+        starts, counts = minute_blocks(
+            opens_in_ns, break_starts_in_ns, break_ends_in_ns, closes_in_ns, side
+        )
+        nonempty = counts > 0
+        self.starts = starts[nonempty]
+        self.counts = counts[nonempty]
+        # position of each block's first minute
+        self.offsets = np.cumsum(self.counts) - self.counts
+        self.size = int(self.counts.sum())
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def first(self) -> int:
+        """First trading minute."""
+        return int(self.starts[0])
+
+    @property
+    def last(self) -> int:
+        """Last trading minute."""
+        return int(self.starts[-1] + (self.counts[-1] - 1) * NANOSECONDS_PER_MINUTE)
+
+    def searchsorted(
+        self, value: int | np.ndarray, side: Literal["left", "right"] = "left"
+    ) -> int | np.ndarray:
+        """Index position(s) at which value(s) would be inserted.
+
+        As `np.searchsorted` if evaluated against the array of all trading
+        minutes.
+        """
+        if isinstance(value, np.ndarray):
+            blocks = self.starts.searchsorted(value, side=side) - 1
+            bv = blocks >= 0
+            blocks = blocks[bv]
+            diff = value[bv] - self.starts[blocks]
+            if side == "left":
+                num = -(-diff // NANOSECONDS_PER_MINUTE)
+            else:
+                num = diff // NANOSECONDS_PER_MINUTE + 1
+            idxs = np.zeros(len(value), dtype=np.int64)
+            idxs[bv] = self.offsets[blocks] + np.minimum(self.counts[blocks], num)
+            return idxs
+
+        block = int(self.starts.searchsorted(value, side=side)) - 1
+        if block < 0:
+            return 0
+        diff = int(value) - int(self.starts[block])
+        if side == "left":
+            num = -(-diff // NANOSECONDS_PER_MINUTE)
         else:
-            pieces.append(
-                np.arange(
-                    open_time + start_ext,
-                    close_time + end_ext,
-                    NANOSECONDS_PER_MINUTE,
-                )
+            num = diff // NANOSECONDS_PER_MINUTE + 1
+        return int(self.offsets[block]) + min(int(self.counts[block]), num)
+
+    def contains(self, value: int | np.ndarray) -> bool | np.ndarray:
+        """Query if a value is a trading minute.
+
+        If `value` is an array then returns a boolean array.
+        """
+        if isinstance(value, np.ndarray):
+            blocks = self.starts.searchsorted(value, side="right") - 1
+            in_block = blocks >= 0
+            blocks[~in_block] = 0
+            num, remainder = np.divmod(
+                value - self.starts[blocks], NANOSECONDS_PER_MINUTE
             )
-    out = np.concatenate(pieces).view("datetime64[ns]")
-    return out
+            return in_block & (remainder == 0) & (num < self.counts[blocks])
+
+        block = int(self.starts.searchsorted(value, side="right")) - 1
+        if block < 0:
+            return False
+        num, remainder = divmod(
+            int(value) - int(self.starts[block]), NANOSECONDS_PER_MINUTE
+        )
+        return not remainder and num < self.counts[block]
+
+    def _get_block(self, position: int) -> int:
+        return int(self.offsets.searchsorted(position, side="right")) - 1
+
+    def __getitem__(self, key: int | slice) -> int | np.ndarray:
+        if isinstance(key, slice):
+            return self._get_slice(key)
+        position = int(key)
+        if position < 0:
+            position += self.size
+        if not 0 <= position < self.size:
+            raise IndexError(
+                f"index {key} is out of bounds for minute index with size {self.size}"
+            )
+        block = self._get_block(position)
+        diff = position - int(self.offsets[block])
+        return int(self.starts[block]) + diff * NANOSECONDS_PER_MINUTE
+
+    def _get_slice(self, slc: slice) -> np.ndarray:
+        start, stop, step = slc.indices(self.size)
+        if step != 1:
+            return self.to_numpy()[slc]
+        if stop <= start:
+            return np.array([], dtype=np.int64)
+        first_block, last_block = self._get_block(start), self._get_block(stop - 1)
+        blocks = slice(first_block, last_block + 1)
+        starts, counts = self.starts[blocks].copy(), self.counts[blocks].copy()
+        counts[-1] = stop - self.offsets[last_block]
+        diff = start - self.offsets[first_block]
+        starts[0] += diff * NANOSECONDS_PER_MINUTE
+        counts[0] -= diff
+        return concat_aranges(starts, counts, NANOSECONDS_PER_MINUTE)
+
+    def to_numpy(self) -> np.ndarray:
+        """Return int64 array of all trading minutes."""
+        return concat_aranges(self.starts, self.counts, NANOSECONDS_PER_MINUTE)
 
 
 def one_minute_earlier(arr: np.ndarray) -> np.ndarray:
@@ -151,6 +348,94 @@ def to_utc(ts: pd.Timestamp) -> pd.Timestamp:
         return ts.tz_localize(UTC)
 
 
+NANOSECONDS_PER_DAY = NANOSECONDS_PER_MINUTE * 60 * 24
+
+
+def _as_nanos(timestamp: typing.Any) -> int | None:
+    """Return nanoseconds represented by raw integer or np.datetime64 input.
+
+    Returns None if `timestamp` is not an integer or np.datetime64.
+    """
+    if isinstance(timestamp, (int, np.integer)) and not isinstance(timestamp, bool):
+        return int(timestamp)
+    if isinstance(timestamp, np.datetime64) and not np.isnat(timestamp):
+        return int(timestamp.astype("datetime64[ns]").astype(np.int64))
+    return None
+
+
+def parse_timestamp_nanos(
+    timestamp: Date | Minute,
+    param_name: str = "minute",
+    calendar: ExchangeCalendar | None = None,
+    raise_oob: bool = True,
+    side: Literal["left", "right", "both", "neither"] | None = None,
+) -> int:
+    """Parse input intended to represent a minute to nanoseconds.
+
+    Low-overhead equivalent of `parse_timestamp`. Input passed as a
+    pd.Timestamp, integer or np.datetime64 is parsed without creating any
+    further pandas object.
+
+    Parameters
+    ----------
+    timestamp
+        Input to be parsed as a minute. An integer is interpreted as
+        nanoseconds since epoch (UTC). A np.datetime64 or timezone naive
+        pd.Timestamp is interpreted as UTC. Any other input is parsed with
+        `parse_timestamp`.
+
+    param_name, calendar, raise_oob, side
+        As `parse_timestamp`.
+
+    Returns
+    -------
+    int
+        Minute as nanoseconds since epoch (UTC).
+
+    Raises
+    ------
+    Errors as `parse_timestamp`.
+    """
+    if isinstance(timestamp, pd.Timestamp):
+        # value is nanoseconds UTC regardless of any timezone
+        nanos = timestamp.value
+    else:
+        nanos = _as_nanos(timestamp)
+        if nanos is None:
+            ts = parse_timestamp(timestamp, param_name, calendar, raise_oob, side)
+            return ts.value
+
+    remainder = nanos % NANOSECONDS_PER_MINUTE
+    if remainder:
+        if side is None and calendar is None:
+            raise ValueError(
+                "`side` or `calendar` must be passed if `timestamp` has a"
+                " non-zero second (or more accurate) component. `timestamp`"
+                f" parsed as '{pd.Timestamp(nanos, tz=UTC)}'."
+            )
+        side = side if side is not None else calendar.side
+        if side == "left":
+            nanos -= remainder
+        elif side == "right":
+            nanos += NANOSECONDS_PER_MINUTE - remainder
+        else:
+            raise ValueError(
+                "`timestamp` cannot have a non-zero second (or more accurate)"
+                f" component for `side` '{side}'. `timestamp` parsed as"
+                f" '{pd.Timestamp(nanos, tz=UTC)}'."
+            )
+
+    if raise_oob:
+        if calendar is None:
+            raise ValueError("`calendar` must be passed if `raise_oob` is True.")
+        minute_index = calendar._minute_index
+        if nanos < minute_index.first or nanos > minute_index.last:
+            ts = pd.Timestamp(nanos, tz=UTC)
+            raise errors.MinuteOutOfBounds(calendar, ts, param_name)
+
+    return nanos
+
+
 def parse_timestamp(
     timestamp: Date | Minute,
     param_name: str = "minute",
@@ -208,6 +493,10 @@ def parse_timestamp(
         although timestamp is either before `calendar`'s first trading
         minute or after `calendar`'s last trading minute.
     """
+    if utc and _as_nanos(timestamp) is not None:
+        nanos = parse_timestamp_nanos(timestamp, param_name, calendar, raise_oob, side)
+        return pd.Timestamp(nanos, tz=UTC)
+
     if isinstance(timestamp, pd.Timestamp):
         ts = timestamp
     else:
@@ -369,6 +658,9 @@ def parse_date(
         timestamp is before `calendar`'s first session or after
         `calendar`'s last session.
     """
+    if _as_nanos(date) is not None:
+        return pd.Timestamp(parse_date_nanos(date, param_name, calendar, raise_oob))
+
     # side "left" to get it through 'second' handling. Has undesirable effect of
     # allowing `date` to be defined with a second (or more accurate) compoment
     # if it falls within the minute that follows midnight.
@@ -427,6 +719,9 @@ def parse_session(
         If `session` parses to a valid date although date does not
         represent a session of `calendar`.
     """
+    if _as_nanos(session) is not None:
+        return pd.Timestamp(parse_session_nanos(calendar, session, param_name))
+
     # let out-of-bounds be handled by more specific NotSessionError message.
     ts = parse_date(session, param_name, raise_oob=False)
     if calendar._date_oob(ts) or not calendar.is_session(ts, _parse=False):
@@ -434,6 +729,284 @@ def parse_session(
     return ts
 
 
+def parse_date_nanos(
+    date: Date,
+    param_name: str = "date",
+    calendar: ExchangeCalendar | None = None,
+    raise_oob: bool = True,
+) -> int:
+    """Parse input intended to represent a date to nanoseconds.
+
+    Low-overhead equivalent of `parse_date`. Input passed as an integer
+    or np.datetime64 is parsed without creating any pandas object.
+
+    Parameters
+    ----------
+    date
+        Input to be parsed as a date. An integer is interpreted as
+        nanoseconds since epoch. Any other input (other than a
+        np.datetime64) is parsed with `parse_date`.
+
+    param_name, calendar, raise_oob
+        As `parse_date`.
+
+    Returns
+    -------
+    int
+        Date as nanoseconds since epoch.
+
+    Raises
+    ------
+    Errors as `parse_date`.
+    """
+    nanos = _as_nanos(date)
+    if nanos is None:
+        return parse_date(date, param_name, calendar, raise_oob).value
+
+    if nanos % NANOSECONDS_PER_DAY:
+        raise ValueError(
+            f"Parameter `{param_name}` parsed as '{pd.Timestamp(nanos)}' although"
+            f" a Date must have a time component of 00:00."
+        )
+
+    if raise_oob:
+        if calendar is None:
+            raise ValueError("`calendar` must be passed if `raise_oob` is True.")
+        sessions_nanos = calendar.sessions_nanos
+        if nanos < sessions_nanos[0] or nanos > sessions_nanos[-1]:
+            raise errors.DateOutOfBounds(calendar, pd.Timestamp(nanos), param_name)
+
+    return nanos
+
+
+def parse_session_nanos(
+    calendar: ExchangeCalendar, session: Session, param_name: str = "session"
+) -> int:
+    """Parse input intended to represent a session label to nanoseconds.
+
+    Low-overhead equivalent of `parse_session`. Input passed as an
+    integer or np.datetime64 is parsed without creating any pandas
+    object.
+
+    Parameters
+    ----------
+    calendar, session, param_name
+        As `parse_session`. An integer `session` is interpreted as
+        nanoseconds since epoch.
+
+    Returns
+    -------
+    int
+        Session as nanoseconds since epoch.
+
+    Raises
+    ------
+    Errors as `parse_session`.
+    """
+    if _as_nanos(session) is None:
+        return parse_session(calendar, session, param_name).value
+    nanos = parse_date_nanos(session, param_name, raise_oob=False)
+    sessions_nanos = calendar.sessions_nanos
+    idx = sessions_nanos.searchsorted(nanos, side="left")
+    if idx == len(sessions_nanos) or sessions_nanos[idx] != nanos:
+        raise errors.NotSessionError(calendar, pd.Timestamp(nanos), param_name)
+    return nanos
+
+
+def _to_nanos_array(
+    timestamps: Dates | Minutes, param_name: str, utc: bool
+) -> tuple[np.ndarray, bool]:
+    """Convert input representing multiple timestamps to int64 nanoseconds.
+
+    Returns
+    -------
+    tuple[np.ndarray, bool]
+        [0] Timestamps as nanoseconds since epoch. If `utc` True then
+            any timezone aware input is converted to UTC, otherwise
+            nanoseconds represent wall-clock time.
+        [1] Boolean indicating if input was timezone aware.
+    """
+    if isinstance(timestamps, np.ndarray):
+        if timestamps.dtype.kind == "M":
+            return timestamps.astype("datetime64[ns]").view(np.int64), False
+        if timestamps.dtype == np.int64:
+            return timestamps, False
+    try:
+        dti = pd.DatetimeIndex(timestamps)
+    except Exception as e:
+        msg = (
+            f"Parameter `{param_name}` received as '{timestamps}' although"
+            " must be passed as a pd.DatetimeIndex or a valid single-argument"
+            " input to pd.DatetimeIndex."
+        )
+        if isinstance(e, TypeError):
+            raise TypeError(msg) from e
+        else:
+            raise ValueError(msg) from e
+    tz_aware = dti.tz is not None
+    if tz_aware:
+        dti = dti.tz_convert(UTC) if utc else dti.tz_localize(None)
+    return dti.values.astype("datetime64[ns]").view(np.int64), tz_aware
+
+
+def parse_timestamps(
+    timestamps: Minutes,
+    param_name: str = "minutes",
+    calendar: ExchangeCalendar | None = None,
+    raise_oob: bool = True,
+    side: Literal["left", "right", "both", "neither"] | None = None,
+) -> np.ndarray:
+    """Parse input intended to represent multiple minutes.
+
+    Array equivalent of `parse_timestamp`.
+
+    Parameters
+    ----------
+    timestamps
+        Input to be parsed as minutes. Can be any of:
+            pd.DatetimeIndex. If timezone naive then assumed as UTC.
+            numpy array of dtype datetime64 (any unit), assumed as UTC.
+            numpy array of dtype int64, assumed as nanoseconds since
+                epoch (UTC).
+            Any other valid single-argument input to pd.DatetimeIndex.
+
+    param_name
+        Name of a parameter that was to receive the minutes.
+
+    calendar
+        As `parse_timestamp`.
+
+    raise_oob : default: True
+        True to raise MinuteOutOfBounds if any of `timestamps` is earlier
+        than the first trading minute or later than the last trading
+        minute of `calendar`. If True then `calendar` must be passed.
+
+    side : optional, {None, 'left', 'right', 'both', 'neither'}
+        As `parse_timestamp`.
+
+    Returns
+    -------
+    np.ndarray
+        int64 array of minutes as nanoseconds since epoch (UTC).
+
+    Raises
+    ------
+    Errors as `parse_timestamp`. ValueError also raised if `timestamps`
+    includes NaT.
+    """
+    nanos, _ = _to_nanos_array(timestamps, param_name, utc=True)
+
+    if (nanos == NP_NAT).any():
+        raise ValueError(f"Parameter `{param_name}` cannot include NaT.")
+
+    remainders = nanos % NANOSECONDS_PER_MINUTE
+    if remainders.any():
+        if side is None and calendar is None:
+            raise ValueError(
+                "`side` or `calendar` must be passed if `timestamps` includes"
+                " a timestamp with a non-zero second (or more accurate) component."
+            )
+        side = side if side is not None else calendar.side
+        if side == "left":
+            nanos = nanos - remainders
+        elif side == "right":
+            nanos = nanos + np.where(
+                remainders == 0, 0, NANOSECONDS_PER_MINUTE - remainders
+            )
+        else:
+            ts = pd.Timestamp(nanos[remainders.nonzero()[0][0]], tz=UTC)
+            raise ValueError(
+                "`timestamps` cannot include a timestamp with a non-zero second"
+                f" (or more accurate) component for `side` '{side}'. First such"
+                f" timestamp parsed as '{ts}'."
+            )
+
+    if raise_oob and len(nanos):
+        if calendar is None:
+            raise ValueError("`calendar` must be passed if `raise_oob` is True.")
+        minute_index = calendar._minute_index
+        oob = (nanos < minute_index.first) | (nanos > minute_index.last)
+        if oob.any():
+            ts = pd.Timestamp(nanos[oob.nonzero()[0][0]], tz=UTC)
+            raise errors.MinuteOutOfBounds(calendar, ts, param_name)
+
+    return nanos
+
+
+def parse_dates(
+    dates: Dates,
+    param_name: str = "dates",
+    calendar: ExchangeCalendar | None = None,
+    raise_oob: bool = True,
+) -> np.ndarray:
+    """Parse input intended to represent multiple dates.
+
+    Array equivalent of `parse_date`.
+
+    Parameters
+    ----------
+    dates
+        Input to be parsed as dates. Can be any of:
+            pd.DatetimeIndex (timezone naive).
+            numpy array of dtype datetime64 (any unit).
+            numpy array of dtype int64, assumed as nanoseconds since
+                epoch.
+            Any other valid single-argument input to pd.DatetimeIndex.
+
+        All dates must have a time component of 00:00.
+
+    param_name
+        Name of a parameter that was to receive the dates.
+
+    calendar
+        ExchangeCalendar against which to evalute out-of-bounds dates.
+        Only requried if `raise_oob` True.
+
+    raise_oob : default: True
+        True to raise DateOutOfBounds if any of `dates` is earlier than
+        the first session or later than the last session of `calendar`.
+        If True then `calendar` must be passed.
+
+    Returns
+    -------
+    np.ndarray
+        int64 array of dates as nanoseconds since epoch.
+
+    Raises
+    ------
+    Errors as `parse_date`. ValueError also raised if `dates` includes
+    NaT.
+    """
+    nanos, tz_aware = _to_nanos_array(dates, param_name, utc=False)
+    if tz_aware:
+        raise ValueError(
+            f"Parameter `{param_name}` received with timezone defined although"
+            " Dates must be timezone naive."
+        )
+
+    if (nanos == NP_NAT).any():
+        raise ValueError(f"Parameter `{param_name}` cannot include NaT.")
+
+    not_dates = (nanos % NANOSECONDS_PER_DAY).nonzero()[0]
+    if len(not_dates):
+        ts = pd.Timestamp(nanos[not_dates[0]])
+        raise ValueError(
+            f"Parameter `{param_name}` includes '{ts}' although a Date must have"
+            " a time component of 00:00."
+        )
+
+    if raise_oob and len(nanos):
+        if calendar is None:
+            raise ValueError("`calendar` must be passed if `raise_oob` is True.")
+        sessions_nanos = calendar.sessions_nanos
+        oob = (nanos < sessions_nanos[0]) | (nanos > sessions_nanos[-1])
+        if oob.any():
+            ts = pd.Timestamp(nanos[oob.nonzero()[0][0]])
+            raise errors.DateOutOfBounds(calendar, ts, param_name)
+
+    return nanos
+
+
 class _TradingIndex:
     """Create a trading index.
 
@@ -467,6 +1040,8 @@ class _TradingIndex:
         self.force_break_close = False if ignore_breaks else force_break_close
         self.force_close = force_close
         self.curtail_overlaps = curtail_overlaps
+        self.ignore_breaks = ignore_breaks
+        self.align, self.align_pm = align, align_pm
 
         # parse `start_` and `end_`
         start_, self.start_as_time = parse_date_or_minute(start_, "start", calendar)
@@ -482,6 +1057,7 @@ class _TradingIndex:
         slice_start = calendar.sessions.searchsorted(start)
         slice_end = calendar.sessions.searchsorted(end, side="right")
         slce = slice(slice_start, slice_end)
+        self.slice_start = slice_start
 
         self.interval_nanos = period.value
         self.closes = calendar.closes_nanos[slce]
@@ -515,6 +1091,57 @@ class _TradingIndex:
             "force_break_close": self.force_break_close,
         }
 
+    @classmethod
+    def _from_bounds(
+        cls,
+        opens: np.ndarray,
+        closes: np.ndarray,
+        start_: pd.Timestamp,
+        start_as_time: bool,
+        end_: pd.Timestamp,
+        end_as_time: bool,
+        period: pd.Timedelta,
+        closed: Literal["left", "right", "both", "neither"],
+        force_close: bool,
+        curtail_overlaps: bool,
+    ) -> _TradingIndex:
+        """Create instance from bounds of sessions that do not have breaks.
+
+        Parameters
+        ----------
+        opens, closes
+            int64 arrays of nanoseconds describing the bounds of the
+            sessions to be covered by the trading index.
+
+        start_, end_
+            Start and end of trading index. Only used to curtail the
+            index if passed as a time.
+
+        start_as_time, end_as_time
+            Whether `start_` and `end_` represent times (True) or dates.
+
+        All other parameters as ExchangeCalendar.trading_index.
+        """
+        ti = object.__new__(cls)
+        ti.closed = closed
+        ti.force_close = force_close
+        ti.force_break_close = False
+        ti.curtail_overlaps = curtail_overlaps
+        ti.ignore_breaks = True
+        ti.has_break = False
+        ti.align = ti.align_pm = pd.Timedelta(1, "min")
+        ti.start_, ti.start_as_time = start_, start_as_time
+        ti.end_, ti.end_as_time = end_, end_as_time
+        ti.slice_start = 0
+        ti.interval_nanos = period.value
+        ti.opens, ti.closes = opens, closes
+        ti.defaults = {
+            "closed": closed,
+            "force_close": force_close,
+            "force_break_close": False,
+        }
+        return ti
+
     @property
     def closed_right(self) -> bool:
         return self.closed in ["right", "both"]
@@ -569,10 +1196,17 @@ class _TradingIndex:
         start_nanos: np.ndarray,
         end_nanos: np.ndarray,
         force_close: bool,
-    ) -> np.ndarray:
-        """Create nano array of indices for sessions of given bounds."""
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Create nano array of indices for sessions of given bounds.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            [0] Nano array of indices.
+            [1] Number of indices of each session.
+        """
         if start_nanos.size == 0:
-            return start_nanos
+            return start_nanos, np.zeros(0, dtype=np.int64)
 
         # evaluate number of indices for each session
         num_intervals = (end_nanos - start_nanos) / self.interval_nanos
@@ -591,25 +1225,37 @@ class _TradingIndex:
         elif self.closed == "neither":
             num_indices -= 1
 
-        # by session, evaluate a range of int such that indices of a session
-        # could be evaluted from [ session_open + (freq * i) for i in range ]
-        start = 0 if self.closed_left else 1
-        func = np.vectorize(lambda stop: np.arange(start, stop), otypes=[np.ndarray])
-        stop = num_indices if self.closed_left else num_indices + 1
-        ranges = np.concatenate(func(stop), axis=0, dtype=np.int64)
-
-        # evaluate index as nano array
-        base = start_nanos.repeat(num_indices)
-        index = base + ranges * self.interval_nanos
-
-        if force_close and not on_freq:
-            index = np.concatenate((index, end_nanos))
-            index.sort()
+        # indices of a session are [ session_open + (freq * i) for i in range ]
+        # where range starts from 0 if closed left, otherwise 1.
+        firsts = start_nanos if self.closed_left else start_nanos + self.interval_nanos
+        add_close = force_close and not on_freq
+        if not add_close:
+            index = concat_aranges(firsts, num_indices, self.interval_nanos)
+            return index, num_indices.clip(0)
+
+        # make space for the close at the end of each session's indices...
+        counts = num_indices + 1
+        index = concat_aranges(firsts, counts, self.interval_nanos)
+        # ...and put it there
+        index[np.cumsum(counts) - 1] = end_nanos
+        return index, counts
+
+    def _trading_index(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Create trading index as nano array.
 
-        return index
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            [0] Nano array of indices.
+            [1] Indices of sessions that together describe the index, as
+                `slice_start` plus position in the sessions covered by
+                this instance. The same session will be included twice if
+                the index includes the session's am and pm subsessions.
+            [2] Number of contiguous indices in [0] that relate to each
+                session in [1].
 
-    def _trading_index(self) -> np.ndarray:
-        """Create trading index as nano array.
+            Session index of each indice can be evaluated as
+            `np.repeat(rtrn[1], rtrn[2])`.
 
         Notes
         -----
@@ -629,30 +1275,62 @@ class _TradingIndex:
         """
         if self.has_break:
             # sessions with breaks
-            index_am = self._create_index_for_sessions(
+            index_am, counts_am = self._create_index_for_sessions(
                 self.opens[self.mask],
                 self.break_starts[self.mask],
                 self.force_break_close,
             )
 
-            index_pm = self._create_index_for_sessions(
+            index_pm, counts_pm = self._create_index_for_sessions(
                 self.break_ends[self.mask], self.closes[self.mask], self.force_close
             )
 
             # sessions without a break
-            index_day = self._create_index_for_sessions(
+            index_day, counts_day = self._create_index_for_sessions(
                 self.opens[~self.mask], self.closes[~self.mask], self.force_close
             )
 
             # put it all together
             index = np.concatenate((index_am, index_pm, index_day))
+            sessions_break = np.flatnonzero(self.mask)
+            sessions = np.concatenate(
+                (sessions_break, sessions_break, np.flatnonzero(~self.mask))
+            )
+            counts = np.concatenate((counts_am, counts_pm, counts_day))
 
         else:
-            index = self._create_index_for_sessions(
+            index, counts = self._create_index_for_sessions(
                 self.opens, self.closes, self.force_close
             )
+            sessions = np.arange(len(self.opens))
 
-        return index
+        return index, sessions + self.slice_start, counts
+
+    def _times_mask(self, left: np.ndarray, right: np.ndarray) -> np.ndarray | None:
+        """Mask to curtail nano arrays for `start_` and `end_` as times.
+
+        Parameters
+        ----------
+        left
+            Nano array of left side of indices.
+
+        right
+            Nano array of right side of indices (pass as `left` if index
+            does not represent intervals).
+
+        Returns
+        -------
+        np.ndarray | None
+            Boolean mask of indices to keep. None if `start_` and `end_`
+            were both received as dates.
+        """
+        bv: np.ndarray | None = None
+        if self.start_as_time:
+            bv = left >= self.start_.value
+        if self.end_as_time:
+            bv_end = right <= self.end_.value
+            bv = bv & bv_end if bv is not None else bv_end
+        return bv
 
     def curtail_for_times(
         self, index: pd.DatetimeIndex | pd.IntervalIndex
@@ -674,12 +1352,30 @@ class _TradingIndex:
     def trading_index(self) -> pd.DatetimeIndex:
         """Create trading index as a DatetimeIndex."""
         self.verify_non_overlapping()
-        index = self._trading_index()
+        index, _, _ = self._trading_index()
         if self.has_break:
             index.sort()
         index = pd.DatetimeIndex(index, tz=UTC)
         return self.curtail_for_times(index)
 
+    def trading_index_nanos(self) -> tuple[np.ndarray, np.ndarray]:
+        """Create trading index as nano array.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            [0] Nano array of indices.
+            [1] Index of the session to which each indice relates.
+        """
+        self.verify_non_overlapping()
+        index, sessions, counts = self._trading_index()
+        sessions = sessions.repeat(counts)
+        if self.has_break:
+            order = index.argsort(kind="stable")
+            index, sessions = index[order], sessions[order]
+        bv = self._times_mask(index, index)
+        return (index, sessions) if bv is None else (index[bv], sessions[bv])
+
     @contextlib.contextmanager
     def _override_defaults(self, **kwargs):
         for k, v in kwargs.items():
@@ -688,25 +1384,54 @@ class _TradingIndex:
         for k, v in self.defaults.items():
             setattr(self, k, v)
 
-    def trading_index_intervals(self) -> pd.IntervalIndex:
-        """Create trading index as a pd.IntervalIndex."""
+    def _trading_index_intervals(
+        self, next_left: int | None = None, sessions: bool = False
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+        """Create trading index intervals as nano arrays.
+
+        Parameters
+        ----------
+        next_left
+            Left side of the interval that will follow the last interval,
+            if any. Used to check for (or curtail) any overlap with an
+            interval that is not included to the index.
+
+        sessions
+            True to also evaluate the session to which each interval
+            relates.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray | None]
+            [0] left side of intervals.
+            [1] right side of intervals.
+            [2] index of session to which each interval relates, or None
+                if `sessions` False.
+        """
         with self._override_defaults(
             closed="left", force_close=False, force_break_close=False
         ):
-            left = self._trading_index()
+            left, sessions_, counts = self._trading_index()
+        sessions_idx = sessions_.repeat(counts) if sessions else None
 
         if not (self.force_close or self.force_break_close):
             if self.has_break:
-                left.sort()
+                if sessions:
+                    indices = left.argsort()
+                    left, sessions_idx = left[indices], sessions_idx[indices]
+                else:
+                    left.sort()
             right = left + self.interval_nanos
         else:
             with self._override_defaults(closed="right"):
-                right = self._trading_index()
+                right, _, _ = self._trading_index()
             if self.has_break:
                 # See _trading_index.__doc__ for note on what's going on here.
                 indices = left.argsort()
                 left.sort()
                 right = right[indices]
+                if sessions:
+                    sessions_idx = sessions_idx[indices]
 
         overlaps_next = right[:-1] > left[1:]
         if overlaps_next.any():
@@ -714,8 +1439,342 @@ class _TradingIndex:
                 right[:-1][overlaps_next] = left[1:][overlaps_next]
             else:
                 raise errors.IntervalsOverlapError()
+        if next_left is not None and right.size and right[-1] > next_left:
+            if self.curtail_overlaps:
+                right[-1] = next_left
+            else:
+                raise errors.IntervalsOverlapError()
+        return left, right, sessions_idx
+
+    def trading_index_intervals(self, next_left: int | None = None) -> pd.IntervalIndex:
+        """Create trading index as a pd.IntervalIndex.
 
+        Parameters
+        ----------
+        next_left
+            As `_trading_index_intervals`.
+        """
+        left, right, _ = self._trading_index_intervals(next_left)
         left = pd.DatetimeIndex(left, tz=UTC)
         right = pd.DatetimeIndex(right, tz=UTC)
         index = pd.IntervalIndex.from_arrays(left, right, self.closed)
         return self.curtail_for_times(index)
+
+    def trading_index_intervals_nanos(
+        self, next_left: int | None = None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Create trading index intervals as nano arrays.
+
+        Parameters
+        ----------
+        next_left
+            As `_trading_index_intervals`.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            [0] Nano array of left side of intervals.
+            [1] Nano array of right side of intervals.
+            [2] Index of the session to which each interval relates.
+        """
+        left, right, sessions = self._trading_index_intervals(next_left, True)
+        bv = self._times_mask(left, right)
+        if bv is None:
+            return left, right, sessions
+        return left[bv], right[bv], sessions[bv]
+
+    def _subset(self, slc: slice) -> _TradingIndex:
+        """Return copy of instance covering only a subset of sessions.
+
+        Parameters
+        ----------
+        slc
+            Slice of sessions, relative to the sessions covered by this
+            instance, to be covered by the returned instance. Slice start
+            must be defined and non-negative.
+        """
+        subset = copy.copy(self)
+        subset.slice_start = self.slice_start + slc.start
+        subset.opens, subset.closes = self.opens[slc], self.closes[slc]
+        if self.has_break:
+            subset.break_starts = self.break_starts[slc]
+            subset.break_ends = self.break_ends[slc]
+            subset.mask = self.mask[slc]
+            subset.has_break = subset.mask.any()
+        return subset
+
+    def iter_trading_index(
+        self, chunk_sessions: int, intervals: bool, as_nanos: bool = False
+    ) -> Iterator[pd.DatetimeIndex | pd.IntervalIndex | tuple[np.ndarray, ...]]:
+        """Iterate over trading index in chunks of sessions.
+
+        If not `intervals` then overlaps are verified over all sessions
+        before the iterator is returned. If `intervals` then any overlap of
+        the last interval of a chunk with the first interval of the next
+        chunk is curtailed (if `self.curtail_overlaps`) or raises
+        IntervalsOverlapError when the chunk is evaluated.
+
+        Parameters
+        ----------
+        chunk_sessions
+            Number of sessions to cover with each chunk.
+
+        intervals
+            True to yield chunks as pd.IntervalIndex, False to yield as
+            pd.DatetimeIndex.
+
+        as_nanos
+            True to yield chunks as returned by `trading_index_nanos`, if
+            not `intervals`, or `trading_index_intervals_nanos`, if
+            `intervals`.
+        """
+        if not intervals:
+            self.verify_non_overlapping()
+        num_sessions = len(self.opens)
+
+        def iterator():
+            for i in range(0, num_sessions, chunk_sessions):
+                stop = i + chunk_sessions
+                subset = self._subset(slice(i, stop))
+                if not intervals:
+                    if as_nanos:
+                        yield subset.trading_index_nanos()
+                    else:
+                        yield subset.trading_index()
+                else:
+                    # first interval of a chunk is always left of first open
+                    next_left = self.opens[stop] if stop < num_sessions else None
+                    if as_nanos:
+                        yield subset.trading_index_intervals_nanos(next_left)
+                    else:
+                        yield subset.trading_index_intervals(next_left)
+
+        return iterator()
+
+
+class TradingIndexCacheInfo(NamedTuple):
+    """Statistics of an ExchangeCalendar's trading index cache.
+
+    Attributes
+    ----------
+    hits
+        Number of requests served by a trading index already in the cache.
+
+    misses
+        Number of requests for a trading index that was not in the cache.
+
+    slices
+        Number of misses that were served by slicing a cached trading
+        index that covers a wider range of sessions (as opposed to
+        evaluating a new trading index).
+
+    evictions
+        Number of trading indexes evicted from the cache to accommodate
+        `maxbytes`.
+
+    maxbytes
+        Maximum number of bytes that the cached trading indexes can
+        together occupy.
+
+    currbytes
+        Number of bytes currently occupied by cached trading indexes.
+
+    currsize
+        Number of trading indexes currently in the cache.
+    """
+
+    hits: int
+    misses: int
+    slices: int
+    evictions: int
+    maxbytes: int
+    currbytes: int
+    currsize: int
+
+
+class _TradingIndexCacheEntry(NamedTuple):
+    """Trading index cached by `_TradingIndexCache`."""
+
+    index: pd.Index | tuple[np.ndarray, ...]
+    nbytes: int
+    first_session: int
+    # offsets[i] is position of first indice of session `first_session` + i.
+    # None if trading index cannot be sliced by session.
+    offsets: np.ndarray | None
+
+
+class _TradingIndexCache:
+    """Least-recently-used cache of trading indexes of a calendar.
+
+    Cache is bounded by the memory occupied by the cached trading indexes.
+    A request for a trading index that is not cached although which covers
+    a range of sessions covered by a cached trading index (evaluated with
+    the same options) is served by slicing the cached trading index.
+
+    Parameters
+    ----------
+    maxbytes
+        Maximum number of bytes that the cached trading indexes can
+        together occupy. A trading index that would alone exceed
+        `maxbytes` is not cached.
+    """
+
+    def __init__(self, maxbytes: int):
+        if maxbytes < 0:
+            raise ValueError(f"`maxbytes` cannot be negative, received {maxbytes}.")
+        self.maxbytes = maxbytes
+        self._cache: OrderedDict[tuple, _TradingIndexCacheEntry] = OrderedDict()
+        self._lock = threading.RLock()
+        self._currbytes = 0
+        self._hits = self._misses = self._slices = self._evictions = 0
+
+    def info(self) -> TradingIndexCacheInfo:
+        """Return statistics of the cache."""
+        with self._lock:
+            return TradingIndexCacheInfo(
+                self._hits,
+                self._misses,
+                self._slices,
+                self._evictions,
+                self.maxbytes,
+                self._currbytes,
+                len(self._cache),
+            )
+
+    def clear(self):
+        """Clear the cache and its statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._currbytes = 0
+            self._hits = self._misses = self._slices = self._evictions = 0
+
+    @staticmethod
+    def _options(ti: _TradingIndex, intervals: bool, as_nanos: bool) -> tuple:
+        """Options that define a trading index, other than its range."""
+        return (
+            ti.interval_nanos,
+            intervals,
+            ti.closed,
+            ti.force_close,
+            ti.force_break_close,
+            ti.curtail_overlaps,
+            ti.ignore_breaks,
+            ti.align,
+            ti.align_pm,
+            as_nanos,
+        )
+
+    @staticmethod
+    def _can_slice(ti: _TradingIndex, intervals: bool) -> bool:
+        """Query if trading index can be evaluated by slicing a superset.
+
+        Cannot slice if start or end are times. Also cannot slice if the
+        right side of a session's last interval could have been curtailed
+        to the open of a following session, which would not be the case
+        if the following session were not included.
+        """
+        if ti.start_as_time or ti.end_as_time:
+            return False
+        return not (intervals and ti.curtail_overlaps and not ti.force_close)
+
+    @staticmethod
+    def _slice(
+        index: pd.Index | tuple[np.ndarray, ...], slc: slice
+    ) -> pd.Index | tuple[np.ndarray, ...]:
+        if isinstance(index, tuple):
+            return tuple(array[slc] for array in index)
+        return index[slc]
+
+    def _get(
+        self, ti: _TradingIndex, intervals: bool, as_nanos: bool
+    ) -> pd.Index | tuple[np.ndarray, ...] | None:
+        """Get trading index from cache, or None if not available."""
+        options = self._options(ti, intervals, as_nanos)
+        key = (options, ti.start_, ti.end_)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._hits += 1
+                self._cache.move_to_end(key)
+                return entry.index
+            self._misses += 1
+            if not self._can_slice(ti, intervals):
+                return None
+            first, stop = ti.slice_start, ti.slice_start + len(ti.opens)
+            for (options_, _, _), entry in reversed(self._cache.items()):
+                if options_ != options or entry.offsets is None:
+                    continue
+                entry_stop = entry.first_session + len(entry.offsets) - 1
+                if entry.first_session <= first and stop <= entry_stop:
+                    start_offset = entry.offsets[first - entry.first_session]
+                    stop_offset = entry.offsets[stop - entry.first_session]
+                    self._slices += 1
+                    return self._slice(entry.index, slice(start_offset, stop_offset))
+            return None
+
+    def _put(self, key: tuple, entry: _TradingIndexCacheEntry):
+        """Add an entry to the cache, evicting entries to make space."""
+        if entry.nbytes > self.maxbytes:
+            return
+        with self._lock:
+            if key in self._cache:
+                return
+            self._cache[key] = entry
+            self._currbytes += entry.nbytes
+            while self._currbytes > self.maxbytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._currbytes -= evicted.nbytes
+                self._evictions += 1
+
+    def trading_index(
+        self, ti: _TradingIndex, intervals: bool, as_nanos: bool
+    ) -> pd.DatetimeIndex | pd.IntervalIndex | tuple[np.ndarray, ...]:
+        """Get trading index, from cache if available.
+
+        Parameters
+        ----------
+        ti
+            Instance of _TradingIndex describing the trading index.
+
+        intervals
+            As `ExchangeCalendar.trading_index`.
+
+        as_nanos
+            As `ExchangeCalendar.trading_index`. Any returned arrays are
+            read-only.
+        """
+        index = self._get(ti, intervals, as_nanos)
+        if index is not None:
+            return index
+
+        if intervals:
+            arrays = ti.trading_index_intervals_nanos()
+        else:
+            arrays = ti.trading_index_nanos()
+        for array in arrays:
+            array.flags.writeable = False
+        sessions = arrays[-1]
+
+        if as_nanos:
+            index = arrays
+        elif intervals:
+            left = pd.DatetimeIndex(arrays[0], tz=UTC)
+            right = pd.DatetimeIndex(arrays[1], tz=UTC)
+            index = pd.IntervalIndex.from_arrays(left, right, ti.closed)
+        else:
+            index = pd.DatetimeIndex(arrays[0], tz=UTC)
+
+        offsets = None
+        if self._can_slice(ti, intervals) and (np.diff(sessions) >= 0).all():
+            first, stop = ti.slice_start, ti.slice_start + len(ti.opens)
+            offsets = sessions.searchsorted(np.arange(first, stop + 1))
+
+        nbytes = sum(array.nbytes for array in arrays[:-1])
+        if as_nanos:
+            nbytes += sessions.nbytes
+        if offsets is not None:
+            nbytes += offsets.nbytes
+        entry = _TradingIndexCacheEntry(index, nbytes, ti.slice_start, offsets)
+        options = self._options(ti, intervals, as_nanos)
+        self._put((options, ti.start_, ti.end_), entry)
+        return index
@@ -1,132 +1,117 @@
 from __future__ import annotations
 
-from typing import Literal
+import collections
+import contextlib
+import importlib
+import threading
+from typing import Any, Literal, NamedTuple
+
+import pandas as pd
 
 from .calendar_helpers import parse_date, Date
-from .always_open import AlwaysOpenCalendar
 from .errors import CalendarNameCollision, CyclicCalendarAlias, InvalidCalendarName
 from .exchange_calendar import ExchangeCalendar
-from .exchange_calendar_aixk import AIXKExchangeCalendar
-from .exchange_calendar_asex import ASEXExchangeCalendar
-from .exchange_calendar_bvmf import BVMFExchangeCalendar
-from .exchange_calendar_cmes import CMESExchangeCalendar
-from .exchange_calendar_iepa import IEPAExchangeCalendar
-from .exchange_calendar_xams import XAMSExchangeCalendar
-from .exchange_calendar_xasx import XASXExchangeCalendar
-from .exchange_calendar_xbkk import XBKKExchangeCalendar
-from .exchange_calendar_xbog import XBOGExchangeCalendar
-from .exchange_calendar_xbom import XBOMExchangeCalendar
-from .exchange_calendar_xbru import XBRUExchangeCalendar
-from .exchange_calendar_xbse import XBSEExchangeCalendar
-from .exchange_calendar_xbud import XBUDExchangeCalendar
-from .exchange_calendar_xbue import XBUEExchangeCalendar
-from .exchange_calendar_xcbf import XCBFExchangeCalendar
-from .exchange_calendar_xcse import XCSEExchangeCalendar
-from .exchange_calendar_xdub import XDUBExchangeCalendar
-from .exchange_calendar_xdus import XDUSExchangeCalendar
-from .exchange_calendar_xeee import XEEEExchangeCalendar
-from .exchange_calendar_xetr import XETRExchangeCalendar
-from .exchange_calendar_xfra import XFRAExchangeCalendar
-from .exchange_calendar_xham import XHAMExchangeCalendar
-from .exchange_calendar_xhel import XHELExchangeCalendar
-from .exchange_calendar_xhkg import XHKGExchangeCalendar
-from .exchange_calendar_xice import XICEExchangeCalendar
-from .exchange_calendar_xidx import XIDXExchangeCalendar
-from .exchange_calendar_xist import XISTExchangeCalendar
-from .exchange_calendar_xjse import XJSEExchangeCalendar
-from .exchange_calendar_xkar import XKARExchangeCalendar
-from .exchange_calendar_xkls import XKLSExchangeCalendar
-from .exchange_calendar_xkrx import XKRXExchangeCalendar
-from .exchange_calendar_xlim import XLIMExchangeCalendar
-from .exchange_calendar_xlis import XLISExchangeCalendar
-from .exchange_calendar_xlon import XLONExchangeCalendar
-from .exchange_calendar_xmad import XMADExchangeCalendar
-from .exchange_calendar_xmex import XMEXExchangeCalendar
-from .exchange_calendar_xmil import XMILExchangeCalendar
-from .exchange_calendar_xmos import XMOSExchangeCalendar
-from .exchange_calendar_xnys import XNYSExchangeCalendar
-from .exchange_calendar_xnze import XNZEExchangeCalendar
-from .exchange_calendar_xosl import XOSLExchangeCalendar
-from .exchange_calendar_xpar import XPARExchangeCalendar
-from .exchange_calendar_xphs import XPHSExchangeCalendar
-from .exchange_calendar_xpra import XPRAExchangeCalendar
-from .exchange_calendar_xsau import XSAUExchangeCalendar
-from .exchange_calendar_xses import XSESExchangeCalendar
-from .exchange_calendar_xsgo import XSGOExchangeCalendar
-from .exchange_calendar_xshg import XSHGExchangeCalendar
-from .exchange_calendar_xsto import XSTOExchangeCalendar
-from .exchange_calendar_xswx import XSWXExchangeCalendar
-from .exchange_calendar_xtae import XTAEExchangeCalendar
-from .exchange_calendar_xtai import XTAIExchangeCalendar
-from .exchange_calendar_xtks import XTKSExchangeCalendar
-from .exchange_calendar_xtse import XTSEExchangeCalendar
-from .exchange_calendar_xwar import XWARExchangeCalendar
-from .exchange_calendar_xwbo import XWBOExchangeCalendar
-from .us_futures_calendar import QuantopianUSFuturesCalendar
-from .weekday_calendar import WeekdayCalendar
+
+
+class _LazyCalendarFactory:
+    """Reference to a calendar class that is imported when first required.
+
+    Calling the reference, or getting any attribute of the calendar class
+    via the reference, will import the calendar class.
+
+    Parameters
+    ----------
+    module
+        Name of module, relative to the exchange_calendars package, in
+        which calendar class is defined.
+
+    name
+        Name of calendar class.
+    """
+
+    def __init__(self, module: str, name: str):
+        self.module = module
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.module!r}, {self.name!r})"
+
+    def resolve(self) -> type[ExchangeCalendar]:
+        """Import and return the referenced calendar class."""
+        module = importlib.import_module(f".{self.module}", __package__)
+        return getattr(module, self.name)
+
+    def __call__(self, *args, **kwargs) -> ExchangeCalendar:
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.resolve(), attr)
+
 
 _default_calendar_factories = {
     # Exchange calendars.
-    "AIXK": AIXKExchangeCalendar,
-    "ASEX": ASEXExchangeCalendar,
-    "BVMF": BVMFExchangeCalendar,
-    "CMES": CMESExchangeCalendar,
-    "IEPA": IEPAExchangeCalendar,
-    "XAMS": XAMSExchangeCalendar,
-    "XASX": XASXExchangeCalendar,
-    "XBKK": XBKKExchangeCalendar,
-    "XBOG": XBOGExchangeCalendar,
-    "XBOM": XBOMExchangeCalendar,
-    "XBRU": XBRUExchangeCalendar,
-    "XBSE": XBSEExchangeCalendar,
-    "XBUD": XBUDExchangeCalendar,
-    "XBUE": XBUEExchangeCalendar,
-    "XCBF": XCBFExchangeCalendar,
-    "XCSE": XCSEExchangeCalendar,
-    "XDUB": XDUBExchangeCalendar,
-    "XDUS": XDUSExchangeCalendar,
-    "XEEE": XEEEExchangeCalendar,
-    "XFRA": XFRAExchangeCalendar,
-    "XETR": XETRExchangeCalendar,
-    "XHAM": XHAMExchangeCalendar,
-    "XHEL": XHELExchangeCalendar,
-    "XHKG": XHKGExchangeCalendar,
-    "XICE": XICEExchangeCalendar,
-    "XIDX": XIDXExchangeCalendar,
-    "XIST": XISTExchangeCalendar,
-    "XJSE": XJSEExchangeCalendar,
-    "XKAR": XKARExchangeCalendar,
-    "XKLS": XKLSExchangeCalendar,
-    "XKRX": XKRXExchangeCalendar,
-    "XLIM": XLIMExchangeCalendar,
-    "XLIS": XLISExchangeCalendar,
-    "XLON": XLONExchangeCalendar,
-    "XMAD": XMADExchangeCalendar,
-    "XMEX": XMEXExchangeCalendar,
-    "XMIL": XMILExchangeCalendar,
-    "XMOS": XMOSExchangeCalendar,
-    "XNYS": XNYSExchangeCalendar,
-    "XNZE": XNZEExchangeCalendar,
-    "XOSL": XOSLExchangeCalendar,
-    "XPAR": XPARExchangeCalendar,
-    "XPHS": XPHSExchangeCalendar,
-    "XPRA": XPRAExchangeCalendar,
-    "XSAU": XSAUExchangeCalendar,
-    "XSES": XSESExchangeCalendar,
-    "XSGO": XSGOExchangeCalendar,
-    "XSHG": XSHGExchangeCalendar,
-    "XSTO": XSTOExchangeCalendar,
-    "XSWX": XSWXExchangeCalendar,
-    "XTAE": XTAEExchangeCalendar,
-    "XTAI": XTAIExchangeCalendar,
-    "XTKS": XTKSExchangeCalendar,
-    "XTSE": XTSEExchangeCalendar,
-    "XWAR": XWARExchangeCalendar,
-    "XWBO": XWBOExchangeCalendar,
+    "AIXK": _LazyCalendarFactory("exchange_calendar_aixk", "AIXKExchangeCalendar"),
+    "ASEX": _LazyCalendarFactory("exchange_calendar_asex", "ASEXExchangeCalendar"),
+    "BVMF": _LazyCalendarFactory("exchange_calendar_bvmf", "BVMFExchangeCalendar"),
+    "CMES": _LazyCalendarFactory("exchange_calendar_cmes", "CMESExchangeCalendar"),
+    "IEPA": _LazyCalendarFactory("exchange_calendar_iepa", "IEPAExchangeCalendar"),
+    "XAMS": _LazyCalendarFactory("exchange_calendar_xams", "XAMSExchangeCalendar"),
+    "XASX": _LazyCalendarFactory("exchange_calendar_xasx", "XASXExchangeCalendar"),
+    "XBKK": _LazyCalendarFactory("exchange_calendar_xbkk", "XBKKExchangeCalendar"),
+    "XBOG": _LazyCalendarFactory("exchange_calendar_xbog", "XBOGExchangeCalendar"),
+    "XBOM": _LazyCalendarFactory("exchange_calendar_xbom", "XBOMExchangeCalendar"),
+    "XBRU": _LazyCalendarFactory("exchange_calendar_xbru", "XBRUExchangeCalendar"),
+    "XBSE": _LazyCalendarFactory("exchange_calendar_xbse", "XBSEExchangeCalendar"),
+    "XBUD": _LazyCalendarFactory("exchange_calendar_xbud", "XBUDExchangeCalendar"),
+    "XBUE": _LazyCalendarFactory("exchange_calendar_xbue", "XBUEExchangeCalendar"),
+    "XCBF": _LazyCalendarFactory("exchange_calendar_xcbf", "XCBFExchangeCalendar"),
+    "XCSE": _LazyCalendarFactory("exchange_calendar_xcse", "XCSEExchangeCalendar"),
+    "XDUB": _LazyCalendarFactory("exchange_calendar_xdub", "XDUBExchangeCalendar"),
+    "XDUS": _LazyCalendarFactory("exchange_calendar_xdus", "XDUSExchangeCalendar"),
+    "XEEE": _LazyCalendarFactory("exchange_calendar_xeee", "XEEEExchangeCalendar"),
+    "XFRA": _LazyCalendarFactory("exchange_calendar_xfra", "XFRAExchangeCalendar"),
+    "XETR": _LazyCalendarFactory("exchange_calendar_xetr", "XETRExchangeCalendar"),
+    "XHAM": _LazyCalendarFactory("exchange_calendar_xham", "XHAMExchangeCalendar"),
+    "XHEL": _LazyCalendarFactory("exchange_calendar_xhel", "XHELExchangeCalendar"),
+    "XHKG": _LazyCalendarFactory("exchange_calendar_xhkg", "XHKGExchangeCalendar"),
+    "XICE": _LazyCalendarFactory("exchange_calendar_xice", "XICEExchangeCalendar"),
+    "XIDX": _LazyCalendarFactory("exchange_calendar_xidx", "XIDXExchangeCalendar"),
+    "XIST": _LazyCalendarFactory("exchange_calendar_xist", "XISTExchangeCalendar"),
+    "XJSE": _LazyCalendarFactory("exchange_calendar_xjse", "XJSEExchangeCalendar"),
+    "XKAR": _LazyCalendarFactory("exchange_calendar_xkar", "XKARExchangeCalendar"),
+    "XKLS": _LazyCalendarFactory("exchange_calendar_xkls", "XKLSExchangeCalendar"),
+    "XKRX": _LazyCalendarFactory("exchange_calendar_xkrx", "XKRXExchangeCalendar"),
+    "XLIM": _LazyCalendarFactory("exchange_calendar_xlim", "XLIMExchangeCalendar"),
+    "XLIS": _LazyCalendarFactory("exchange_calendar_xlis", "XLISExchangeCalendar"),
+    "XLON": _LazyCalendarFactory("exchange_calendar_xlon", "XLONExchangeCalendar"),
+    "XMAD": _LazyCalendarFactory("exchange_calendar_xmad", "XMADExchangeCalendar"),
+    "XMEX": _LazyCalendarFactory("exchange_calendar_xmex", "XMEXExchangeCalendar"),
+    "XMIL": _LazyCalendarFactory("exchange_calendar_xmil", "XMILExchangeCalendar"),
+    "XMOS": _LazyCalendarFactory("exchange_calendar_xmos", "XMOSExchangeCalendar"),
+    "XNYS": _LazyCalendarFactory("exchange_calendar_xnys", "XNYSExchangeCalendar"),
+    "XNZE": _LazyCalendarFactory("exchange_calendar_xnze", "XNZEExchangeCalendar"),
+    "XOSL": _LazyCalendarFactory("exchange_calendar_xosl", "XOSLExchangeCalendar"),
+    "XPAR": _LazyCalendarFactory("exchange_calendar_xpar", "XPARExchangeCalendar"),
+    "XPHS": _LazyCalendarFactory("exchange_calendar_xphs", "XPHSExchangeCalendar"),
+    "XPRA": _LazyCalendarFactory("exchange_calendar_xpra", "XPRAExchangeCalendar"),
+    "XSAU": _LazyCalendarFactory("exchange_calendar_xsau", "XSAUExchangeCalendar"),
+    "XSES": _LazyCalendarFactory("exchange_calendar_xses", "XSESExchangeCalendar"),
+    "XSGO": _LazyCalendarFactory("exchange_calendar_xsgo", "XSGOExchangeCalendar"),
+    "XSHG": _LazyCalendarFactory("exchange_calendar_xshg", "XSHGExchangeCalendar"),
+    "XSTO": _LazyCalendarFactory("exchange_calendar_xsto", "XSTOExchangeCalendar"),
+    "XSWX": _LazyCalendarFactory("exchange_calendar_xswx", "XSWXExchangeCalendar"),
+    "XTAE": _LazyCalendarFactory("exchange_calendar_xtae", "XTAEExchangeCalendar"),
+    "XTAI": _LazyCalendarFactory("exchange_calendar_xtai", "XTAIExchangeCalendar"),
+    "XTKS": _LazyCalendarFactory("exchange_calendar_xtks", "XTKSExchangeCalendar"),
+    "XTSE": _LazyCalendarFactory("exchange_calendar_xtse", "XTSEExchangeCalendar"),
+    "XWAR": _LazyCalendarFactory("exchange_calendar_xwar", "XWARExchangeCalendar"),
+    "XWBO": _LazyCalendarFactory("exchange_calendar_xwbo", "XWBOExchangeCalendar"),
     # Miscellaneous calendars.
-    "us_futures": QuantopianUSFuturesCalendar,
-    "24/7": AlwaysOpenCalendar,
-    "24/5": WeekdayCalendar,
+    "us_futures": _LazyCalendarFactory(
+        "us_futures_calendar", "QuantopianUSFuturesCalendar"
+    ),
+    "24/7": _LazyCalendarFactory("always_open", "AlwaysOpenCalendar"),
+    "24/5": _LazyCalendarFactory("weekday_calendar", "WeekdayCalendar"),
 }
 _default_calendar_aliases = {
     "NYSE": "XNYS",
@@ -159,6 +144,54 @@ _default_calendar_aliases = {
 
 default_calendar_names = sorted(_default_calendar_factories.keys())
 
+_lazy_calendar_classes = {
+    factory.name: factory for factory in _default_calendar_factories.values()
+}
+
+
+def __getattr__(name: str) -> Any:
+    # calendar classes are imported from their modules only when requested
+    try:
+        factory = _lazy_calendar_classes[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return factory.resolve()
+
+
+class CalendarCacheInfo(NamedTuple):
+    """Statistics of an ExchangeCalendarDispatcher's calendar cache.
+
+    Attributes
+    ----------
+    hits
+        Number of requests served by a calendar already in the cache.
+
+    misses
+        Number of requests for a calendar that was not in the cache.
+
+    slices
+        Number of misses that were served by slicing a cached calendar
+        that covers a wider date range (as opposed to fabricating a new
+        calendar).
+
+    evictions
+        Number of calendars evicted from the cache to accommodate
+        `maxsize`.
+
+    maxsize
+        Maximum number of calendars that the cache can hold.
+
+    currsize
+        Number of calendars currently in the cache.
+    """
+
+    hits: int
+    misses: int
+    slices: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
 
 class ExchangeCalendarDispatcher(object):
     """
@@ -172,41 +205,203 @@ class ExchangeCalendarDispatcher(object):
     calendars : dict[str -> ExchangeCalendar]
         Initial set of calendars.
     calendar_factories : dict[str -> function]
-        Factories for lazy calendar creation.
+        Factories for lazy calendar creation. A factory can be defined as
+        a lazy reference to a calendar class, in which case the class will
+        not be imported until a calendar is first requested.
     aliases : dict[str -> str]
         Calendar name aliases.
+    maxsize : int, default: 16
+        Maximum number of calendars fabricated by calendar factories to
+        hold in the cache. When the cache is full the least recently
+        requested calendar is evicted.
+
+    Notes
+    -----
+    Calendars fabricated by calendar factories are cached against the
+    calendar name and the arguments with which the calendar was requested.
+    A request for a calendar that is not in the cache although lies within
+    the date range of a cached calendar with the same name and `side` is
+    served by slicing the cached calendar (i.e. without re-evaluating the
+    calendar's schedule).
+
+    A cached calendar is shared by all clients that request it. A cached
+    calendar that has been modified in place (for example by
+    `ExchangeCalendar.add_holidays` or `ExchangeCalendar.extend`) is
+    evicted from the cache when next requested or considered for slicing,
+    such that the modifications are not passed on to subsequent requests.
+
+    The dispatcher is thread-safe. Concurrent requests for the same
+    calendar result in the calendar being fabricated only once.
     """
 
-    def __init__(self, calendars, calendar_factories, aliases):
+    def __init__(self, calendars, calendar_factories, aliases, maxsize: int = 16):
         self._calendars = calendars
         self._calendar_factories = dict(calendar_factories)
         self._aliases = dict(aliases)
-        # key: factory name, value: (calendar, dict of calendar kwargs)
-        self._factory_output_cache: dict(str, tuple(ExchangeCalendar, dict)) = {}
-
-    def _fabricate(self, name: str, **kwargs) -> ExchangeCalendar:
-        """Fabricate calendar with `name` and `**kwargs`."""
+        self._maxsize = maxsize
+        # key: (factory name, start, end, side) as requested, value:
+        # (calendar, start, end, modification count) where start and end
+        # define the range over which the calendar's schedule is defined, or
+        # None if not known, and modification count is the calendar's
+        # modification count when cached.
+        self._factory_output_cache: collections.OrderedDict[
+            tuple,
+            tuple[ExchangeCalendar, pd.Timestamp | None, pd.Timestamp | None, int],
+        ] = collections.OrderedDict()
+        # key: as `_factory_output_cache`, value: [lock, number of users]
+        self._construction_locks: dict[tuple, list] = {}
+        self._lock = threading.RLock()
+        self._hits = self._misses = self._slices = self._evictions = 0
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of calendars to hold in the cache."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int):
+        with self._lock:
+            self._maxsize = value
+            self._evict()
+
+    def cache_info(self) -> CalendarCacheInfo:
+        """Return statistics of the calendar cache."""
+        with self._lock:
+            return CalendarCacheInfo(
+                self._hits,
+                self._misses,
+                self._slices,
+                self._evictions,
+                self._maxsize,
+                len(self._factory_output_cache),
+            )
+
+    def cache_clear(self):
+        """Clear the calendar cache and its statistics."""
+        with self._lock:
+            self._factory_output_cache.clear()
+            self._hits = self._misses = self._slices = self._evictions = 0
+
+    def _evict(self):
+        """Evict least recently used calendars to accommodate maxsize."""
+        while len(self._factory_output_cache) > max(self._maxsize, 0):
+            self._factory_output_cache.popitem(last=False)
+            self._evictions += 1
+
+    def _purge(self, name: str):
+        """Remove all cached calendars fabricated for `name`."""
+        with self._lock:
+            for key in [k for k in self._factory_output_cache if k[0] == name]:
+                del self._factory_output_cache[key]
+
+    @staticmethod
+    def _is_modified(entry: tuple) -> bool:
+        """Query if a cached calendar has been modified since cached."""
+        calendar, _, _, count = entry
+        return getattr(calendar, "_modification_count", 0) != count
+
+    @contextlib.contextmanager
+    def _construction_lock(self, key: tuple):
+        """Hold lock for constructing the calendar corresponding to `key`."""
+        with self._lock:
+            entry = self._construction_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._construction_locks[key]
+
+    def _get_factory(self, name: str) -> Any:
+        """Get calendar factory registered with `name`.
+
+        A lazy reference to a calendar class is resolved to the class.
+        """
         try:
             factory = self._calendar_factories[name]
         except KeyError as e:
             raise InvalidCalendarName(calendar_name=name) from e
-        calendar = factory(**kwargs)
-        self._factory_output_cache[name] = (calendar, kwargs)
-        return calendar
+        if isinstance(factory, _LazyCalendarFactory):
+            factory = factory.resolve()
+            self._calendar_factories[name] = factory
+        return factory
 
-    def _get_cached_factory_output(
-        self, name: str, **kwargs
-    ) -> ExchangeCalendar | None:
+    def _get_range(
+        self, name: str, start: pd.Timestamp | None, end: pd.Timestamp | None
+    ) -> tuple[pd.Timestamp, pd.Timestamp] | None:
+        """Get range over which a fabricated calendar would be defined.
+
+        Returns None if range cannot be ascertained from the factory.
+        """
+        factory = self._get_factory(name)
+        if not (isinstance(factory, type) and issubclass(factory, ExchangeCalendar)):
+            return None
+        start = factory.default_start() if start is None else start
+        end = factory.default_end() if end is None else end
+        return start, end
+
+    def _get_cached_factory_output(self, key: tuple) -> ExchangeCalendar | None:
         """Get calendar from factory output cache.
 
-        Return None if `name` not in cache or `name` in cache although
-        calendar got with kwargs other than `**kwargs`.
+        Return None if no calendar cached against `key`.
         """
-        calendar, calendar_kwargs = self._factory_output_cache.get(name, (None, None))
-        if calendar is not None and calendar_kwargs == kwargs:
-            return calendar
-        else:
+        with self._lock:
+            entry = self._factory_output_cache.get(key)
+            if entry is None:
+                return None
+            if self._is_modified(entry):
+                del self._factory_output_cache[key]
+                return None
+            self._factory_output_cache.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def _slice_cached_factory_output(
+        self, key: tuple, start: pd.Timestamp, end: pd.Timestamp
+    ) -> ExchangeCalendar | None:
+        """Get calendar by slicing a cached calendar over a wider range.
+
+        Returns None if no cached calendar covers the range `start`
+        through `end` for the calendar name and side of `key`.
+        """
+        name, _, _, side = key
+        with self._lock:
+            for key_ in [
+                k
+                for k, entry in self._factory_output_cache.items()
+                if self._is_modified(entry)
+            ]:
+                del self._factory_output_cache[key_]
+            for (name_, _, _, side_), entry in reversed(
+                self._factory_output_cache.items()
+            ):
+                calendar, start_, end_, _ = entry
+                if (
+                    name_ == name
+                    and side_ == side
+                    and start_ is not None
+                    and start_ <= start
+                    and end <= end_
+                ):
+                    break
+            else:
+                return None
+        # range lies within cached calendar's range, hence can clip to its sessions
+        start = max(start, calendar.first_session)
+        end = min(end, calendar.last_session)
+        if start > end:
+            # leave to calendar factory to raise NoSessionsError
             return None
+        with self._lock:
+            self._slices += 1
+        return calendar.slice(start, end)
+
+    def _fabricate(self, name: str, **kwargs) -> ExchangeCalendar:
+        """Fabricate calendar with `name` and `**kwargs`."""
+        return self._get_factory(name)(**kwargs)
 
     def get_calendar(
         self,
@@ -255,7 +450,9 @@ class ExchangeCalendarDispatcher(object):
         Returns
         -------
         ExchangeCalendar
-            Requested calendar.
+            Requested calendar. A calendar fabricated by a calendar factory
+            is cached and shared with any other client requesting the same
+            calendar. See Notes section of class documentation.
 
         Raises
         ------
@@ -296,8 +493,32 @@ class ExchangeCalendarDispatcher(object):
         else:
             kwargs["end"] = None
 
-        cached = self._get_cached_factory_output(name, **kwargs)
-        return cached if cached is not None else self._fabricate(name, **kwargs)
+        key = (name, kwargs["start"], kwargs["end"], kwargs.get("side"))
+        calendar = self._get_cached_factory_output(key)
+        if calendar is not None:
+            return calendar
+
+        with self._construction_lock(key):
+            # calendar may have been cached whilst waiting for lock
+            calendar = self._get_cached_factory_output(key)
+            if calendar is not None:
+                return calendar
+            with self._lock:
+                self._misses += 1
+
+            range_ = self._get_range(name, kwargs["start"], kwargs["end"])
+            if range_ is not None and range_[0] < range_[1]:
+                calendar = self._slice_cached_factory_output(key, *range_)
+            if calendar is None:
+                calendar = self._fabricate(name, **kwargs)
+
+            with self._lock:
+                if range_ is None:
+                    range_ = (None, None)
+                count = getattr(calendar, "_modification_count", 0)
+                self._factory_output_cache[key] = (calendar, *range_, count)
+                self._evict()
+        return calendar
 
     def get_calendar_names(
         self, include_aliases: bool = True, sort: bool = True
@@ -529,6 +750,7 @@ class ExchangeCalendarDispatcher(object):
         self._calendars.pop(name, None)
         self._calendar_factories.pop(name, None)
         self._aliases.pop(name, None)
+        self._purge(name)
 
     def clear_calendars(self):
         """
@@ -537,6 +759,7 @@ class ExchangeCalendarDispatcher(object):
         self._calendars.clear()
         self._calendar_factories.clear()
         self._aliases.clear()
+        self.cache_clear()
 
 
 # We maintain a global calendar dispatcher so that users can just do
@@ -558,3 +781,5 @@ register_calendar_alias = global_calendar_dispatcher.register_calendar_alias
 resolve_alias = global_calendar_dispatcher.resolve_alias
 aliases_to_names = global_calendar_dispatcher.aliases_to_names
 names_to_aliases = global_calendar_dispatcher.names_to_aliases
+calendar_cache_info = global_calendar_dispatcher.cache_info
+clear_calendar_cache = global_calendar_dispatcher.cache_clear
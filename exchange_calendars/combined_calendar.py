@@ -0,0 +1,648 @@
+"""Query the schedules of multiple exchange calendars together.
+
+A `CombinedCalendar` describes the periods during which any (union) or all
+(intersection) of a number of exchange calendars are open. Combined open
+periods are evaluated by merging the calendars' boundary arrays (opens,
+closes and any breaks), such that the calendar can be queried without
+evaluating any calendar's trading minutes.
+
+`open_status` queries the open status of each of a number of calendars at
+each of a number of timestamps.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+import functools
+from typing import Literal, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from . import errors
+from .calendar_helpers import (
+    NP_NAT,
+    UTC,
+    Date,
+    Minute,
+    Minutes,
+    _to_nanos_array,
+    _TradingIndex,
+    is_date,
+    parse_timestamp,
+    parse_timestamp_nanos,
+    parse_timestamps,
+    to_utc,
+)
+from .exchange_calendar import ExchangeCalendar
+
+
+def _subsessions(
+    calendar: ExchangeCalendar, first_session: int, last_session: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get bounds of a calendar's (sub)sessions over a range of sessions.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        int64 arrays of nanoseconds, in no particular order:
+            [0] open of each (sub)session.
+            [1] close of each (sub)session.
+            [2] session of each (sub)session.
+        Sessions with a break are represented by an am and pm subsession.
+    """
+    sessions = calendar.sessions_nanos
+    slc = slice(
+        sessions.searchsorted(first_session),
+        sessions.searchsorted(last_session, side="right"),
+    )
+    sessions = sessions[slc]
+    opens, closes = calendar.opens_nanos[slc], calendar.closes_nanos[slc]
+    break_starts = calendar.break_starts_nanos[slc]
+    break_ends = calendar.break_ends_nanos[slc]
+    has_break = break_starts != NP_NAT
+    return (
+        np.concatenate((opens, break_ends[has_break])),
+        np.concatenate((np.where(has_break, break_starts, closes), closes[has_break])),
+        np.concatenate((sessions, sessions[has_break])),
+    )
+
+
+def _combine_periods(
+    opens: np.ndarray,
+    closes: np.ndarray,
+    sessions: np.ndarray,
+    threshold: int,
+    side: Literal["left", "right", "both", "neither"],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Combine open periods.
+
+    Parameters
+    ----------
+    opens, closes, sessions
+        int64 arrays describing open periods, in any order, as returned
+        by `_subsessions` (for any number of calendars).
+
+    threshold
+        Number of periods that must be open for the combined calendar to
+        be open, i.e. 1 for the union of calendars or the number of
+        calendars for the intersection.
+
+    side
+        Side of the calendars. A period that opens as another closes is
+        combined with that period only if `side` is "both", in which case
+        a combined period can also have no duration (i.e. be open only on
+        the instant that one period closes and another opens). Otherwise
+        such periods remain separate, as do the consecutive sessions of a
+        calendar that closes and reopens at the same time.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        int64 arrays describing the combined open periods, in order:
+            [0] open of each period.
+            [1] close of each period.
+            [2] session of each period, as the session of the (sub)session
+                that opens the period.
+    """
+    n = len(opens)
+    times = np.concatenate((opens, closes))
+    deltas = np.concatenate((np.ones(n, dtype=np.int64), np.full(n, -1)))
+    sessions = np.concatenate((sessions, sessions))
+    # at any time when one period closes and another opens, process the
+    # opening first only if the periods are to be combined.
+    order = np.lexsort((-deltas if side == "both" else deltas, times))
+    times, sessions = times[order], sessions[order]
+    is_open = np.cumsum(deltas[order]) >= threshold
+    was_open = np.concatenate(([False], is_open[:-1]))
+    opens = times[is_open & ~was_open]
+    closes = times[~is_open & was_open]
+    sessions = sessions[is_open & ~was_open]
+    keep = closes >= opens if side == "both" else closes > opens
+    # ensure sessions are monotonic such that periods can be sliced by session
+    sessions = np.maximum.accumulate(sessions[keep])
+    return opens[keep], closes[keep], sessions
+
+
+class CombinedCalendar:
+    """Calendar combining the schedules of multiple exchange calendars.
+
+    The combined calendar is open whenever any of the calendars is open
+    (union) or whenever all of the calendars are open (intersection).
+    Combined open periods are evaluated from the bounds of each
+    calendar's sessions and breaks, i.e. without evaluating any
+    calendar's trading minutes.
+
+    The combined calendar covers the range of sessions common to all of
+    the calendars. An intersection of calendars that are never open at the
+    same time has no open periods, in which case the combined calendar is
+    never open.
+
+    Parameters
+    ----------
+    calendars
+        Calendars to combine. All calendars must have the same `side`.
+
+    how : default: "union"
+        How to combine the calendars:
+            "union" - open when any calendar is open.
+            "intersection" - open when all calendars are open.
+
+    Examples
+    --------
+    >>> import exchange_calendars as xcals
+    >>> from exchange_calendars.combined_calendar import CombinedCalendar
+    >>> xnys = xcals.get_calendar("XNYS", start="2021", end="2021-12-31")
+    >>> xtse = xcals.get_calendar("XTSE", start="2021", end="2021-12-31")
+    >>> combined = CombinedCalendar([xnys, xtse], how="intersection")
+    >>> combined.is_open_on_minute("2021-07-02 15:00")
+    True
+    >>> combined.is_open_on_minute("2021-07-01 15:00")  # XTSE holiday
+    False
+    >>> combined.next_open("2021-07-01 15:00")
+    Timestamp('2021-07-02 13:30:00+0000', tz='UTC')
+    """
+
+    def __init__(
+        self,
+        calendars: Sequence[ExchangeCalendar],
+        how: Literal["union", "intersection"] = "union",
+    ):
+        if not len(calendars):
+            raise ValueError("`calendars` must include at least one calendar.")
+        if how not in ("union", "intersection"):
+            raise ValueError(
+                f"`how` must be 'union' or 'intersection', received '{how}'."
+            )
+        sides = {cal.side for cal in calendars}
+        if len(sides) > 1:
+            raise ValueError(
+                f"All calendars must have the same `side`, received sides {sides}."
+            )
+
+        self._calendars = tuple(calendars)
+        self._how = how
+        self._side = sides.pop()
+
+        first = max(cal.sessions_nanos[0] for cal in calendars)
+        last = min(cal.sessions_nanos[-1] for cal in calendars)
+        if first > last:
+            raise ValueError("`calendars` do not have any sessions in common.")
+        self._first_session, self._last_session = first, last
+
+        periods = [_subsessions(cal, first, last) for cal in calendars]
+        opens, closes, sessions = _combine_periods(
+            *(np.concatenate(arrays) for arrays in zip(*periods)),
+            threshold=1 if how == "union" else len(calendars),
+            side=self._side,
+        )
+        for array in (opens, closes, sessions):
+            array.flags.writeable = False
+        self._opens, self._closes, self._period_sessions = opens, closes, sessions
+
+    def __repr__(self) -> str:
+        names = ", ".join(cal.name for cal in self._calendars)
+        return f"{type(self).__name__}([{names}], how={self._how!r})"
+
+    @property
+    def calendars(self) -> tuple[ExchangeCalendar, ...]:
+        """Combined calendars."""
+        return self._calendars
+
+    @property
+    def how(self) -> Literal["union", "intersection"]:
+        """How the calendars are combined."""
+        return self._how
+
+    @property
+    def side(self) -> Literal["left", "right", "both", "neither"]:
+        """Side of the combined calendars."""
+        return self._side
+
+    @property
+    def first_session(self) -> pd.Timestamp:
+        """First session of the range covered by the combined calendar."""
+        return pd.Timestamp(self._first_session)
+
+    @property
+    def last_session(self) -> pd.Timestamp:
+        """Last session of the range covered by the combined calendar."""
+        return pd.Timestamp(self._last_session)
+
+    @functools.cached_property
+    def sessions_nanos(self) -> np.ndarray:
+        """Combined sessions as int64 nanoseconds.
+
+        Combined sessions are the union or intersection, according to
+        `how`, of the calendars' sessions.
+        """
+        op = np.union1d if self._how == "union" else np.intersect1d
+        sessions = functools.reduce(
+            op,
+            (
+                cal.sessions_nanos[
+                    cal.sessions_nanos.searchsorted(self._first_session) : (
+                        cal.sessions_nanos.searchsorted(self._last_session, "right")
+                    )
+                ]
+                for cal in self._calendars
+            ),
+        )
+        sessions.flags.writeable = False
+        return sessions
+
+    @property
+    def sessions(self) -> pd.DatetimeIndex:
+        """Combined sessions (see `sessions_nanos`)."""
+        return pd.DatetimeIndex(self.sessions_nanos)
+
+    @property
+    def opens_nanos(self) -> np.ndarray:
+        """Open of each combined open period, as int64 nanoseconds."""
+        return self._opens
+
+    @property
+    def closes_nanos(self) -> np.ndarray:
+        """Close of each combined open period, as int64 nanoseconds."""
+        return self._closes
+
+    @property
+    def schedule(self) -> pd.DataFrame:
+        """Schedule of combined open periods.
+
+        Index has the session of each period, as the session of the
+        calendar (sub)session that opens the period. A session can label
+        multiple periods, for example the am and pm subsessions of a
+        calendar with a break or the sessions of calendars that do not
+        overlap.
+        """
+        return pd.DataFrame(
+            {
+                "open": pd.DatetimeIndex(self._opens, tz=UTC),
+                "close": pd.DatetimeIndex(self._closes, tz=UTC),
+            },
+            index=pd.DatetimeIndex(self._period_sessions),
+        )
+
+    def _parse_minute(self, minute: Minute) -> int:
+        return parse_timestamp_nanos(minute, "minute", raise_oob=False, side=self.side)
+
+    def _is_open_on_nanos(self, nanos: int | np.ndarray) -> bool | np.ndarray:
+        """Query if combined calendar is open on minute(s) as nanos."""
+        if not len(self._opens):
+            # no combined open periods, e.g. intersection of calendars that
+            # never trade at the same time
+            return np.zeros(np.shape(nanos), dtype=bool)
+        left = self.side in ("left", "both")
+        idx = self._opens.searchsorted(nanos, side="right" if left else "left") - 1
+        closes = self._closes[np.clip(idx, 0, None)]
+        within = closes >= nanos if self.side in ("right", "both") else closes > nanos
+        return (idx >= 0) & within
+
+    def is_open_on_minute(self, minute: Minute) -> bool:
+        """Query if the combined calendar is open on a given minute.
+
+        Note: `side` determines whether the combined calendar is
+        considered open or closed on the open and close of each combined
+        open period.
+
+        Parameters
+        ----------
+        minute
+            Minute being queried.
+
+        Returns
+        -------
+        bool
+            Boolean indicating if the combined calendar is open on
+            `minute`.
+        """
+        return bool(self._is_open_on_nanos(self._parse_minute(minute)))
+
+    def is_open_on_minutes(self, minutes: Minutes) -> np.ndarray:
+        """Query if the combined calendar is open on multiple minutes.
+
+        Array equivalent of `is_open_on_minute`.
+
+        Parameters
+        ----------
+        minutes
+            Minutes being queried. See `calendar_helpers.parse_timestamps`
+            for valid input types.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array indicating if the combined calendar is open on
+            each of `minutes`.
+        """
+        nanos = parse_timestamps(minutes, "minutes", raise_oob=False, side=self.side)
+        return self._is_open_on_nanos(nanos)
+
+    def _next(self, dividers: np.ndarray, minute: Minute, name: str) -> pd.Timestamp:
+        nanos = self._parse_minute(minute)
+        idx = dividers.searchsorted(nanos, side="right")
+        if idx == len(dividers):
+            raise ValueError(
+                f"Minute cannot be the last {name} or later (received `minute`"
+                f" parsed as '{pd.Timestamp(nanos, tz=UTC)}'.)"
+            )
+        return pd.Timestamp(dividers[idx], tz=UTC)
+
+    def _previous(
+        self, dividers: np.ndarray, minute: Minute, name: str
+    ) -> pd.Timestamp:
+        nanos = self._parse_minute(minute)
+        idx = dividers.searchsorted(nanos) - 1
+        if idx < 0:
+            raise ValueError(
+                f"Minute cannot be the first {name} or earlier (received `minute`"
+                f" parsed as '{pd.Timestamp(nanos, tz=UTC)}'.)"
+            )
+        return pd.Timestamp(dividers[idx], tz=UTC)
+
+    def next_open(self, minute: Minute) -> pd.Timestamp:
+        """Return next open of a combined open period following a minute."""
+        return self._next(self._opens, minute, "open")
+
+    def next_close(self, minute: Minute) -> pd.Timestamp:
+        """Return next close of a combined open period following a minute."""
+        return self._next(self._closes, minute, "close")
+
+    def previous_open(self, minute: Minute) -> pd.Timestamp:
+        """Return previous open of a combined open period preceding a minute."""
+        return self._previous(self._opens, minute, "open")
+
+    def previous_close(self, minute: Minute) -> pd.Timestamp:
+        """Return previous close of a combined open period preceding a minute."""
+        return self._previous(self._closes, minute, "close")
+
+    def _parse_date_or_minute(
+        self, ts: Date | Minute, param_name: str
+    ) -> tuple[pd.Timestamp, bool]:
+        ts = parse_timestamp(ts, param_name, raise_oob=False, side=self.side, utc=False)
+        is_time = not is_date(ts)
+        return (to_utc(ts) if is_time else ts), is_time
+
+    def trading_index(
+        self,
+        start: Date | Minute,
+        end: Date | Minute,
+        period: pd.Timedelta | str,
+        intervals: bool = True,
+        closed: Literal["left", "right", "both", "neither"] = "left",
+        force_close: bool = False,
+        curtail_overlaps: bool = False,
+    ) -> pd.DatetimeIndex | pd.IntervalIndex:
+        """Create a trading index over the combined open periods.
+
+        Indices are evaluated for each combined open period as
+        `ExchangeCalendar.trading_index` evaluates indices for each
+        session of a calendar that does not have breaks.
+
+        Parameters
+        ----------
+        start
+            Start of index. If passed as a date then the index starts with
+            the first indice of the first open period labelled with a
+            session on or after `start` (see `schedule`). If passed as a
+            minute then the index starts with the first indice that has a
+            left side on or after `start`.
+
+        end
+            End of index. If passed as a date then the index ends with the
+            last indice of the last open period labelled with a session on
+            or before `end`. If passed as a minute then the index ends with
+            the last indice that has a right side on or before `end`.
+
+        period
+            Period of each indice. If one day, the index comprises the
+            combined `sessions` from `start` through `end`.
+
+        intervals, closed, force_close, curtail_overlaps
+            As `ExchangeCalendar.trading_index`, with `force_close`
+            applying to the close of each combined open period.
+
+        Returns
+        -------
+        pd.IntervalIndex or pd.DatetimeIndex
+            Trading index. If `intervals` is False or `period` is one day
+            then returned as a pd.DatetimeIndex, otherwise as a
+            pd.IntervalIndex.
+        """
+        period = ExchangeCalendar._parse_trading_index_period(period)
+        if intervals and closed in ["both", "neither"]:
+            raise ValueError(
+                f"If `intervals` is True then `closed` cannot be '{closed}'."
+            )
+        start_, start_as_time = self._parse_date_or_minute(start, "start")
+        end_, end_as_time = self._parse_date_or_minute(end, "end")
+
+        if period == pd.Timedelta(1, "D"):
+            sessions = self.sessions
+            first = start_.tz_localize(None).normalize() if start_as_time else start_
+            last = end_.tz_localize(None).normalize() if end_as_time else end_
+            slc = slice(
+                sessions.searchsorted(first), sessions.searchsorted(last, "right")
+            )
+            return sessions[slc]
+
+        if start_as_time:
+            slice_start = self._closes.searchsorted(start_.value, side="right")
+        else:
+            slice_start = self._period_sessions.searchsorted(start_.value)
+        if end_as_time:
+            slice_end = self._opens.searchsorted(end_.value)
+        else:
+            slice_end = self._period_sessions.searchsorted(end_.value, side="right")
+        slc = slice(slice_start, slice_end)
+
+        ti = _TradingIndex._from_bounds(
+            self._opens[slc],
+            self._closes[slc],
+            start_,
+            start_as_time,
+            end_,
+            end_as_time,
+            period,
+            closed,
+            force_close,
+            curtail_overlaps,
+        )
+        return ti.trading_index_intervals() if intervals else ti.trading_index()
+
+
+class OpenStatus(NamedTuple):
+    """Open status of multiple calendars at multiple timestamps.
+
+    Each attribute is an array with a row for each timestamp and a column
+    for each calendar. Attributes that were not requested are None.
+
+    Attributes
+    ----------
+    is_open
+        bool array indicating if each calendar is open at each timestamp.
+
+    sessions
+        int64 array of the session, as nanoseconds, during which each
+        calendar is open at each timestamp. NaT (as int64) if the calendar
+        is not open.
+
+    next_opens
+        int64 array of the next session open, as nanoseconds, of each
+        calendar following each timestamp. NaT (as int64) if there is no
+        later session open.
+
+    next_closes
+        int64 array of the next session close, as nanoseconds, of each
+        calendar following each timestamp. NaT (as int64) if there is no
+        later session close.
+    """
+
+    is_open: np.ndarray
+    sessions: np.ndarray | None
+    next_opens: np.ndarray | None
+    next_closes: np.ndarray | None
+
+
+def _bound_sessions(calendar: ExchangeCalendar, ignore_breaks: bool) -> np.ndarray:
+    """Get position of the session of each of a calendar's bounds.
+
+    Bounds as `ExchangeCalendar._session_bounds_nanos` if `ignore_breaks`,
+    otherwise as `ExchangeCalendar._subsession_bounds_nanos`.
+    """
+    num_sessions = len(calendar.sessions_nanos)
+    if ignore_breaks:
+        return np.arange(num_sessions).repeat(2)
+    has_break = calendar.break_starts_nanos != NP_NAT
+    return np.arange(num_sessions).repeat(np.where(has_break, 4, 2))
+
+
+def open_status(
+    calendars: Sequence[ExchangeCalendar],
+    timestamps: Minutes,
+    side: Literal["left", "right", "both", "neither"] = "left",
+    ignore_breaks: bool = False,
+    sessions: bool = False,
+    next_opens: bool = False,
+    next_closes: bool = False,
+) -> OpenStatus:
+    """Query the open status of multiple calendars at multiple timestamps.
+
+    Vectorised equivalent of calling `ExchangeCalendar.is_open_at_time`
+    for each calendar and each timestamp. Evaluated with a single sorted
+    search of each calendar's (sub)session bounds, from which the session
+    and next open and close are also evaluated (if requested).
+
+    Parameters
+    ----------
+    calendars
+        Calendars to query.
+
+    timestamps
+        Timestamps to query. Can have any resolution. See
+        `ExchangeCalendar.is_open_at_times` for valid input types.
+
+    side, ignore_breaks
+        As `ExchangeCalendar.is_open_at_time`. Note that `side` default
+        is "left".
+
+    sessions : default: False
+        True to also evaluate the session during which each calendar is
+        open at each timestamp.
+
+    next_opens : default: False
+        True to also evaluate the next session open of each calendar that
+        follows each timestamp (as `ExchangeCalendar.next_open`).
+
+    next_closes : default: False
+        True to also evaluate the next session close of each calendar
+        that follows each timestamp (as `ExchangeCalendar.next_close`).
+
+    Returns
+    -------
+    OpenStatus
+        Arrays with a row for each of `timestamps` and a column for each
+        of `calendars`.
+
+    Raises
+    ------
+    errors.MinuteOutOfBounds
+        If any timestamp is earlier than the first trading minute or later
+        than the last trading minute of any calendar.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> import exchange_calendars as xcals
+    >>> from exchange_calendars.combined_calendar import open_status
+    >>> calendars = [xcals.get_calendar(name) for name in ["XLON", "XNYS", "XTKS"]]
+    >>> timestamps = pd.DatetimeIndex(["2021-06-01 09:00", "2021-06-01 15:00"])
+    >>> open_status(calendars, timestamps).is_open
+    array([[ True, False, False],
+           [ True,  True, False]])
+    """
+    nanos, _ = _to_nanos_array(timestamps, "timestamps", utc=True)
+    if (nanos == NP_NAT).any():
+        raise ValueError("Parameter `timestamps` cannot include NaT.")
+
+    shape = (len(nanos), len(calendars))
+    is_open = np.empty(shape, dtype=bool)
+    sessions_ = np.empty(shape, dtype=np.int64) if sessions else None
+    next_opens_ = np.empty(shape, dtype=np.int64) if next_opens else None
+    next_closes_ = np.empty(shape, dtype=np.int64) if next_closes else None
+
+    for i, cal in enumerate(calendars):
+        minute_index = cal._minute_index
+        oob = (nanos < minute_index.first) | (nanos > minute_index.last)
+        if oob.any():
+            ts = pd.Timestamp(nanos[oob.nonzero()[0][0]], tz=UTC)
+            raise errors.MinuteOutOfBounds(cal, ts, "timestamps")
+
+        if ignore_breaks:
+            bounds = cal._session_bounds_nanos
+        else:
+            bounds = cal._subsession_bounds_nanos
+        # number of bounds on or before each timestamp
+        idx = bounds.searchsorted(nanos, side="right")
+        # an odd number indicates that the timestamp lies within a (sub)session.
+        # Where a timestamp coincides with a bound (or a close and the next
+        # open), whether it's open depends on side (see `_is_open_at_nanos`).
+        on_bound = bounds[idx - 1] == nanos  # NB timestamps not earlier than bounds
+        if side == "right":
+            # number of bounds before each timestamp
+            on_two_bounds = (
+                on_bound & (idx >= 2) & (bounds[np.maximum(idx - 2, 0)] == nanos)
+            )
+            idx_open = idx - on_bound - on_two_bounds
+        else:
+            idx_open = idx
+        open_ = idx_open % 2 == 1
+        if side == "both":
+            open_ |= on_bound
+        elif side == "neither":
+            open_ &= ~on_bound
+        is_open[:, i] = open_
+
+        if not (sessions or next_opens or next_closes):
+            continue
+        bound_sessions = _bound_sessions(cal, ignore_breaks)
+        if sessions:
+            session_idx = bound_sessions[idx_open - 1]
+            sessions_[:, i] = np.where(open_, cal.sessions_nanos[session_idx], NP_NAT)
+
+        # session of the first bound later than each timestamp
+        has_next = idx < len(bounds)
+        next_session = bound_sessions[np.minimum(idx, len(bounds) - 1)]
+        if next_opens:
+            # that session's open, or the following session's open if already open
+            opens = cal.opens_nanos
+            session_idx = next_session + (opens[next_session] <= nanos)
+            has_next_open = has_next & (session_idx < len(opens))
+            session_idx = np.minimum(session_idx, len(opens) - 1)
+            next_opens_[:, i] = np.where(has_next_open, opens[session_idx], NP_NAT)
+        if next_closes:
+            closes = cal.closes_nanos[next_session]
+            next_closes_[:, i] = np.where(has_next, closes, NP_NAT)
+
+    return OpenStatus(is_open, sessions_, next_opens_, next_closes_)
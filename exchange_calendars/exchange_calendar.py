@@ -16,10 +16,10 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from calendar import day_name
 import collections
-from collections.abc import Sequence, Callable
+from collections.abc import Callable, Iterator, Sequence
 import datetime
 import functools
-import operator
+import time
 from typing import TYPE_CHECKING, Literal, Any
 import warnings
 from zoneinfo import ZoneInfo
@@ -30,26 +30,40 @@ import toolz
 from pandas.tseries.holiday import AbstractHolidayCalendar
 from pandas.tseries.offsets import CustomBusinessDay
 
-from exchange_calendars import errors
+from exchange_calendars import errors, schedule_cache
 from .calendar_helpers import (
     UTC,
     NANOSECONDS_PER_MINUTE,
     NP_NAT,
     Date,
+    Dates,
     Minute,
+    Minutes,
     Session,
+    TradingIndexCacheInfo,
     TradingMinute,
+    _MinuteIndex,
     _TradingIndex,
+    _TradingIndexCache,
+    _as_nanos,
+    _to_nanos_array,
     compute_minutes,
     next_divider_idx,
     one_minute_earlier,
     one_minute_later,
     parse_date,
+    parse_date_nanos,
+    parse_dates,
     parse_session,
+    parse_session_nanos,
     parse_timestamp,
+    parse_timestamp_nanos,
+    parse_timestamps,
     parse_trading_minute,
     previous_divider_idx,
 )
+from .pandas_extensions.holiday import holiday_dates
+from .pandas_extensions.offsets import _get_calendar, business_day_range
 from .utils.pandas_utils import days_at_time
 
 if TYPE_CHECKING:
@@ -82,6 +96,23 @@ def selection(
     return arr[np.all(predicates, axis=0)]
 
 
+def _to_nanos(dti: pd.DatetimeIndex) -> np.ndarray:
+    """Return DatetimeIndex values as int64 nanoseconds."""
+    return dti.values.astype("datetime64[ns]").view(np.int64)
+
+
+def _from_nanos(
+    nanos: int, as_nanos: bool, tz: ZoneInfo | None = UTC
+) -> pd.Timestamp | int:
+    """Return nanoseconds as int if `as_nanos`, otherwise as pd.Timestamp.
+
+    NaT is returned as NP_NAT (as int) if `as_nanos`, otherwise as pd.NaT.
+    """
+    if as_nanos:
+        return int(nanos)
+    return pd.Timestamp(nanos, tz=tz)
+
+
 def _group_times(
     sessions: pd.DatetimeIndex,
     times: None | Sequence[tuple[pd.Timestamp | None, datetime.time]],
@@ -138,6 +169,36 @@ class HolidayCalendar(AbstractHolidayCalendar):
     def __init__(self, rules):
         super().__init__(rules=rules)
 
+    def holidays(self, start=None, end=None, return_name: bool = False):
+        """Return holidays between `start` and `end`.
+
+        As ``pandas.tseries.holiday.AbstractHolidayCalendar.holidays``
+        although evaluates each rule with `holiday_dates`, which vectorizes
+        the evaluation of pandas Holiday rules and their observances.
+        """
+        if self.rules is None:
+            raise Exception(
+                f"Holiday Calendar {self.name} does not have any rules specified"
+            )
+
+        start = pd.Timestamp(
+            AbstractHolidayCalendar.start_date if start is None else start
+        )
+        end = pd.Timestamp(AbstractHolidayCalendar.end_date if end is None else end)
+
+        if self._cache is None or start < self._cache[0] or end > self._cache[1]:
+            pre_holidays = [
+                holiday_dates(rule, start, end, return_name=True) for rule in self.rules
+            ]
+            if pre_holidays:
+                holidays = pd.concat(pre_holidays)
+            else:
+                holidays = pd.Series(index=pd.DatetimeIndex([]), dtype=object)
+            self._cache = (start, end, holidays.sort_index())
+
+        holidays = self._cache[2][start:end]
+        return holidays if return_name else holidays.index
+
 
 class ExchangeCalendar(ABC):
     """Representation of timing information of a single market exchange.
@@ -226,6 +287,12 @@ class ExchangeCalendar(ABC):
     _LEFT_SIDES = ["left", "both"]
     _RIGHT_SIDES = ["right", "both"]
 
+    # Cache of trading indexes, None if cache not enabled.
+    _trading_index_cache: _TradingIndexCache | None = None
+
+    # Number of times the calendar's schedule has been modified in place.
+    _modification_count: int = 0
+
     @classmethod
     def bound_min(cls) -> pd.Timestamp | None:
         """Earliest date from which calendar can be constructed.
@@ -322,75 +389,64 @@ class ExchangeCalendar(ABC):
                 f" '{start}' and `end` as '{end}'."
             )
 
-        _all_days = pd.date_range(start, end, freq=self.day)  # session labels
-        if _all_days.empty:
-            raise errors.NoSessionsError(calendar_name=self.name, start=start, end=end)
-
-        # DatetimeIndex of standard times for each day.
-        self._opens = _group_times(
-            _all_days,
-            self.open_times,
-            self.tz,
-            self.open_offset,
-        )
-        self._break_starts = _group_times(
-            _all_days,
-            self.break_start_times,
-            self.tz,
-        )
-        self._break_ends = _group_times(
-            _all_days,
-            self.break_end_times,
-            self.tz,
-        )
-        self._closes = _group_times(
-            _all_days,
-            self.close_times,
-            self.tz,
-            self.close_offset,
-        )
-
-        # Apply any special offsets first
-        self.apply_special_offsets(_all_days, start, end)
-
-        # Series mapping sessions with non-standard opens/closes.
-        _special_opens = self._calculate_special_opens(start, end)
-        _special_closes = self._calculate_special_closes(start, end)
-
-        # Adjust for special opens and closes.
-        self._opens = _adjust_special_dates(_all_days, self._opens, _special_opens)
-        self._closes = _adjust_special_dates(_all_days, self._closes, _special_closes)
-        self._break_starts = _remove_breaks_for_special_dates(
-            _all_days, self._break_starts, _special_closes
-        )
-        self._break_ends = _remove_breaks_for_special_dates(
-            _all_days, self._break_ends, _special_closes
-        )
-
-        break_starts = None if self._break_starts is None else self._break_starts
-        break_ends = None if self._break_ends is None else self._break_ends
-        self.schedule = pd.DataFrame(
-            index=_all_days,
-            data=collections.OrderedDict(
-                [
-                    ("open", self._opens),
-                    ("break_start", break_starts),
-                    ("break_end", break_ends),
-                    ("close", self._closes),
-                ]
-            ),
-            dtype="datetime64[ns, UTC]",
-        )
-
-        self.opens_nanos = self.schedule.open.values.astype(np.int64)
-        self.break_starts_nanos = self.schedule.break_start.values.astype(np.int64)
-        self.break_ends_nanos = self.schedule.break_end.values.astype(np.int64)
-        self.closes_nanos = self.schedule.close.values.astype(np.int64)
+        self._evaluation_timings = {}
+        schedule = schedule_cache.load(type(self), start, end)
+        if schedule is None:
+            self._evaluate_schedule(start, end)
+            schedule_cache.store(
+                type(self),
+                start,
+                end,
+                {
+                    "sessions": _to_nanos(self.sessions),
+                    "opens": self.opens_nanos,
+                    "break_starts": self.break_starts_nanos,
+                    "break_ends": self.break_ends_nanos,
+                    "closes": self.closes_nanos,
+                    "late_opens": _to_nanos(self._late_opens),
+                    "early_closes": _to_nanos(self._early_closes),
+                },
+            )
+        else:
+            self._set_schedule_nanos(schedule)
 
-        _check_breaks_match(self.break_starts_nanos, self.break_ends_nanos)
+    def __getstate__(self) -> dict[str, Any]:
+        """Return compact state for pickling.
 
-        self._late_opens = _special_opens.index
-        self._early_closes = _special_closes.index
+        State comprises the schedule, as int64 nanosecond arrays, together
+        with any instance attributes that are not derived from the
+        schedule or the calendar definition. Derived data (e.g. `minutes`,
+        `minutes_nanos`, `day`) is not pickled although is evaluated by
+        the unpickled calendar if and when requested. A trading index
+        cache is pickled as an empty cache with the same `maxbytes`.
+        """
+        excluded = _unpickled_attrs(type(self))
+        state = {k: v for k, v in self.__dict__.items() if k not in excluded}
+
+        def compact(nanos: np.ndarray) -> np.ndarray | None:
+            # NB break arrays of calendars that do not have breaks are all NaT
+            return None if (nanos == NP_NAT).all() else np.asarray(nanos)
+
+        schedule = {k: np.asarray(v) for k, v in self._schedule_nanos().items()}
+        for field in ("break_starts", "break_ends"):
+            schedule[field] = compact(schedule[field])
+        state["_schedule_nanos"] = schedule
+        if self._trading_index_cache is not None:
+            state["_trading_index_cache_maxbytes"] = self._trading_index_cache.maxbytes
+        return state
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restore calendar from state returned by `__getstate__`."""
+        state = state.copy()
+        schedule = state.pop("_schedule_nanos")
+        maxbytes = state.pop("_trading_index_cache_maxbytes", None)
+        self.__dict__.update(state)
+        for field in ("break_starts", "break_ends"):
+            if schedule[field] is None:
+                schedule[field] = np.full(len(schedule["sessions"]), NP_NAT)
+        self._set_schedule_nanos(schedule)
+        if maxbytes is not None:
+            self.trading_index_cache_enable(maxbytes)
 
     # --------------- Calendar definition methods/properties --------------
     # Methods and properties in this section should be overriden or
@@ -721,13 +777,30 @@ class ExchangeCalendar(ABC):
 
     # Methods and properties that define calendar (continued...).
 
+    @functools.cached_property
+    def _regular_holidays(self) -> HolidayCalendar | None:
+        """`regular_holidays`, evaluated once for the instance.
+
+        A subclass may return a new HolidayCalendar whenever
+        `regular_holidays` is accessed. Sharing a single instance allows
+        the holidays it evaluates to be cached and reused.
+        """
+        return self.regular_holidays
+
+    @functools.cached_property
+    def _adhoc_holidays(self) -> pd.DatetimeIndex:
+        """`adhoc_holidays` as a DatetimeIndex, evaluated once."""
+        return pd.DatetimeIndex(self.adhoc_holidays)
+
     @functools.cached_property
     def day(self) -> CustomBusinessDay:
         """CustomBusinessDay instance representing calendar sessions."""
+        # evaluate busdaycalendar with vectorized operations
+        calendar, holidays = _get_calendar(
+            self.weekmask, self._adhoc_holidays, self._regular_holidays
+        )
         return CustomBusinessDay(
-            holidays=self.adhoc_holidays,
-            calendar=self.regular_holidays,
-            weekmask=self.weekmask,
+            holidays=holidays, calendar=calendar, weekmask=self.weekmask
         )
 
     @classmethod
@@ -764,7 +837,11 @@ class ExchangeCalendar(ABC):
 
     @property
     def sessions(self) -> pd.DatetimeIndex:
-        """All calendar sessions."""
+        """All calendar sessions.
+
+        NB Index does not have a `freq` (`day` offers the calendar's
+        sessions as a CustomBusinessDay).
+        """
         return self.schedule.index
 
     @functools.cached_property
@@ -908,7 +985,13 @@ class ExchangeCalendar(ABC):
 
     @functools.cached_property
     def minutes(self) -> pd.DatetimeIndex:
-        """All trading minutes."""
+        """All trading minutes.
+
+        Notes
+        -----
+        Array of all trading minutes is only evaluated when first
+        requested. Methods that query minutes do not require it.
+        """
         return self._minutes(self.side)
 
     @functools.cached_property
@@ -916,6 +999,21 @@ class ExchangeCalendar(ABC):
         """All trading minutes as nanoseconds."""
         return self.minutes.values.astype(np.int64)
 
+    @functools.cached_property
+    def _minute_index(self) -> _MinuteIndex:
+        """Virtual index of all trading minutes."""
+        return _MinuteIndex(
+            self.opens_nanos,
+            self.break_starts_nanos,
+            self.break_ends_nanos,
+            self.closes_nanos,
+            self.side,
+        )
+
+    def _minutes_from_nanos(self, nanos: np.ndarray) -> pd.DatetimeIndex:
+        """Convert trading minute nanos to pd.DatetimeIndex."""
+        return pd.DatetimeIndex(nanos.view("datetime64[ns]"), tz=UTC)
+
     # Calendar properties.
 
     @property
@@ -941,12 +1039,12 @@ class ExchangeCalendar(ABC):
     @property
     def first_minute(self) -> pd.Timestamp:
         """Calendar's first trading minute."""
-        return pd.Timestamp(self.minutes_nanos[0], tz=UTC)
+        return pd.Timestamp(self._minute_index.first, tz=UTC)
 
     @property
     def last_minute(self) -> pd.Timestamp:
         """Calendar's last trading minute."""
-        return pd.Timestamp(self.minutes_nanos[-1], tz=UTC)
+        return pd.Timestamp(self._minute_index.last, tz=UTC)
 
     @property
     def has_break(self) -> bool:
@@ -971,50 +1069,81 @@ class ExchangeCalendar(ABC):
         """
         return self._early_closes
 
+    @property
+    def evaluation_timings(self) -> dict[str, float]:
+        """Time taken to evaluate each stage of the calendar's schedule.
+
+        Returns
+        -------
+        dict[str, float]
+            key: stage name, in order of evaluation:
+                "holidays": regular and adhoc holidays.
+                "sessions": session labels.
+                "standard_times": standard open, close and break times.
+                "special_offsets": subclass' special offsets.
+                "special_dates": special opens and closes.
+                "adjust": adjustment of standard times for special dates.
+                "schedule": schedule and nanosecond arrays.
+            value: time taken to evaluate stage, in seconds.
+
+            Empty if the schedule was not evaluated by the instance, for
+            example if it was loaded from the schedule cache or the
+            calendar was derived with `slice`.
+        """
+        return dict(self._evaluation_timings)
+
     # Methods that interrogate a given session.
 
     def _get_session_idx(self, session: Date, _parse=True) -> int:
         """Index position of a session."""
-        session_ = parse_session(self, session) if _parse else session
-        if TYPE_CHECKING:
-            assert isinstance(session_, pd.Timestamp)
-        return self.sessions_nanos.searchsorted(session_.value, side="left")
+        nanos = parse_session_nanos(self, session) if _parse else session.value
+        return self.sessions_nanos.searchsorted(nanos, side="left")
 
-    def session_open(self, session: Session, _parse: bool = True) -> pd.Timestamp:
-        """Return open time for a given session."""
-        if _parse:
-            session = parse_session(self, session, "session")
-        return self.schedule.at[session, "open"]
+    def session_open(
+        self, session: Session, _parse: bool = True, *, as_nanos: bool = False
+    ) -> pd.Timestamp | int:
+        """Return open time for a given session.
 
-    def session_close(self, session: Session, _parse: bool = True) -> pd.Timestamp:
-        """Return close time for a given session."""
-        if _parse:
-            session = parse_session(self, session, "session")
-        return self.schedule.at[session, "close"]
+        Returns open as int nanoseconds (UTC) if `as_nanos` is True.
+        """
+        nanos = self.opens_nanos
+        return self._get_session_minute_from_nanos(session, nanos, _parse, as_nanos)
+
+    def session_close(
+        self, session: Session, _parse: bool = True, *, as_nanos: bool = False
+    ) -> pd.Timestamp | int:
+        """Return close time for a given session.
+
+        Returns close as int nanoseconds (UTC) if `as_nanos` is True.
+        """
+        nanos = self.closes_nanos
+        return self._get_session_minute_from_nanos(session, nanos, _parse, as_nanos)
 
     def session_break_start(
-        self, session: Session, _parse: bool = True
-    ) -> pd.Timestamp | NaTType:
+        self, session: Session, _parse: bool = True, *, as_nanos: bool = False
+    ) -> pd.Timestamp | NaTType | int:
         """Return break-start time for a given session.
 
         Returns pd.NaT if no break.
+
+        Returns break-start as int nanoseconds (UTC) if `as_nanos` is True
+        (NP_NAT if no break).
         """
-        if _parse:
-            session = parse_session(self, session, "session")
-        break_start = self.schedule.at[session, "break_start"]
-        return break_start
+        nanos = self.break_starts_nanos
+        return self._get_session_minute_from_nanos(session, nanos, _parse, as_nanos)
 
     def session_break_end(
-        self, session: Session, _parse: bool = True
-    ) -> pd.Timestamp | NaTType:
+        self, session: Session, _parse: bool = True, *, as_nanos: bool = False
+    ) -> pd.Timestamp | NaTType | int:
         """Return break-end time for a given session.
 
         Returns pd.NaT if no break.
+
+        Returns break-end as int nanoseconds (UTC) if `as_nanos` is True
+        (NP_NAT if no break).
         """
-        if _parse:
-            session = parse_session(self, session, "session")
-        break_end = self.schedule.at[session, "break_end"]
-        return break_end
+        nanos = self.break_ends_nanos
+        return self._get_session_minute_from_nanos(session, nanos, _parse, as_nanos)
 
     def session_open_close(
         self, session: Session, _parse: bool = True
@@ -1057,38 +1186,50 @@ class ExchangeCalendar(ABC):
         return self.session_break_start(session), self.session_break_end(session)
 
     def _get_session_minute_from_nanos(
-        self, session: Session, nanos: np.ndarray, _parse: bool
-    ) -> pd.Timestamp:
+        self, session: Session, nanos: np.ndarray, _parse: bool, as_nanos: bool = False
+    ) -> pd.Timestamp | int:
         idx = self._get_session_idx(session, _parse=_parse)
-        return pd.Timestamp(nanos[idx], tz=UTC)
+        return _from_nanos(nanos[idx], as_nanos)
 
     def session_first_minute(
-        self, session: Session, _parse: bool = True
-    ) -> pd.Timestamp:
-        """Return first trading minute of a given session."""
+        self, session: Session, _parse: bool = True, *, as_nanos: bool = False
+    ) -> pd.Timestamp | int:
+        """Return first trading minute of a given session.
+
+        Returns minute as int nanoseconds (UTC) if `as_nanos` is True.
+        """
         nanos = self.first_minutes_nanos
-        return self._get_session_minute_from_nanos(session, nanos, _parse)
+        return self._get_session_minute_from_nanos(session, nanos, _parse, as_nanos)
 
     def session_last_minute(
-        self, session: Session, _parse: bool = True
-    ) -> pd.Timestamp:
-        """Return last trading minute of a given session."""
+        self, session: Session, _parse: bool = True, *, as_nanos: bool = False
+    ) -> pd.Timestamp | int:
+        """Return last trading minute of a given session.
+
+        Returns minute as int nanoseconds (UTC) if `as_nanos` is True.
+        """
         nanos = self.last_minutes_nanos
-        return self._get_session_minute_from_nanos(session, nanos, _parse)
+        return self._get_session_minute_from_nanos(session, nanos, _parse, as_nanos)
 
     def session_last_am_minute(
-        self, session: Session, _parse: bool = True
-    ) -> pd.Timestamp | pd.NaT:
-        """Return last trading minute of am subsession of a given session."""
+        self, session: Session, _parse: bool = True, *, as_nanos: bool = False
+    ) -> pd.Timestamp | pd.NaT | int:
+        """Return last trading minute of am subsession of a given session.
+
+        Returns minute as int nanoseconds (UTC) if `as_nanos` is True.
+        """
         nanos = self.last_am_minutes_nanos
-        return self._get_session_minute_from_nanos(session, nanos, _parse)
+        return self._get_session_minute_from_nanos(session, nanos, _parse, as_nanos)
 
     def session_first_pm_minute(
-        self, session: Session, _parse: bool = True
-    ) -> pd.Timestamp | pd.NaT:
-        """Return first trading minute of pm subsession of a given session."""
+        self, session: Session, _parse: bool = True, *, as_nanos: bool = False
+    ) -> pd.Timestamp | pd.NaT | int:
+        """Return first trading minute of pm subsession of a given session.
+
+        Returns minute as int nanoseconds (UTC) if `as_nanos` is True.
+        """
         nanos = self.first_pm_minutes_nanos
-        return self._get_session_minute_from_nanos(session, nanos, _parse)
+        return self._get_session_minute_from_nanos(session, nanos, _parse, as_nanos)
 
     def session_first_last_minute(
         self,
@@ -1118,7 +1259,9 @@ class ExchangeCalendar(ABC):
             session = parse_session(self, session)
         return pd.notna(self.session_break_start(session))
 
-    def next_session(self, session: Session, _parse: bool = True) -> pd.Timestamp:
+    def next_session(
+        self, session: Session, _parse: bool = True, *, as_nanos: bool = False
+    ) -> pd.Timestamp | int:
         """Return session that immediately follows a given session.
 
         Parameters
@@ -1126,6 +1269,9 @@ class ExchangeCalendar(ABC):
         session
             Session whose next session is desired.
 
+        as_nanos : default: False
+            True to return session as int nanoseconds.
+
         Raises
         ------
         errors.RequestedSessionOutOfBounds
@@ -1137,14 +1283,16 @@ class ExchangeCalendar(ABC):
         """
         idx = self._get_session_idx(session, _parse=_parse)
         try:
-            return self.schedule.index[idx + 1]
+            return _from_nanos(self.sessions_nanos[idx + 1], as_nanos, tz=None)
         except IndexError:
-            if idx == len(self.schedule.index) - 1:
+            if idx == len(self.sessions_nanos) - 1:
                 raise errors.RequestedSessionOutOfBounds(self, False) from None
             else:
                 raise
 
-    def previous_session(self, session: Session, _parse: bool = True) -> pd.Timestamp:
+    def previous_session(
+        self, session: Session, _parse: bool = True, *, as_nanos: bool = False
+    ) -> pd.Timestamp | int:
         """Return session that immediately preceeds a given session.
 
         Parameters
@@ -1152,6 +1300,9 @@ class ExchangeCalendar(ABC):
         session
             Session whose previous session is desired.
 
+        as_nanos : default: False
+            True to return session as int nanoseconds.
+
         Raises
         ------
         errors.RequestedSessionOutOfBounds
@@ -1164,7 +1315,7 @@ class ExchangeCalendar(ABC):
         idx = self._get_session_idx(session, _parse=_parse)
         if not idx:
             raise errors.RequestedSessionOutOfBounds(self, True)
-        return self.schedule.index[idx - 1]
+        return _from_nanos(self.sessions_nanos[idx - 1], as_nanos, tz=None)
 
     def session_minutes(
         self, session: Session, _parse: bool = True
@@ -1227,10 +1378,8 @@ class ExchangeCalendar(ABC):
                 otherwise index position of session that immediately
                 follows `date`.
         """
-        date_ = parse_date(date, "date", self) if _parse else date
-        if TYPE_CHECKING:
-            assert isinstance(date_, pd.Timestamp)
-        return self.sessions_nanos.searchsorted(date_.value, side="left")
+        nanos = parse_date_nanos(date, "date", self) if _parse else date.value
+        return self.sessions_nanos.searchsorted(nanos, side="left")
 
     def _date_oob(self, date: pd.Timestamp) -> bool:
         """Is `date` out-of-bounds."""
@@ -1251,17 +1400,18 @@ class ExchangeCalendar(ABC):
         bool
             True if `date` is a session, False otherwise.
         """
-        if _parse:
-            date = parse_date(date, "date", self)
-        idx = self._get_date_idx(date, _parse=False)
-        return bool(self.sessions_nanos[idx] == date.value)  # convert from np.bool_
+        nanos = parse_date_nanos(date, "date", self) if _parse else date.value
+        idx = self.sessions_nanos.searchsorted(nanos, side="left")
+        return bool(self.sessions_nanos[idx] == nanos)  # convert from np.bool_
 
     def date_to_session(
         self,
         date: Date,
         direction: Literal["next", "previous", "none"] = "none",
         _parse: bool = True,
-    ) -> pd.Timestamp:
+        *,
+        as_nanos: bool = False,
+    ) -> pd.Timestamp | int:
         """Return a session corresponding to a given date.
 
         Parameters
@@ -1276,23 +1426,26 @@ class ExchangeCalendar(ABC):
                 "previous" - return first session prior to `date`.
                 "none" - raise ValueError.
 
+        as_nanos : default: False
+            True to return session as int nanoseconds.
+
         See Also
         --------
         next_session
         previous_session
         """
-        if _parse:
-            date = parse_date(date, calendar=self)
-        if self.is_session(date, _parse=False):
-            return date
+        nanos = parse_date_nanos(date, "date", self) if _parse else date.value
+        idx = self.sessions_nanos.searchsorted(nanos, side="left")
+        if self.sessions_nanos[idx] == nanos:
+            return _from_nanos(nanos, as_nanos, tz=None)
         elif direction in ["next", "previous"]:
-            idx = self._get_date_idx(date, _parse=False)
             if direction == "previous":
                 idx -= 1
-            return self.sessions[idx]
+            return _from_nanos(self.sessions_nanos[idx], as_nanos, tz=None)
         elif direction == "none":
             raise ValueError(
-                f"`date` '{date}' does not represent a session. Consider passing"
+                f"`date` '{pd.Timestamp(nanos)}' does not represent a session."
+                " Consider passing"
                 " a `direction`."
             )
         else:
@@ -1314,14 +1467,16 @@ class ExchangeCalendar(ABC):
         """
         if _parse:
             minute = parse_timestamp(minute, "minute", self)
-        return self.minutes_nanos.searchsorted(minute.value, side="left")
+        return self._minute_index.searchsorted(minute.value, side="left")
+
+    def _get_minute_nanos(self, minute: Minute, _parse=True) -> int:
+        """Minute as nanoseconds (UTC)."""
+        return parse_timestamp_nanos(minute, "minute", self) if _parse else minute.value
 
     def _minute_oob(self, minute: Minute) -> bool:
         """Is `minute` out-of-bounds."""
-        return (
-            minute.value < self.minutes_nanos[0]
-            or minute.value > self.minutes_nanos[-1]
-        )
+        minute_index = self._minute_index
+        return minute.value < minute_index.first or minute.value > minute_index.last
 
     def is_trading_minute(self, minute: Minute, _parse: bool = True) -> bool:
         """Query if a given minute is a trading minute.
@@ -1347,11 +1502,9 @@ class ExchangeCalendar(ABC):
         is_open_on_minute
         is_open_at_time
         """
-        if _parse:
-            minute = parse_timestamp(minute, calendar=self)
-        idx = self._get_minute_idx(minute, _parse=False)
+        nanos = self._get_minute_nanos(minute, _parse)
         # convert from np.bool_
-        return bool(self.minutes_nanos[idx] == minute.value)
+        return bool(self._minute_index.contains(nanos))
 
     def is_break_minute(self, minute: Minute, _parse: bool = True) -> bool:
         """Query if a given minute is within a break.
@@ -1369,14 +1522,8 @@ class ExchangeCalendar(ABC):
         bool
             Boolean indicting if `minute` is a break minute.
         """
-        if _parse:
-            minute = parse_timestamp(minute, calendar=self)
-        session_idx = np.searchsorted(self.first_minutes_nanos, minute.value) - 1
-        break_start = self.last_am_minutes_nanos[session_idx]
-        break_end = self.first_pm_minutes_nanos[session_idx]
-        # NaT comparisions evalute as False
-        numpy_bool = break_start < minute.value < break_end
-        return bool(numpy_bool)
+        nanos = self._get_minute_nanos(minute, _parse)
+        return bool(self._is_break_minutes_nanos(nanos))
 
     def is_open_on_minute(
         self, minute: Minute, ignore_breaks: bool = False, _parse: bool = True
@@ -1407,19 +1554,12 @@ class ExchangeCalendar(ABC):
         is_trading_minute
         is_open_at_time
         """
-        if _parse:
-            minute = parse_timestamp(minute, "minute", self)
-
-        is_trading_minute = self.is_trading_minute(minute, _parse=False)
-        if is_trading_minute or not ignore_breaks:
-            return is_trading_minute
-        else:
-            # not a trading minute although should return True if in break
-            return self.is_break_minute(minute, _parse=False)
+        nanos = self._get_minute_nanos(minute, _parse)
+        return bool(self._is_open_on_minutes_nanos(nanos, ignore_breaks))
 
     def is_open_at_time(
         self,
-        timestamp: pd.Timestamp,
+        timestamp: pd.Timestamp | np.datetime64 | int,
         side: Literal["left", "right", "both", "neither"] = "left",
         ignore_breaks: bool = False,
     ) -> bool:
@@ -1440,6 +1580,10 @@ class ExchangeCalendar(ABC):
 
             If timezone naive then will be assumed as representing UTC.
 
+            Can also be passed as a np.datetime64 (assumed as representing
+            UTC) or as an int representing nanoseconds since epoch (UTC),
+            in which case no pandas object is created.
+
         side
             Determines whether the exchange will be considered open or
             closed on a session's open, close, break-start and break-end:
@@ -1473,40 +1617,126 @@ class ExchangeCalendar(ABC):
         is_trading_minute
         is_open_on_minute
         """
-        ts = timestamp
-        if not isinstance(ts, pd.Timestamp):
-            raise TypeError(
-                "`timestamp` expected to receive type pd.Timestamp although"
-                f" got type {type(ts)}."
-            )
-
-        if ts.tz is not UTC:
-            ts = ts.tz_localize(UTC) if ts.tz is None else ts.tz_convert(UTC)
+        nanos = _as_nanos(timestamp)
+        if nanos is None:
+            ts = timestamp
+            if not isinstance(ts, pd.Timestamp):
+                raise TypeError(
+                    "`timestamp` expected to receive type pd.Timestamp although"
+                    f" got type {type(ts)}."
+                )
+            if ts.tz is not UTC:
+                ts = ts.tz_localize(UTC) if ts.tz is None else ts.tz_convert(UTC)
+            nanos = ts.value
 
-        if self._minute_oob(ts):
+        minute_index = self._minute_index
+        if nanos < minute_index.first or nanos > minute_index.last:
+            ts = pd.Timestamp(nanos, tz=UTC)
             raise errors.MinuteOutOfBounds(self, ts, "timestamp")
 
-        op_left = operator.le if side in self._LEFT_SIDES else operator.lt
-        op_right = operator.le if side in self._RIGHT_SIDES else operator.lt
+        return bool(self._is_open_at_nanos(nanos, side, ignore_breaks))
+
+    def is_open_at_times(
+        self,
+        timestamps: Minutes,
+        side: Literal["left", "right", "both", "neither"] = "left",
+        ignore_breaks: bool = False,
+    ) -> np.ndarray:
+        """Query if exchange is open at each of multiple timestamps.
+
+        Array equivalent of `is_open_at_time`.
+
+        Parameters
+        ----------
+        timestamps
+            Timestamps being queried. Can have any resolution. Can be
+            passed as any of:
+                pd.DatetimeIndex. If timezone naive then assumed as UTC.
+                numpy array of dtype datetime64 (any unit), assumed as
+                    UTC.
+                numpy array of dtype int64, assumed as nanoseconds since
+                    epoch (UTC).
+                Any other valid single-argument input to
+                    pd.DatetimeIndex.
+
+        side
+            As `is_open_at_time`.
+
+        ignore_breaks
+            As `is_open_at_time`.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array indicting if exchange is open at corresponding
+            timestamp.
+        """
+        nanos, _ = _to_nanos_array(timestamps, "timestamps", utc=True)
+        minute_index = self._minute_index
+        oob = (nanos < minute_index.first) | (nanos > minute_index.last)
+        if oob.any():
+            ts = pd.Timestamp(nanos[oob.nonzero()[0][0]], tz=UTC)
+            raise errors.MinuteOutOfBounds(self, ts, "timestamps")
+        return self._is_open_at_nanos(nanos, side, ignore_breaks)
 
-        nano = ts.value
-        if not self.has_break or ignore_breaks:
-            # only one check requried
-            bv = op_left(self.opens_nanos, nano) & op_right(nano, self.closes_nanos)
-            return bv.any()
+    @functools.cached_property
+    def _session_bounds_nanos(self) -> np.ndarray:
+        """Sessions' bounds interleaved as [open, close, open, close...]."""
+        return np.column_stack((self.opens_nanos, self.closes_nanos)).ravel()
 
-        break_starts_nanos = self.break_starts_nanos.copy()
-        bv_missing = self.break_starts.isna()
-        close_replacement = self.closes_nanos[bv_missing]
-        break_starts_nanos[bv_missing] = close_replacement
-        break_ends_nanos = self.break_ends_nanos.copy()
-        break_ends_nanos[bv_missing] = close_replacement
+    @functools.cached_property
+    def _subsession_bounds_nanos(self) -> np.ndarray:
+        """Subsessions' bounds interleaved as [open, close, open, close...].
 
-        bv_am = op_left(self.opens_nanos, nano) & op_right(nano, break_starts_nanos)
-        bv_pm = op_left(break_ends_nanos, nano) & op_right(nano, self.closes_nanos)
-        return (bv_am | bv_pm).any()
+        Sessions with a break are represented by two subsessions, with
+        the close of the first as the break start and the open of the
+        second as the break end.
+        """
+        bounds = np.column_stack(
+            (
+                self.opens_nanos,
+                self.break_starts_nanos,
+                self.break_ends_nanos,
+                self.closes_nanos,
+            )
+        ).ravel()
+        return bounds[bounds != NP_NAT]
 
-    def next_open(self, minute: Minute, _parse: bool = True) -> pd.Timestamp:
+    def _is_open_at_nanos(
+        self,
+        nanos: int | np.ndarray,
+        side: Literal["left", "right", "both", "neither"],
+        ignore_breaks: bool,
+    ) -> bool | np.ndarray:
+        """Query if exchange is open at timestamp(s) as nanoseconds.
+
+        An odd number of (sub)session bounds preceeding a timestamp
+        indicates that the timestamp lies within a (sub)session. Bounds
+        that coincide with the timestamp are included to the count or not
+        depending on `side`. Where a close coincides with the next open
+        both are included or both excluded, such that the timestamp is
+        considered open unless `side` is "neither".
+        """
+        if ignore_breaks:
+            bounds = self._session_bounds_nanos
+        else:
+            # for sessions without a break, subsession bounds are session bounds
+            bounds = self._subsession_bounds_nanos
+
+        if side == "left":
+            return bounds.searchsorted(nanos, side="right") % 2 == 1
+        if side == "right":
+            return bounds.searchsorted(nanos, side="left") % 2 == 1
+        idx_left = bounds.searchsorted(nanos, side="left")
+        idx_right = bounds.searchsorted(nanos, side="right")
+        if side == "both":
+            return (idx_left % 2 == 1) | (idx_right % 2 == 1)
+        # "neither", open only if timestamp does not coincide with any bound
+        return (idx_left % 2 == 1) & (idx_left == idx_right)
+
+    def next_open(
+        self, minute: Minute, _parse: bool = True, *, as_nanos: bool = False
+    ) -> pd.Timestamp | int:
         """Return next open that follows a given minute.
 
         If `minute` is a session open, the next session's open will be
@@ -1522,22 +1752,23 @@ class ExchangeCalendar(ABC):
         pd.Timestamp
             UTC timestamp of the next open.
         """
-        if _parse:
-            minute = parse_timestamp(minute, "minute", self)
+        nanos = self._get_minute_nanos(minute, _parse)
         try:
-            idx = next_divider_idx(self.opens_nanos, minute.value)
+            idx = next_divider_idx(self.opens_nanos, nanos)
         except IndexError:
-            if minute >= self.opens.iloc[-1]:
+            if nanos >= self.opens_nanos[-1]:
                 raise ValueError(
                     "Minute cannot be the last open or later (received `minute`"
-                    f" parsed as '{minute}'.)"
+                    f" parsed as '{pd.Timestamp(nanos, tz=UTC)}'.)"
                 ) from None
             else:
                 raise
 
-        return pd.Timestamp(self.opens_nanos[idx], tz=UTC)
+        return _from_nanos(self.opens_nanos[idx], as_nanos)
 
-    def next_close(self, minute: Minute, _parse: bool = True) -> pd.Timestamp:
+    def next_close(
+        self, minute: Minute, _parse: bool = True, *, as_nanos: bool = False
+    ) -> pd.Timestamp | int:
         """Return next close that follows a given minute.
 
         If `minute` is a session close, the next session's close will be
@@ -1553,21 +1784,22 @@ class ExchangeCalendar(ABC):
         pd.Timestamp
             UTC timestamp of the next close.
         """
-        if _parse:
-            minute = parse_timestamp(minute, "minute", self)
+        nanos = self._get_minute_nanos(minute, _parse)
         try:
-            idx = next_divider_idx(self.closes_nanos, minute.value)
+            idx = next_divider_idx(self.closes_nanos, nanos)
         except IndexError:
-            if minute == self.closes.iloc[-1]:
+            if nanos == self.closes_nanos[-1]:
                 raise ValueError(
                     "Minute cannot be the last close (received `minute` parsed as"
-                    f" '{minute}'.)"
+                    f" '{pd.Timestamp(nanos, tz=UTC)}'.)"
                 ) from None
             else:
                 raise
-        return pd.Timestamp(self.closes_nanos[idx], tz=UTC)
+        return _from_nanos(self.closes_nanos[idx], as_nanos)
 
-    def previous_open(self, minute: Minute, _parse: bool = True) -> pd.Timestamp:
+    def previous_open(
+        self, minute: Minute, _parse: bool = True, *, as_nanos: bool = False
+    ) -> pd.Timestamp | int:
         """Return previous open that preceeds a given minute.
 
         If `minute` is a session open, the previous session's open will be
@@ -1583,22 +1815,23 @@ class ExchangeCalendar(ABC):
         pd.Timestamp
             UTC timestamp of the previous open.
         """
-        if _parse:
-            minute = parse_timestamp(minute, "minute", self)
+        nanos = self._get_minute_nanos(minute, _parse)
         try:
-            idx = previous_divider_idx(self.opens_nanos, minute.value)
+            idx = previous_divider_idx(self.opens_nanos, nanos)
         except ValueError:
-            if minute == self.opens.iloc[0]:
+            if nanos == self.opens_nanos[0]:
                 raise ValueError(
                     "Minute cannot be the first open (received `minute` parsed as"
-                    f" '{minute}'.)"
+                    f" '{pd.Timestamp(nanos, tz=UTC)}'.)"
                 ) from None
             else:
                 raise
 
-        return pd.Timestamp(self.opens_nanos[idx], tz=UTC)
+        return _from_nanos(self.opens_nanos[idx], as_nanos)
 
-    def previous_close(self, minute: Minute, _parse: bool = True) -> pd.Timestamp:
+    def previous_close(
+        self, minute: Minute, _parse: bool = True, *, as_nanos: bool = False
+    ) -> pd.Timestamp | int:
         """Return previous close that preceeds a given minute.
 
         If `minute` is a session close, the previous session's close will be
@@ -1614,22 +1847,23 @@ class ExchangeCalendar(ABC):
         pd.Timestamp
             UTC timestamp of the previous close.
         """
-        if _parse:
-            minute = parse_timestamp(minute, "minute", self)
+        nanos = self._get_minute_nanos(minute, _parse)
         try:
-            idx = previous_divider_idx(self.closes_nanos, minute.value)
+            idx = previous_divider_idx(self.closes_nanos, nanos)
         except ValueError:
-            if minute <= self.closes.iloc[0]:
+            if nanos <= self.closes_nanos[0]:
                 raise ValueError(
                     "Minute cannot be the first close or earlier (received"
-                    f" `minute` parsed as '{minute}'.)"
+                    f" `minute` parsed as '{pd.Timestamp(nanos, tz=UTC)}'.)"
                 ) from None
             else:
                 raise
 
-        return pd.Timestamp(self.closes_nanos[idx], tz=UTC)
+        return _from_nanos(self.closes_nanos[idx], as_nanos)
 
-    def next_minute(self, minute: Minute, _parse: bool = True) -> pd.Timestamp:
+    def next_minute(
+        self, minute: Minute, _parse: bool = True, *, as_nanos: bool = False
+    ) -> pd.Timestamp | int:
         """Return trading minute that immediately follows a given minute.
 
         Parameters
@@ -1648,17 +1882,19 @@ class ExchangeCalendar(ABC):
         errors.RequestedSessionOutOfBounds
             If `minute` is the last calendar minute.
         """
-        if _parse:
-            minute = parse_timestamp(minute, "minute", self)
+        nanos = self._get_minute_nanos(minute, _parse)
+        idx = self._minute_index.searchsorted(nanos, side="right")
         try:
-            idx = next_divider_idx(self.minutes_nanos, minute.value)
+            return _from_nanos(self._minute_index[idx], as_nanos)
         except IndexError:
             # dt > last_minute handled via parsing
-            if minute == self.last_minute:
+            if nanos == self._minute_index.last:
                 raise errors.RequestedMinuteOutOfBounds(self, False) from None
-        return self.minutes[idx]
+            raise
 
-    def previous_minute(self, minute: Minute, _parse: bool = True) -> pd.Timestamp:
+    def previous_minute(
+        self, minute: Minute, _parse: bool = True, *, as_nanos: bool = False
+    ) -> pd.Timestamp | int:
         """Return trading minute that immediately preceeds a given minute.
 
         Parameters
@@ -1677,22 +1913,21 @@ class ExchangeCalendar(ABC):
         errors.RequestedSessionOutOfBounds
             If `minute` is the first calendar minute.
         """
-        if _parse:
-            minute = parse_timestamp(minute, "minute", self)
-        try:
-            idx = previous_divider_idx(self.minutes_nanos, minute.value)
-        except ValueError:
+        nanos = self._get_minute_nanos(minute, _parse)
+        idx = self._minute_index.searchsorted(nanos, side="left")
+        if not idx:
             # dt < first_minute handled via parsing
-            if minute == self.first_minute:
-                raise errors.RequestedMinuteOutOfBounds(self, True) from None
-        return self.minutes[idx]
+            raise errors.RequestedMinuteOutOfBounds(self, True)
+        return _from_nanos(self._minute_index[idx - 1], as_nanos)
 
     def minute_to_session(
         self,
         minute: Minute,
         direction: Literal["next", "previous", "none"] = "next",
         _parse: bool = True,
-    ) -> pd.Timestamp:
+        *,
+        as_nanos: bool = False,
+    ) -> pd.Timestamp | int:
         """Get session corresponding with a trading or break minute.
 
         Parameters
@@ -1708,9 +1943,12 @@ class ExchangeCalendar(ABC):
                 "previous" - return first session prior to `minute`.
                 "none" - raise ValueError.
 
+        as_nanos : default: False
+            True to return session as int nanoseconds.
+
         Returns
         -------
-        pd.Timestamp
+        pd.Timestamp | int
             Corresponding session label.
 
         Raises
@@ -1724,51 +1962,51 @@ class ExchangeCalendar(ABC):
         minute_to_future_session
         session_offset
         """
-        if _parse:
-            minute = parse_timestamp(minute, calendar=self)
+        nanos = self._get_minute_nanos(minute, _parse)
 
-        if minute.value < self.minutes_nanos[0]:
+        if nanos < self._minute_index.first:
             # Resolve call here.
             if direction == "next":
-                return self.first_session
+                return _from_nanos(self.sessions_nanos[0], as_nanos, tz=None)
             else:
+                minute = pd.Timestamp(nanos, tz=UTC)
                 raise ValueError(
                     f"Received `minute` as '{minute}' although this is earlier than the"
                     f" calendar's first trading minute ({self.first_minute}). Consider"
                     " passing `direction` as 'next' to get first session."
                 )
 
-        if minute.value > self.minutes_nanos[-1]:
+        if nanos > self._minute_index.last:
             # Resolve call here.
             if direction == "previous":
-                return self.last_session
+                return _from_nanos(self.sessions_nanos[-1], as_nanos, tz=None)
             else:
+                minute = pd.Timestamp(nanos, tz=UTC)
                 raise ValueError(
                     f"Received `minute` as '{minute}' although this is later than the"
                     f" calendar's last trading minute ({self.last_minute}). Consider"
                     " passing `direction` as 'previous' to get last session."
                 )
 
-        idx = np.searchsorted(self.last_minutes_nanos, minute.value)
-        current_or_next_session = self.schedule.index[idx]
+        idx = np.searchsorted(self.last_minutes_nanos, nanos)
 
         if direction == "next":
-            return current_or_next_session
+            pass
         elif direction == "previous":
-            if not self.is_open_on_minute(minute, ignore_breaks=True, _parse=False):
-                return self.schedule.index[idx - 1]
+            if not self._is_open_on_minutes_nanos(nanos, ignore_breaks=True):
+                idx -= 1
         elif direction == "none":
-            if not self.is_open_on_minute(minute, ignore_breaks=True, _parse=False):
+            if not self._is_open_on_minutes_nanos(nanos, ignore_breaks=True):
                 # if the exchange is closed, blow up
                 raise ValueError(
-                    f"`minute` '{minute}' is not a trading minute. Consider passing"
-                    " `direction` as 'next' or 'previous'."
+                    f"`minute` '{pd.Timestamp(nanos, tz=UTC)}' is not a trading"
+                    " minute. Consider passing `direction` as 'next' or 'previous'."
                 )
         else:
             # invalid direction
             raise ValueError(f"Invalid direction parameter: {direction}")
 
-        return current_or_next_session
+        return _from_nanos(self.sessions_nanos[idx], as_nanos, tz=None)
 
     def minute_to_past_session(
         self, minute: Minute, count: int = 1, _parse: bool = True
@@ -1859,7 +2097,9 @@ class ExchangeCalendar(ABC):
         minute: Minute,
         direction: Literal["next", "previous", "none"] = "none",
         _parse: bool = True,
-    ) -> pd.Timestamp:
+        *,
+        as_nanos: bool = False,
+    ) -> pd.Timestamp | int:
         """Resolve a minute to a trading minute.
 
         Differs from `previous_minute` and `next_minute` by returning
@@ -1878,9 +2118,12 @@ class ExchangeCalendar(ABC):
                     preceeds `minute`.
                 'none' - raise KeyError
 
+        as_nanos : default: False
+            True to return trading minute as int nanoseconds (UTC).
+
         Returns
         -------
-        pd.Timestamp
+        pd.Timestamp | int
             Returns `minute` if `minute` is a trading minute otherwise
             first trading minute that, in accordance with `direction`,
             either immediately follows or preceeds `minute`.
@@ -1895,18 +2138,17 @@ class ExchangeCalendar(ABC):
         next_mintue
         previous_minute
         """
-        if _parse:
-            minute = parse_timestamp(minute, calendar=self)
-        if self.is_trading_minute(minute, _parse=False):
-            return minute
+        nanos = self._get_minute_nanos(minute, _parse)
+        if self._minute_index.contains(nanos):
+            return _from_nanos(nanos, as_nanos)
         elif direction == "next":
-            return self.next_minute(minute, _parse=False)
+            return self.next_minute(nanos, as_nanos=as_nanos)
         elif direction == "previous":
-            return self.previous_minute(minute, _parse=False)
+            return self.previous_minute(nanos, as_nanos=as_nanos)
         else:
             raise ValueError(
-                f"`minute` '{minute}' is not a trading minute. Consider passing"
-                " `direction` as 'next' or 'previous'."
+                f"`minute` '{pd.Timestamp(nanos, tz=UTC)}' is not a trading minute."
+                " Consider passing `direction` as 'next' or 'previous'."
             )
 
     def minute_offset(
@@ -1937,11 +2179,11 @@ class ExchangeCalendar(ABC):
         if _parse:
             minute = parse_trading_minute(self, minute)
         idx = self._get_minute_idx(minute) + count
-        if idx >= len(self.minutes_nanos):
+        if idx >= len(self._minute_index):
             raise errors.RequestedMinuteOutOfBounds(self, too_early=False)
         elif idx < 0:
             raise errors.RequestedMinuteOutOfBounds(self, too_early=True)
-        return self.minutes[idx]
+        return pd.Timestamp(self._minute_index[idx], tz=UTC)
 
     def minute_offset_by_sessions(
         self,
@@ -1994,9 +2236,9 @@ class ExchangeCalendar(ABC):
         minute += pd.Timedelta(days=day_offset)
 
         if self._minute_oob(minute):
-            if minute.value < self.minutes_nanos[0]:
+            if minute.value < self._minute_index.first:
                 errors.RequestedMinuteOutOfBounds(self, too_early=True)
-            if minute.value > self.minutes_nanos[-1]:
+            if minute.value > self._minute_index.last:
                 raise errors.RequestedMinuteOutOfBounds(self, too_early=False)
 
         if self.is_trading_minute(minute, _parse=False):
@@ -2023,8 +2265,8 @@ class ExchangeCalendar(ABC):
         if _parse:
             start = parse_timestamp(start, "start", self)
             end = parse_timestamp(end, "end", self)
-        slice_start = self.minutes_nanos.searchsorted(start.value, side="left")
-        slice_end = self.minutes_nanos.searchsorted(end.value, side="right")
+        slice_start = self._minute_index.searchsorted(start.value, side="left")
+        slice_end = self._minute_index.searchsorted(end.value, side="right")
         return slice(slice_start, slice_end)
 
     def minutes_in_range(
@@ -2043,7 +2285,7 @@ class ExchangeCalendar(ABC):
             minute or non-trading minute.
         """
         slc = self._get_minutes_slice(start, end, _parse)
-        return self.minutes[slc]
+        return self._minutes_from_nanos(self._minute_index[slc])
 
     def minutes_window(
         self, minute: TradingMinute, count: int, _parse: bool = True
@@ -2075,14 +2317,15 @@ class ExchangeCalendar(ABC):
                 f" ({self.first_minute}). `count` cannot be lower than"
                 f" {count - end_idx} for `minute` '{minute}'."
             )
-        elif end_idx >= len(self.minutes_nanos):
+        elif end_idx >= len(self._minute_index):
             raise ValueError(
                 f"Minutes window cannot end after the calendar's last minute"
                 f" ({self.last_minute}). `count` cannot be higher than"
-                f" {count - (end_idx - len(self.minutes_nanos) + 1)} for `minute`"
+                f" {count - (end_idx - len(self._minute_index) + 1)} for `minute`"
                 f" '{minute}'."
             )
-        return self.minutes[min(start_idx, end_idx) : max(start_idx, end_idx) + 1]
+        slc = slice(min(start_idx, end_idx), max(start_idx, end_idx) + 1)
+        return self._minutes_from_nanos(self._minute_index[slc])
 
     def minutes_distance(self, start: Minute, end: Minute, _parse: bool = True) -> int:
         """Return the number of minutes in a range.
@@ -2167,76 +2410,407 @@ class ExchangeCalendar(ABC):
 
         return self.schedule.index[prev_first_mins_idxs]
 
-    # Methods that evaluate or interrogate a range of sessions.
-
-    def _parse_start_end_dates(
-        self, start: Date, end: Date, _parse: bool
-    ) -> tuple[pd.Timestamp, pd.Timestamp]:
-        if not _parse:
-            return start, end
-        return parse_date(start, "start", self), parse_date(end, "end", self)
+    # Methods that interrogate multiple dates or minutes.
 
-    def _get_sessions_slice(self, start: Date, end: Date, _parse=True) -> slice:
-        """Slice representing a range of sessions."""
-        start, end = self._parse_start_end_dates(start, end, _parse)
-        slice_start = self.sessions_nanos.searchsorted(start.value, side="left")
-        slice_end = self.sessions_nanos.searchsorted(end.value, side="right")
-        return slice(slice_start, slice_end)
+    def is_sessions(self, dates: Dates) -> np.ndarray:
+        """Query if each of multiple dates is a session.
 
-    def sessions_in_range(
-        self, start: Date, end: Date, _parse: bool = True
-    ) -> pd.DatetimeIndex:
-        """Return sessions within a given range.
+        Array equivalent of `is_session`.
 
         Parameters
         ----------
-        start
-            Start of session range (range inclusive of `start`).
-
-        end
-            End of session range (range inclusive of `end`).
+        dates
+            Dates to query. See `calendar_helpers.parse_dates` for valid
+            input types.
 
         Returns
         -------
-        pd.DatetimeIndex
-            Sessions from `start` through `end`.
+        np.ndarray
+            Boolean array indicating if corresponding date is a session.
         """
-        slc = self._get_sessions_slice(start, end, _parse)
-        return self.sessions[slc]
+        nanos = parse_dates(dates, "dates", self)
+        idxs = self.sessions_nanos.searchsorted(nanos, side="left")
+        # oob dates raised by parsing, hence all idxs within bounds
+        return self.sessions_nanos[idxs] == nanos
 
-    def sessions_has_break(self, start: Date, end: Date, _parse: bool = True) -> bool:
-        """Query if at least one session in a session range has a break.
+    def session_indices(self, sessions: Dates) -> np.ndarray:
+        """Return index positions of multiple sessions.
+
+        Index positions can be used to index any of the calendar's session
+        based arrays. For example, the opens of `sessions` can be
+        evaluated as `calendar.opens_nanos[calendar.session_indices(sessions)]`
+        (array equivalent of `session_open`).
 
         Parameters
         ----------
-        start
-            Start of session range (range inclusive of `start`).
-
-        end
-            End of session range (range inclusive of `end`).
+        sessions
+            Sessions to query. See `calendar_helpers.parse_dates` for
+            valid input types.
 
         Returns
         -------
-        bool
-            True if any session in session range has a break, False otherwise.
+        np.ndarray
+            Index positions of `sessions` within `self.sessions`.
+
+        Raises
+        ------
+        errors.NotSessionError
+            If any of `sessions` is not a session.
         """
-        slc = self._get_sessions_slice(start, end, _parse)
-        return self.break_starts[slc].notna().any()
+        nanos = parse_dates(sessions, "sessions", raise_oob=False)
+        idxs = self.sessions_nanos.searchsorted(nanos, side="left")
+        values = self.sessions_nanos[np.minimum(idxs, len(self.sessions_nanos) - 1)]
+        not_session = values != nanos
+        if not_session.any():
+            ts = pd.Timestamp(nanos[not_session.nonzero()[0][0]])
+            raise errors.NotSessionError(self, ts, "sessions")
+        return idxs
+
+    def dates_to_session_indices(
+        self,
+        dates: Dates,
+        direction: Literal["next", "previous", "none"] = "none",
+    ) -> np.ndarray:
+        """Return index positions of sessions corresponding to multiple dates.
 
-    def sessions_window(
-        self, session: Session, count: int, _parse: bool = True
-    ) -> pd.DatetimeIndex:
-        """Return block of given size of consecutive sessions.
+        Array equivalent of `date_to_session`.
 
         Parameters
         ----------
-        session
-            Session representing the first (if `count` positive) or last
-            (if `count` negative) session of session window.
+        dates
+            Dates for which require sessions. See
+            `calendar_helpers.parse_dates` for valid input types.
 
-        count
-            Number of sessions to include in window.
-            Positive to return window of sessions from `session`
+        direction : default: "none"
+            As `date_to_session`.
+
+        Returns
+        -------
+        np.ndarray
+            Index positions within `self.sessions` of the sessions that
+            correspond with `dates`.
+        """
+        if direction not in ["next", "previous", "none"]:
+            raise ValueError(
+                f"'{direction}' is not a valid `direction`. Valid `direction`"
+                ' values are "next", "previous" and "none".'
+            )
+        nanos = parse_dates(dates, "dates", self)
+        idxs = self.sessions_nanos.searchsorted(nanos, side="left")
+        not_session = self.sessions_nanos[idxs] != nanos
+        if direction == "previous":
+            idxs[not_session] -= 1
+        elif direction == "none" and not_session.any():
+            ts = pd.Timestamp(nanos[not_session.nonzero()[0][0]])
+            raise ValueError(
+                f"`dates` includes '{ts}' which does not represent a session."
+                " Consider passing a `direction`."
+            )
+        return idxs
+
+    def is_trading_minutes(self, minutes: Minutes) -> np.ndarray:
+        """Query if each of multiple minutes is a trading minute.
+
+        Array equivalent of `is_trading_minute`.
+
+        Parameters
+        ----------
+        minutes
+            Minutes to query. See `calendar_helpers.parse_timestamps` for
+            valid input types.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array indicating if corresponding minute is a trading
+            minute.
+        """
+        nanos = parse_timestamps(minutes, "minutes", self)
+        return self._minute_index.contains(nanos)
+
+    def is_break_minutes(self, minutes: Minutes) -> np.ndarray:
+        """Query if each of multiple minutes is a break minute.
+
+        Array equivalent of `is_break_minute`.
+
+        Parameters
+        ----------
+        minutes
+            Minutes to query. See `calendar_helpers.parse_timestamps` for
+            valid input types.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array indicating if corresponding minute is a break
+            minute.
+        """
+        nanos = parse_timestamps(minutes, "minutes", self)
+        return self._is_break_minutes_nanos(nanos)
+
+    def _is_break_minutes_nanos(self, nanos: np.ndarray | int) -> np.ndarray | np.bool_:
+        session_idxs = self.first_minutes_nanos.searchsorted(nanos) - 1
+        break_starts = self.last_am_minutes_nanos[session_idxs]
+        break_ends = self.first_pm_minutes_nanos[session_idxs]
+        # NaT values are represented as the minimum int64, hence breaks of
+        # sessions without a break evaluate as False.
+        return (break_starts < nanos) & (nanos < break_ends)
+
+    def is_open_on_minutes(
+        self, minutes: Minutes, ignore_breaks: bool = False
+    ) -> np.ndarray:
+        """Query if exchange is open on each of multiple minutes.
+
+        Array equivalent of `is_open_on_minute`.
+
+        Parameters
+        ----------
+        minutes
+            Minutes to query. See `calendar_helpers.parse_timestamps` for
+            valid input types.
+
+        ignore_breaks
+            As `is_open_on_minute`.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array indicating if exchange is open on corresponding
+            minute.
+        """
+        nanos = parse_timestamps(minutes, "minutes", self)
+        return self._is_open_on_minutes_nanos(nanos, ignore_breaks)
+
+    def _is_open_on_minutes_nanos(
+        self, nanos: np.ndarray | int, ignore_breaks: bool
+    ) -> np.ndarray | np.bool_:
+        is_open = self._minute_index.contains(nanos)
+        if ignore_breaks:
+            is_open |= self._is_break_minutes_nanos(nanos)
+        return is_open
+
+    def minutes_to_session_indices(
+        self,
+        minutes: Minutes,
+        direction: Literal["next", "previous", "none"] = "next",
+    ) -> np.ndarray:
+        """Return index positions of sessions corresponding to minutes.
+
+        Array equivalent of `minute_to_session`.
+
+        Parameters
+        ----------
+        minutes
+            Minutes for which require corresponding sessions. See
+            `calendar_helpers.parse_timestamps` for valid input types.
+            Need not be sorted.
+
+        direction
+            As `minute_to_session`.
+
+        Returns
+        -------
+        np.ndarray
+            Index positions within `self.sessions` of the sessions that
+            correspond with `minutes`.
+
+        Raises
+        ------
+        ValueError
+            If `direction` is "none" and any of `minutes` is not a trading
+            or break minute.
+
+        See Also
+        --------
+        minutes_to_sessions
+        """
+        if direction not in ["next", "previous", "none"]:
+            raise ValueError(f"Invalid direction parameter: {direction}")
+        nanos = parse_timestamps(minutes, "minutes", self)
+        idxs = self.last_minutes_nanos.searchsorted(nanos)
+        if direction == "next":
+            return idxs
+        closed = ~self._is_open_on_minutes_nanos(nanos, ignore_breaks=True)
+        if direction == "previous":
+            idxs[closed] -= 1
+        elif closed.any():
+            ts = pd.Timestamp(nanos[closed.nonzero()[0][0]], tz=UTC)
+            raise ValueError(
+                f"`minutes` includes '{ts}' which is not a trading minute."
+                " Consider passing `direction` as 'next' or 'previous'."
+            )
+        return idxs
+
+    def _next_dividers_nanos(
+        self, dividers: np.ndarray, minutes: Minutes, name: str
+    ) -> np.ndarray:
+        nanos = parse_timestamps(minutes, "minutes", self)
+        idxs = dividers.searchsorted(nanos, side="right")
+        oob = idxs == len(dividers)
+        if oob.any():
+            ts = pd.Timestamp(nanos[oob.nonzero()[0][0]], tz=UTC)
+            raise ValueError(
+                f"`minutes` cannot include the last {name} or later (received"
+                f" `minutes` including '{ts}'.)"
+            )
+        return dividers[idxs]
+
+    def _previous_dividers_nanos(
+        self, dividers: np.ndarray, minutes: Minutes, name: str
+    ) -> np.ndarray:
+        nanos = parse_timestamps(minutes, "minutes", self)
+        idxs = dividers.searchsorted(nanos, side="left") - 1
+        oob = idxs < 0
+        if oob.any():
+            ts = pd.Timestamp(nanos[oob.nonzero()[0][0]], tz=UTC)
+            raise ValueError(
+                f"`minutes` cannot include the first {name} or earlier (received"
+                f" `minutes` including '{ts}'.)"
+            )
+        return dividers[idxs]
+
+    def next_opens_nanos(self, minutes: Minutes) -> np.ndarray:
+        """Return next opens that follow multiple minutes.
+
+        Array equivalent of `next_open`.
+
+        Parameters
+        ----------
+        minutes
+            Minutes for which to get the next open. See
+            `calendar_helpers.parse_timestamps` for valid input types.
+
+        Returns
+        -------
+        np.ndarray
+            int64 array of next opens as nanoseconds since epoch (UTC).
+        """
+        return self._next_dividers_nanos(self.opens_nanos, minutes, "open")
+
+    def next_closes_nanos(self, minutes: Minutes) -> np.ndarray:
+        """Return next closes that follow multiple minutes.
+
+        Array equivalent of `next_close`.
+
+        Parameters
+        ----------
+        minutes
+            Minutes for which to get the next close. See
+            `calendar_helpers.parse_timestamps` for valid input types.
+
+        Returns
+        -------
+        np.ndarray
+            int64 array of next closes as nanoseconds since epoch (UTC).
+        """
+        return self._next_dividers_nanos(self.closes_nanos, minutes, "close")
+
+    def previous_opens_nanos(self, minutes: Minutes) -> np.ndarray:
+        """Return previous opens that preceed multiple minutes.
+
+        Array equivalent of `previous_open`.
+
+        Parameters
+        ----------
+        minutes
+            Minutes for which to get the previous open. See
+            `calendar_helpers.parse_timestamps` for valid input types.
+
+        Returns
+        -------
+        np.ndarray
+            int64 array of previous opens as nanoseconds since epoch (UTC).
+        """
+        return self._previous_dividers_nanos(self.opens_nanos, minutes, "open")
+
+    def previous_closes_nanos(self, minutes: Minutes) -> np.ndarray:
+        """Return previous closes that preceed multiple minutes.
+
+        Array equivalent of `previous_close`.
+
+        Parameters
+        ----------
+        minutes
+            Minutes for which to get the previous close. See
+            `calendar_helpers.parse_timestamps` for valid input types.
+
+        Returns
+        -------
+        np.ndarray
+            int64 array of previous closes as nanoseconds since epoch (UTC).
+        """
+        return self._previous_dividers_nanos(self.closes_nanos, minutes, "close")
+
+    # Methods that evaluate or interrogate a range of sessions.
+
+    def _parse_start_end_dates(
+        self, start: Date, end: Date, _parse: bool
+    ) -> tuple[pd.Timestamp, pd.Timestamp]:
+        if not _parse:
+            return start, end
+        return parse_date(start, "start", self), parse_date(end, "end", self)
+
+    def _get_sessions_slice(self, start: Date, end: Date, _parse=True) -> slice:
+        """Slice representing a range of sessions."""
+        start, end = self._parse_start_end_dates(start, end, _parse)
+        slice_start = self.sessions_nanos.searchsorted(start.value, side="left")
+        slice_end = self.sessions_nanos.searchsorted(end.value, side="right")
+        return slice(slice_start, slice_end)
+
+    def sessions_in_range(
+        self, start: Date, end: Date, _parse: bool = True
+    ) -> pd.DatetimeIndex:
+        """Return sessions within a given range.
+
+        Parameters
+        ----------
+        start
+            Start of session range (range inclusive of `start`).
+
+        end
+            End of session range (range inclusive of `end`).
+
+        Returns
+        -------
+        pd.DatetimeIndex
+            Sessions from `start` through `end`.
+        """
+        slc = self._get_sessions_slice(start, end, _parse)
+        return self.sessions[slc]
+
+    def sessions_has_break(self, start: Date, end: Date, _parse: bool = True) -> bool:
+        """Query if at least one session in a session range has a break.
+
+        Parameters
+        ----------
+        start
+            Start of session range (range inclusive of `start`).
+
+        end
+            End of session range (range inclusive of `end`).
+
+        Returns
+        -------
+        bool
+            True if any session in session range has a break, False otherwise.
+        """
+        slc = self._get_sessions_slice(start, end, _parse)
+        return self.break_starts[slc].notna().any()
+
+    def sessions_window(
+        self, session: Session, count: int, _parse: bool = True
+    ) -> pd.DatetimeIndex:
+        """Return block of given size of consecutive sessions.
+
+        Parameters
+        ----------
+        session
+            Session representing the first (if `count` positive) or last
+            (if `count` negative) session of session window.
+
+        count
+            Number of sessions to include in window.
+            Positive to return window of sessions from `session`
             Negative to return window of sessions to `session`.
         """
         if not count:
@@ -2351,7 +2925,13 @@ class ExchangeCalendar(ABC):
         align: pd.Timedelta | str = pd.Timedelta(1, "min"),
         align_pm: pd.Timedelta | bool = True,
         parse: bool = True,
-    ) -> pd.DatetimeIndex | pd.IntervalIndex:
+        as_nanos: bool = False,
+    ) -> (
+        pd.DatetimeIndex
+        | pd.IntervalIndex
+        | tuple[np.ndarray, np.ndarray]
+        | tuple[np.ndarray, np.ndarray, np.ndarray]
+    ):
         """Create a trading index.
 
         Create a trading index of given `period` over a given range of
@@ -2585,15 +3165,33 @@ class ExchangeCalendar(ABC):
                 nearest occurence of this fraction of an hour. Valid values
                 as for `align`.
 
+        as_nanos : default: False
+            True to return the trading index as raw numpy arrays, without
+            the overhead of creating a pd.DatetimeIndex or
+            pd.IntervalIndex. See Returns section.
+
         Returns
         -------
-        pd.IntervalIndex or pd.DatetimeIndex
+        pd.IntervalIndex or pd.DatetimeIndex or tuple of np.ndarray
             Trading index.
 
             If `intervals` is False or `period` is '1d' then returned as a
                 pd.DatetimeIndex.
             If `intervals` is True (default) returned as pd.IntervalIndex.
 
+            If `as_nanos` is True then returned as a tuple of int64
+            np.ndarray with values as nanoseconds since epoch (UTC):
+                If `intervals` is False or `period` is '1d':
+                    [0] indices.
+                    [1] index (position) of session of each indice.
+                If `intervals` is True:
+                    [0] left side of intervals.
+                    [1] right side of intervals.
+                    [2] index (position) of session of each interval.
+            Session positions are positions in `sessions`, i.e. the
+            session of each indice is `sessions_nanos[rtrn[-1]]`. Arrays
+            can be viewed as datetime64 with `.view("datetime64[ns]")`.
+
         Raises
         ------
         exchange_calendars.errors.IntervalsOverlapError
@@ -2613,6 +3211,136 @@ class ExchangeCalendar(ABC):
         variation of which is employed within the underlying _TradingIndex
         class).
         """
+        period = self._parse_trading_index_period(period)
+        if period == pd.Timedelta(1, "D"):
+            start, end = self._parse_start_end_dates(start, end, parse)
+            if as_nanos:
+                slc = self._get_sessions_slice(start, end, _parse=False)
+                return self.sessions_nanos[slc], np.arange(slc.start, slc.stop)
+            return self.sessions_in_range(start, end)
+
+        _trading_index = self._get_trading_index(
+            start,
+            end,
+            period,
+            intervals,
+            closed,
+            force_close,
+            force_break_close,
+            force,
+            curtail_overlaps,
+            ignore_breaks,
+            align,
+            align_pm,
+        )
+        if self._trading_index_cache is not None:
+            return self._trading_index_cache.trading_index(
+                _trading_index, intervals, as_nanos
+            )
+        if not intervals:
+            if as_nanos:
+                return _trading_index.trading_index_nanos()
+            return _trading_index.trading_index()
+        else:
+            if as_nanos:
+                return _trading_index.trading_index_intervals_nanos()
+            return _trading_index.trading_index_intervals()
+
+    def iter_trading_index(
+        self,
+        start: Date | Minute,
+        end: Date | Minute,
+        period: pd.Timedelta | str,
+        chunk_sessions: int = 250,
+        intervals: bool = True,
+        closed: Literal["left", "right", "both", "neither"] = "left",
+        force_close: bool = False,
+        force_break_close: bool = False,
+        force: bool | None = None,
+        curtail_overlaps: bool = False,
+        ignore_breaks: bool = False,
+        align: pd.Timedelta | str = pd.Timedelta(1, "min"),
+        align_pm: pd.Timedelta | bool = True,
+        parse: bool = True,
+        as_nanos: bool = False,
+    ) -> Iterator[pd.DatetimeIndex | pd.IntervalIndex | tuple[np.ndarray, ...]]:
+        """Iterate over a trading index in chunks of sessions.
+
+        Iterates over the trading index that would be returned by
+        `trading_index` for the same arguments, yielding the index in
+        chunks that each cover `chunk_sessions` sessions (the final chunk
+        may cover fewer). Concatenating the chunks gives the same index as
+        `trading_index` although peak memory is bounded by the size of each
+        chunk rather than the full index.
+
+        Overlaps are evaluated as for `trading_index` across the whole
+        range, including between the last indice of a chunk and the first
+        indice of the next chunk.
+
+        Parameters
+        ----------
+        chunk_sessions : default: 250
+            Number of sessions to cover with each chunk.
+
+        All other parameters as `trading_index`.
+
+        Yields
+        ------
+        pd.IntervalIndex or pd.DatetimeIndex or tuple of np.ndarray
+            Chunk of trading index, as `trading_index`.
+
+        Raises
+        ------
+        Errors as `trading_index`. Invalid arguments and any
+        `IndicesOverlapError` will be raised on calling the method. If
+        `intervals` is True and `curtail_overlaps` is False then any
+        `IntervalsOverlapError` will be raised when the chunk that
+        includes the overlapping interval is evaluated.
+        """
+        if not isinstance(chunk_sessions, int) or chunk_sessions < 1:
+            raise ValueError(
+                "`chunk_sessions` must be a positive integer although received"
+                f" '{chunk_sessions}'."
+            )
+
+        period = self._parse_trading_index_period(period)
+        if period == pd.Timedelta(1, "D"):
+            start, end = self._parse_start_end_dates(start, end, parse)
+            slc = self._get_sessions_slice(start, end, _parse=False)
+            if as_nanos:
+
+                def iterator():
+                    sessions = self.sessions_nanos
+                    for i in range(slc.start, slc.stop, chunk_sessions):
+                        stop = min(i + chunk_sessions, slc.stop)
+                        yield sessions[i:stop], np.arange(i, stop)
+
+                return iterator()
+            sessions = self.sessions[slc]
+            return (
+                sessions[i : i + chunk_sessions]
+                for i in range(0, len(sessions), chunk_sessions)
+            )
+
+        _trading_index = self._get_trading_index(
+            start,
+            end,
+            period,
+            intervals,
+            closed,
+            force_close,
+            force_break_close,
+            force,
+            curtail_overlaps,
+            ignore_breaks,
+            align,
+            align_pm,
+        )
+        return _trading_index.iter_trading_index(chunk_sessions, intervals, as_nanos)
+
+    @staticmethod
+    def _parse_trading_index_period(period: pd.Timedelta | str) -> pd.Timedelta:
+        """Parse and validate `period` parameter of trading index methods."""
         if not isinstance(period, pd.Timedelta):
             try:
                 period = pd.Timedelta(period)
@@ -2631,11 +3359,28 @@ class ExchangeCalendar(ABC):
                 f" '{period}'."
             )
             raise ValueError(msg)
+        return period
 
-        if period == pd.Timedelta(1, "D"):
-            start, end = self._parse_start_end_dates(start, end, parse)
-            return self.sessions_in_range(start, end)
-
+    def _get_trading_index(
+        self,
+        start: Date | Minute,
+        end: Date | Minute,
+        period: pd.Timedelta,
+        intervals: bool,
+        closed: Literal["left", "right", "both", "neither"],
+        force_close: bool,
+        force_break_close: bool,
+        force: bool | None,
+        curtail_overlaps: bool,
+        ignore_breaks: bool,
+        align: pd.Timedelta | str,
+        align_pm: pd.Timedelta | bool,
+    ) -> _TradingIndex:
+        """Validate trading index arguments and get _TradingIndex instance.
+
+        Parameters as `trading_index`, except `period` should be passed as
+        parsed by `_parse_trading_index_period` and cannot be one day.
+        """
         if intervals and closed in ["both", "neither"]:
             raise ValueError(
                 f"If `intervals` is True then `closed` cannot be '{closed}'."
@@ -2689,8 +3434,7 @@ class ExchangeCalendar(ABC):
         if force is not None:
             force_close = force_break_close = force
 
-        # method exposes public methods of _TradingIndex.
-        _trading_index = _TradingIndex(
+        return _TradingIndex(
             self,
             start,
             end,
@@ -2704,13 +3448,881 @@ class ExchangeCalendar(ABC):
             align_pm,
         )
 
-        if not intervals:
-            return _trading_index.trading_index()
+    def trading_index_cache_enable(self, maxbytes: int = 256 * 2**20):
+        """Enable caching of trading indexes returned by `trading_index`.
+
+        When enabled, trading indexes returned by `trading_index` are
+        cached on a least-recently-used basis, with the cache bounded by
+        the memory occupied by the cached indexes. Subsequent requests for
+        the same trading index (i.e. with the same arguments) will be
+        served from the cache. Requests for a trading index with `start`
+        and `end` passed as dates and which cover a range of sessions
+        covered by a cached trading index (that was evaluated with the
+        same options) will be served by slicing the cached index.
+
+        Cached trading indexes are returned as is, i.e. not copied. If
+        `trading_index` is called with `as_nanos` as True then the
+        returned arrays will be read-only.
+
+        Parameters
+        ----------
+        maxbytes : default: 256 MiB
+            Maximum number of bytes that cached trading indexes can
+            together occupy. If the cache is already enabled then will
+            clear the cache.
+        """
+        self._trading_index_cache = _TradingIndexCache(maxbytes)
+
+    def trading_index_cache_disable(self):
+        """Disable caching of trading indexes (clears the cache)."""
+        self._trading_index_cache = None
+
+    def trading_index_cache_info(self) -> TradingIndexCacheInfo | None:
+        """Return statistics of the trading index cache.
+
+        Returns None if the cache is not enabled (see
+        `trading_index_cache_enable`).
+        """
+        if self._trading_index_cache is None:
+            return None
+        return self._trading_index_cache.info()
+
+    def trading_index_cache_clear(self):
+        """Clear the trading index cache and its statistics.
+
+        Has no effect if the cache is not enabled.
+        """
+        if self._trading_index_cache is not None:
+            self._trading_index_cache.clear()
+
+    # Methods that derive a calendar.
+
+    def slice(
+        self, start: Date | None = None, end: Date | None = None
+    ) -> ExchangeCalendar:
+        """Return a calendar covering a sub-range of this calendar.
+
+        The returned calendar is fully functional and is of the same class
+        and `side` as this calendar. The returned calendar's schedule is
+        not evaluated but rather taken from this calendar's schedule. The
+        schedule, session bounds and any per-session data already evaluated
+        by this calendar are views of this calendar's data, i.e. no data is
+        copied. Accordingly this data should not be modified.
+
+        Parameters
+        ----------
+        start : default: `first_session`
+            First session of returned calendar will be `start`, if `start`
+            is a session, or first session after `start`.
+
+        end : default: `last_session`
+            Last session of returned calendar will be `end`, if `end` is a
+            session, or last session before `end`.
+
+        Returns
+        -------
+        ExchangeCalendar
+            Calendar with sessions from `start` through `end`.
+
+        Raises
+        ------
+        errors.DateOutOfBounds
+            If `start` or `end` is earlier than the first session or later
+            than the last session.
+
+        ValueError
+            If `start` is later than `end`.
+
+        errors.NoSessionsError
+            If there are no sessions from `start` through `end`.
+        """
+        sessions_nanos = self.sessions_nanos
+        if start is None:
+            start = sessions_nanos[0]
         else:
-            return _trading_index.trading_index_intervals()
+            start = parse_date_nanos(start, "start", self)
+        if end is None:
+            end = sessions_nanos[-1]
+        else:
+            end = parse_date_nanos(end, "end", self)
+        if start > end:
+            raise ValueError(
+                "`start` cannot be later than `end` although `start` parsed as"
+                f" '{pd.Timestamp(start)}' and `end` as '{pd.Timestamp(end)}'."
+            )
+        slc = slice(
+            sessions_nanos.searchsorted(start, side="left"),
+            sessions_nanos.searchsorted(end, side="right"),
+        )
+        if slc.start == slc.stop:
+            raise errors.NoSessionsError(
+                calendar_name=self.name,
+                start=pd.Timestamp(start),
+                end=pd.Timestamp(end),
+            )
+
+        cal = object.__new__(type(self))
+        cal._side = self._side
+        cal._evaluation_timings = {}
+        cal.schedule = self.schedule.iloc[slc]
+        for attr in ("opens_nanos", "break_starts_nanos", "break_ends_nanos"):
+            setattr(cal, attr, getattr(self, attr)[slc])
+        cal.closes_nanos = self.closes_nanos[slc]
+
+        first, last = cal.schedule.index[0], cal.schedule.index[-1]
+        late_opens, early_closes = self._late_opens, self._early_closes
+        cal._late_opens = late_opens[(late_opens >= first) & (late_opens <= last)]
+        cal._early_closes = early_closes[
+            (early_closes >= first) & (early_closes <= last)
+        ]
+
+        # share per-session data that has already been evaluated
+        for attr in (
+            "sessions_nanos",
+            "first_minutes_nanos",
+            "last_minutes_nanos",
+            "last_am_minutes_nanos",
+            "first_pm_minutes_nanos",
+        ):
+            if attr in self.__dict__:
+                cal.__dict__[attr] = self.__dict__[attr][slc]
+        if "_session_bounds_nanos" in self.__dict__:
+            bounds_slc = slice(slc.start * 2, slc.stop * 2)
+            cal._session_bounds_nanos = self._session_bounds_nanos[bounds_slc]
+        return cal
+
+    # Methods that extend a calendar.
+
+    def extend(self, end: Date):
+        """Extend calendar forwards, in place.
+
+        The schedule is evaluated only for dates later than the last
+        session. Evaluated sessions are appended to the calendar's
+        schedule, and any per-session or per-minute data that the
+        calendar has already evaluated (for example `minutes_nanos`) is
+        extended with data evaluated for only the new sessions.
+
+        Data of a calendar that shares data with another calendar (for
+        example a calendar returned by `slice`) is not modified, rather the
+        extended calendar will no longer share data.
+
+        NB A calendar returned by `get_calendar` is shared with any other
+        client that requested the same calendar, all of which will see the
+        calendar as extended. Once extended, the calendar is no longer
+        served by `get_calendar` (subsequent requests are served with a
+        calendar as defined).
+
+        Parameters
+        ----------
+        end
+            Date through which to extend the calendar. Does nothing if
+            `end` is not later than the last session or if there are no
+            sessions between the last session and `end`.
+
+        Raises
+        ------
+        ValueError
+            If `end` is later than `bound_max`.
+
+        See Also
+        --------
+        extend_back
+        """
+        end = parse_date(end, "end", raise_oob=False)
+        bound_max = self.bound_max()
+        if bound_max is not None and end > bound_max:
+            raise ValueError(self._bound_max_error_msg(end))
+        start = self.last_session + pd.Timedelta(1, "D")
+        if end >= start:
+            self._extend(start, end, append=True)
+
+    def extend_back(self, start: Date):
+        """Extend calendar backwards, in place.
+
+        As `extend` although evaluates the schedule only for dates earlier
+        than the first session and prepends the evaluated sessions. As for
+        `extend`, a calendar returned by `get_calendar` is shared.
+
+        Parameters
+        ----------
+        start
+            Date from which to extend the calendar. Does nothing if
+            `start` is not earlier than the first session or if there are
+            no sessions between `start` and the first session.
+
+        Raises
+        ------
+        ValueError
+            If `start` is earlier than `bound_min`.
+
+        See Also
+        --------
+        extend
+        """
+        start = parse_date(start, "start", raise_oob=False)
+        bound_min = self.bound_min()
+        if bound_min is not None and start < bound_min:
+            raise ValueError(self._bound_min_error_msg(start))
+        end = self.first_session - pd.Timedelta(1, "D")
+        if start <= end:
+            self._extend(start, end, append=False)
+
+    def _extend(self, start: pd.Timestamp, end: pd.Timestamp, append: bool):
+        """Extend calendar with schedule evaluated from `start` through `end`.
+
+        Parameters
+        ----------
+        start, end
+            Range over which to evaluate the schedule. Must not overlap
+            the calendar's sessions.
+
+        append
+            True to append the evaluated schedule, False to prepend it.
+        """
+        ext = self._unevaluated_copy()
+        try:
+            ext._evaluate_schedule(start, end)
+        except errors.NoSessionsError:
+            return
+        cals = (self, ext) if append else (ext, self)
+
+        def concat(attr: str) -> np.ndarray | pd.Index:
+            values = [getattr(cal, attr) for cal in cals]
+            if isinstance(values[0], pd.Index):
+                return values[0].append(values[1])
+            return np.concatenate(values)
+
+        # extend evaluated data with data evaluated for only the new sessions
+        extended = {
+            attr: concat(attr)
+            for attr in _EXTENDABLE_CACHED_PROPERTIES
+            if attr in self.__dict__
+        }
+        schedule = {
+            "sessions": concat("sessions_nanos"),
+            "opens": concat("opens_nanos"),
+            "break_starts": concat("break_starts_nanos"),
+            "break_ends": concat("break_ends_nanos"),
+            "closes": concat("closes_nanos"),
+            "late_opens": _to_nanos(concat("_late_opens")),
+            "early_closes": _to_nanos(concat("_early_closes")),
+        }
+
+        self._clear_schedule_cached_properties()
+        self._set_schedule_nanos(schedule)
+        self._modification_count += 1
+        self.__dict__.update(extended)
+        self._evaluation_timings = ext._evaluation_timings
+        # cached trading indexes are located by session position
+        self.trading_index_cache_clear()
+
+    def _unevaluated_copy(self) -> ExchangeCalendar:
+        """Return instance of same class and side without a schedule.
+
+        Returned instance shares any holidays and `day` that have already
+        been evaluated by this instance.
+        """
+        cal = object.__new__(type(self))
+        cal._side = self._side
+        cal._evaluation_timings = {}
+        for attr in _DEFINITION_CACHED_PROPERTIES:
+            if attr in self.__dict__:
+                cal.__dict__[attr] = self.__dict__[attr]
+        return cal
+
+    def _clear_schedule_cached_properties(self):
+        """Clear cached properties evaluated from the schedule."""
+        cached = _cached_properties(type(self))
+        for attr in cached.difference(_DEFINITION_CACHED_PROPERTIES):
+            self.__dict__.pop(attr, None)
+
+    # Methods that patch a calendar.
+
+    def add_holidays(self, dates: Date | Sequence[Date]):
+        """Close sessions, in place.
+
+        Sessions are removed from the calendar's schedule. Data evaluated
+        from the schedule is updated only for the closed sessions (see
+        `_patch_schedule`). Changes are not reflected in the calendar
+        definition, e.g. `adhoc_holidays` and `day`.
+
+        NB A calendar returned by `get_calendar` is shared with any other
+        client that requested the same calendar, all of which will see the
+        changes. Once changed, the calendar is no longer served by
+        `get_calendar` (subsequent requests are served with a calendar as
+        defined).
+
+        Parameters
+        ----------
+        dates
+            Date or dates to close. Dates that are not sessions are
+            ignored.
+
+        Raises
+        ------
+        errors.DateOutOfBounds
+            If any date is earlier than the first session or later than
+            the last session.
+
+        errors.NoSessionsError
+            If all sessions would be closed.
+
+        See Also
+        --------
+        remove_holidays
+        """
+        nanos = self._parse_patch_dates(dates)
+        idx = np.flatnonzero(np.isin(self.sessions_nanos, nanos))
+        if not len(idx):
+            return
+        schedule = self._schedule_nanos()
+        for field in _SESSION_FIELDS:
+            schedule[field] = np.delete(schedule[field], idx)
+        for field in ("late_opens", "early_closes"):
+            schedule[field] = np.setdiff1d(schedule[field], nanos)
+        self._patch_schedule(schedule, removed=idx, evaluated=idx[:0])
+
+    def remove_holidays(self, dates: Date | Sequence[Date]):
+        """Open dates as sessions, in place.
+
+        Times of each opened session are evaluated from the calendar
+        definition (as if the date were not a holiday). Data evaluated
+        from the schedule is updated only for the opened sessions (see
+        `_patch_schedule`). Changes are not reflected in the calendar
+        definition, e.g. `adhoc_holidays` and `day`.
+
+        As for `add_holidays`, a calendar returned by `get_calendar` is
+        shared.
+
+        Parameters
+        ----------
+        dates
+            Date or dates to open. Dates that are already sessions are
+            ignored.
+
+        Raises
+        ------
+        errors.DateOutOfBounds
+            If any date is earlier than the first session or later than
+            the last session.
+
+        See Also
+        --------
+        add_holidays
+        """
+        nanos = self._parse_patch_dates(dates)
+        nanos = nanos[~np.isin(nanos, self.sessions_nanos)]
+        if not len(nanos):
+            return
+        opened = self._evaluate_dates(nanos)
+        schedule = self._schedule_nanos()
+        idx = schedule["sessions"].searchsorted(nanos)
+        for field in _SESSION_FIELDS:
+            schedule[field] = np.insert(schedule[field], idx, opened[field])
+        for field in ("late_opens", "early_closes"):
+            schedule[field] = np.union1d(schedule[field], opened[field])
+        evaluated = idx + np.arange(len(idx))  # positions in patched schedule
+        self._patch_schedule(schedule, removed=idx[:0], evaluated=evaluated)
+
+    def add_special_opens(self, time: datetime.time, dates: Date | Sequence[Date]):
+        """Set special open times, in place.
+
+        Sessions are added to `late_opens`.
+
+        As for `add_holidays`, a calendar returned by `get_calendar` is
+        shared.
+
+        Parameters
+        ----------
+        time
+            Local open time.
+
+        dates
+            Session or sessions to open at `time`.
+
+        Raises
+        ------
+        errors.NotSessionError
+            If any date is not a session.
+
+        See Also
+        --------
+        remove_special_opens
+        add_special_closes
+        """
+        self._set_special_times("opens", self._parse_patch_sessions(dates), time)
+
+    def add_special_closes(self, time: datetime.time, dates: Date | Sequence[Date]):
+        """Set special close times, in place.
+
+        Sessions are added to `early_closes`. Any break of the sessions is
+        removed.
+
+        As for `add_holidays`, a calendar returned by `get_calendar` is
+        shared.
+
+        Parameters
+        ----------
+        time
+            Local close time.
+
+        dates
+            Session or sessions to close at `time`.
+
+        Raises
+        ------
+        errors.NotSessionError
+            If any date is not a session.
+
+        See Also
+        --------
+        remove_special_closes
+        add_special_opens
+        """
+        self._set_special_times("closes", self._parse_patch_sessions(dates), time)
+
+    def remove_special_opens(self, dates: Date | Sequence[Date]):
+        """Revert special open times to defined open times, in place.
+
+        Open times are re-evaluated from the calendar definition, i.e. as
+        defined by `open_times`, `open_offset` and any special opens that
+        the calendar defines for the sessions. A session remains in
+        `late_opens` if the calendar defines it as a late open.
+
+        As for `add_holidays`, a calendar returned by `get_calendar` is
+        shared.
+
+        Parameters
+        ----------
+        dates
+            Session or sessions to revert. Sessions that are not
+            `late_opens` are ignored.
+
+        Raises
+        ------
+        errors.NotSessionError
+            If any date is not a session.
+
+        See Also
+        --------
+        add_special_opens
+        """
+        nanos = self._parse_patch_sessions(dates)
+        self._set_special_times(
+            "opens", nanos[np.isin(nanos, _to_nanos(self._late_opens))]
+        )
+
+    def remove_special_closes(self, dates: Date | Sequence[Date]):
+        """Revert special close times to defined close times, in place.
+
+        Close times, and any break, are re-evaluated from the calendar
+        definition, i.e. as defined by `close_times`, `close_offset`,
+        `break_start_times`, `break_end_times` and any special closes that
+        the calendar defines for the sessions. A session remains in
+        `early_closes` if the calendar defines it as an early close.
+
+        As for `add_holidays`, a calendar returned by `get_calendar` is
+        shared.
+
+        Parameters
+        ----------
+        dates
+            Session or sessions to revert. Sessions that are not
+            `early_closes` are ignored.
+
+        Raises
+        ------
+        errors.NotSessionError
+            If any date is not a session.
+
+        See Also
+        --------
+        add_special_closes
+        """
+        nanos = self._parse_patch_sessions(dates)
+        self._set_special_times(
+            "closes", nanos[np.isin(nanos, _to_nanos(self._early_closes))]
+        )
+
+    def _parse_patch_dates(self, dates: Date | Sequence[Date]) -> np.ndarray:
+        """Parse dates to patch as sorted unique int64 nanoseconds."""
+        if not pd.api.types.is_list_like(dates):
+            dates = [dates]
+        nanos = [parse_date(date, "dates", self).value for date in dates]
+        return np.unique(np.array(nanos, dtype=np.int64))
+
+    def _parse_patch_sessions(self, dates: Date | Sequence[Date]) -> np.ndarray:
+        """Parse sessions to patch as sorted unique int64 nanoseconds."""
+        nanos = self._parse_patch_dates(dates)
+        not_sessions = ~np.isin(nanos, self.sessions_nanos)
+        if not_sessions.any():
+            ts = pd.Timestamp(nanos[not_sessions][0])
+            raise errors.NotSessionError(self, ts, "dates")
+        return nanos
+
+    def _set_special_times(
+        self,
+        bound: Literal["opens", "closes"],
+        nanos: np.ndarray,
+        time: datetime.time | None = None,
+    ):
+        """Set special times of sessions, or revert to standard times.
+
+        Parameters
+        ----------
+        bound
+            Session bound to set.
+
+        nanos
+            Sessions to set, as int64 nanoseconds.
+
+        time
+            Local special time. None to revert to the times defined by the
+            calendar.
+        """
+        if not len(nanos):
+            return
+        schedule = self._schedule_nanos()
+        idx = schedule["sessions"].searchsorted(nanos)
+        special_field = "late_opens" if bound == "opens" else "early_closes"
+        fields = ("opens",) if bound == "opens" else ("break_starts", "break_ends")
+        fields += ("closes",) if bound == "closes" else ()
+        if time is not None:
+            times = _to_nanos(days_at_time(pd.DatetimeIndex(nanos), time, self.tz, 0))
+            patched = {field: np.full(len(nanos), NP_NAT) for field in fields}
+            patched[bound] = times
+            special = np.union1d(schedule[special_field], nanos)
+        else:
+            patched = self._evaluate_dates(nanos)
+            special = np.union1d(
+                np.setdiff1d(schedule[special_field], nanos), patched[special_field]
+            )
+        for field in fields:
+            schedule[field] = schedule[field].copy()
+            schedule[field][idx] = patched[field]
+        schedule[special_field] = special
+        self._patch_schedule(schedule, removed=idx, evaluated=idx)
+
+    def _evaluate_dates(self, nanos: np.ndarray) -> dict[str, np.ndarray]:
+        """Evaluate schedule of dates from the calendar definition.
+
+        Parameters
+        ----------
+        nanos
+            Dates to evaluate, as sorted int64 nanoseconds. Each date is
+            evaluated as a session, regardless of whether the calendar
+            defines it as a holiday.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            Schedule of dates, as `_schedule_nanos`.
+        """
+        evaluated = collections.defaultdict(list)
+        for date in pd.DatetimeIndex(nanos):
+            # evaluate each date separately, as if the only session
+            cal = self._unevaluated_copy()
+            cal._evaluate_session_times(pd.DatetimeIndex([date]), date, date)
+            for field, array in cal._schedule_nanos().items():
+                evaluated[field].append(array)
+        return {field: np.concatenate(arrays) for field, arrays in evaluated.items()}
+
+    def _schedule_nanos(self) -> dict[str, np.ndarray]:
+        """Return schedule as int64 nanosecond arrays.
+
+        Keys as `schedule_cache.FIELDS`. Arrays should not be modified.
+        """
+        return {
+            "sessions": self.sessions_nanos,
+            "opens": self.opens_nanos,
+            "break_starts": self.break_starts_nanos,
+            "break_ends": self.break_ends_nanos,
+            "closes": self.closes_nanos,
+            "late_opens": _to_nanos(self._late_opens),
+            "early_closes": _to_nanos(self._early_closes),
+        }
+
+    def _patch_schedule(
+        self,
+        schedule: dict[str, np.ndarray],
+        removed: np.ndarray,
+        evaluated: np.ndarray,
+    ):
+        """Set a patched schedule.
+
+        Data evaluated from the schedule is updated only for the sessions
+        that were patched. `minutes_nanos` (and `minutes`), if already
+        evaluated, are updated by removing the minutes of patched sessions
+        and inserting minutes evaluated for the patched sessions. Other
+        cached data evaluated from the schedule, including the first and
+        last minute of every session, is cleared (to be re-evaluated if
+        and when requested). The trading index cache is cleared and the
+        calendar's modification count is incremented.
+
+        Parameters
+        ----------
+        schedule
+            Patched schedule, as returned by `_schedule_nanos`.
+
+        removed
+            Positions, in the current schedule, of sessions that were
+            removed or modified.
+
+        evaluated
+            Positions, in the patched schedule, of sessions that were
+            added or modified.
+        """
+        sessions = schedule["sessions"]
+        if not len(sessions):
+            raise errors.NoSessionsError(
+                calendar_name=self.name, start=self.first_session, end=self.last_session
+            )
+        opens, closes = schedule["opens"], schedule["closes"]
+        if (opens[evaluated] >= closes[evaluated]).any():
+            i = evaluated[(opens[evaluated] >= closes[evaluated]).argmax()]
+            raise ValueError(
+                f"Patched session '{pd.Timestamp(sessions[i])}' would not close"
+                " later than it opens."
+            )
+        if (opens[1:] < closes[:-1]).any():
+            i = (opens[1:] < closes[:-1]).argmax()
+            raise ValueError(
+                f"Patched session '{pd.Timestamp(sessions[i + 1])}' would open"
+                f" before the prior session '{pd.Timestamp(sessions[i])}' closes."
+            )
+
+        minutes = self.__dict__.get("minutes_nanos")
+        if minutes is not None:
+            first_minutes, last_minutes = (
+                self.first_minutes_nanos,
+                self.last_minutes_nanos,
+            )
+            keep = np.ones(len(minutes), dtype=bool)
+            for i in removed:
+                start = minutes.searchsorted(first_minutes[i])
+                stop = minutes.searchsorted(last_minutes[i], "right")
+                keep[start:stop] = False
+            minutes = minutes[keep]
+            patched_minutes = compute_minutes(
+                opens[evaluated],
+                schedule["break_starts"][evaluated],
+                schedule["break_ends"][evaluated],
+                closes[evaluated],
+                self.side,
+            ).view(np.int64)
+            minutes = np.insert(
+                minutes, minutes.searchsorted(patched_minutes), patched_minutes
+            )
+        minutes_evaluated = "minutes" in self.__dict__
+
+        self._clear_schedule_cached_properties()
+        self._set_schedule_nanos(schedule)
+        self._modification_count += 1
+        if minutes is not None:
+            self.minutes_nanos = minutes
+            if minutes_evaluated:
+                self.minutes = self._minutes_from_nanos(minutes)
+        self.trading_index_cache_clear()
 
     # Internal methods called by constructor.
 
+    def _evaluate_schedule(self, start: pd.Timestamp, end: pd.Timestamp):
+        """Evaluate schedule from calendar definition.
+
+        Schedule is evaluated in stages. Holidays are evaluated once, over
+        a range that covers both the range required by `day` and the
+        calendar's range, then reused by all later stages. The time taken
+        by each stage is recorded to `evaluation_timings`.
+        """
+        timings = self._evaluation_timings
+        t = time.perf_counter()
+
+        def stage_completed(stage: str):
+            nonlocal t
+            now = time.perf_counter()
+            timings[stage] = now - t
+            t = now
+
+        regular_holidays = self._regular_holidays
+        if regular_holidays is not None:
+            # evaluate once over range required by both `day` (which requests
+            # holidays over the default range) and `_special_dates`.
+            regular_holidays.holidays(
+                min(start, AbstractHolidayCalendar.start_date),
+                max(end, AbstractHolidayCalendar.end_date),
+            )
+        day = self.day  # incorporates evaluated regular and adhoc holidays
+        stage_completed("holidays")
+
+        _all_days = business_day_range(start, end, day)  # session labels
+        if _all_days.empty:
+            raise errors.NoSessionsError(calendar_name=self.name, start=start, end=end)
+        stage_completed("sessions")
+        self._evaluate_session_times(_all_days, start, end, stage_completed)
+
+    def _evaluate_session_times(
+        self,
+        _all_days: pd.DatetimeIndex,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        stage_completed: Callable[[str], None] = lambda stage: None,
+    ):
+        """Evaluate and set schedule for given sessions.
+
+        Parameters
+        ----------
+        _all_days
+            Session labels.
+
+        start, end
+            Range over which to evaluate special offsets and special
+            times. Should cover `_all_days`.
+
+        stage_completed
+            Callable to be called with name of each stage as completed.
+        """
+        # DatetimeIndex of standard times for each day.
+        self._opens = _group_times(
+            _all_days,
+            self.open_times,
+            self.tz,
+            self.open_offset,
+        )
+        self._break_starts = _group_times(
+            _all_days,
+            self.break_start_times,
+            self.tz,
+        )
+        self._break_ends = _group_times(
+            _all_days,
+            self.break_end_times,
+            self.tz,
+        )
+        self._closes = _group_times(
+            _all_days,
+            self.close_times,
+            self.tz,
+            self.close_offset,
+        )
+        stage_completed("standard_times")
+
+        # Apply any special offsets first
+        self.apply_special_offsets(_all_days, start, end)
+        stage_completed("special_offsets")
+
+        # Series mapping sessions with non-standard opens/closes.
+        _special_opens = self._calculate_special_opens(start, end)
+        _special_closes = self._calculate_special_closes(start, end)
+        stage_completed("special_dates")
+
+        # Adjust for special opens and closes.
+        self._opens = _adjust_special_dates(_all_days, self._opens, _special_opens)
+        self._closes = _adjust_special_dates(_all_days, self._closes, _special_closes)
+        self._break_starts = _remove_breaks_for_special_dates(
+            _all_days, self._break_starts, _special_closes
+        )
+        self._break_ends = _remove_breaks_for_special_dates(
+            _all_days, self._break_ends, _special_closes
+        )
+        stage_completed("adjust")
+
+        def to_nanos(dti: pd.DatetimeIndex | None) -> np.ndarray:
+            if dti is None:
+                return np.full(len(_all_days), NP_NAT, dtype=np.int64)
+            return _to_nanos(dti)
+
+        self._set_schedule(
+            _all_days,
+            to_nanos(self._opens),
+            to_nanos(self._break_starts),
+            to_nanos(self._break_ends),
+            to_nanos(self._closes),
+            _special_opens.index,
+            _special_closes.index,
+        )
+        # intermediate times are set as attributes only so that they are
+        # available to `apply_special_offsets`.
+        for attr in ("_opens", "_break_starts", "_break_ends", "_closes"):
+            del self.__dict__[attr]
+        stage_completed("schedule")
+
+    def _set_schedule(
+        self,
+        sessions: pd.DatetimeIndex,
+        opens_nanos: np.ndarray,
+        break_starts_nanos: np.ndarray,
+        break_ends_nanos: np.ndarray,
+        closes_nanos: np.ndarray,
+        late_opens: pd.DatetimeIndex,
+        early_closes: pd.DatetimeIndex,
+    ):
+        """Set schedule and associated attributes.
+
+        Parameters
+        ----------
+        sessions
+            Session labels, timezone naive.
+
+        opens_nanos, break_starts_nanos, break_ends_nanos, closes_nanos
+            Session bounds as nanoseconds since epoch (UTC). Missing
+            values (i.e. break bounds of sessions without a break) as
+            NP_NAT.
+
+        late_opens
+            Sessions with non-standard open times.
+
+        early_closes
+            Sessions with non-standard close times.
+        """
+        _check_breaks_match(break_starts_nanos, break_ends_nanos)
+
+        def to_utc(nanos: np.ndarray) -> pd.DatetimeIndex:
+            return pd.DatetimeIndex(nanos.view("datetime64[ns]"), tz=UTC)
+
+        self.schedule = pd.DataFrame(
+            index=sessions,
+            data=collections.OrderedDict(
+                [
+                    ("open", to_utc(opens_nanos)),
+                    ("break_start", to_utc(break_starts_nanos)),
+                    ("break_end", to_utc(break_ends_nanos)),
+                    ("close", to_utc(closes_nanos)),
+                ]
+            ),
+            dtype="datetime64[ns, UTC]",
+        )
+
+        self.opens_nanos = opens_nanos
+        self.break_starts_nanos = break_starts_nanos
+        self.break_ends_nanos = break_ends_nanos
+        self.closes_nanos = closes_nanos
+
+        self._late_opens = late_opens
+        self._early_closes = early_closes
+
+    def _set_schedule_nanos(self, schedule: dict[str, np.ndarray]):
+        """Set schedule from int64 nanosecond arrays.
+
+        Parameters
+        ----------
+        schedule
+            Mapping with keys as `schedule_cache.FIELDS` and values as
+            int64 arrays of nanoseconds. Arrays are not copied.
+        """
+
+        def to_dti(nanos: np.ndarray) -> pd.DatetimeIndex:
+            return pd.DatetimeIndex(nanos.view("datetime64[ns]"))
+
+        self._set_schedule(
+            to_dti(schedule["sessions"]),
+            schedule["opens"],
+            schedule["break_starts"],
+            schedule["break_ends"],
+            schedule["closes"],
+            to_dti(schedule["late_opens"]),
+            to_dti(schedule["early_closes"]),
+        )
+
     def _special_dates(
         self,
         regular_dates: list[tuple[datetime.time, HolidayCalendar | int]],
@@ -2775,9 +4387,8 @@ class ExchangeCalendar(ABC):
         result = result[~result.index.duplicated(keep="first")]
         result = result.sort_index()
         # exclude any special date that coincides with a holiday
-        adhoc_holidays = pd.DatetimeIndex(self.adhoc_holidays)
-        result = result[~result.index.isin(adhoc_holidays)]
-        regular_holidays = self.regular_holidays
+        result = result[~result.index.isin(self._adhoc_holidays)]
+        regular_holidays = self._regular_holidays
         if regular_holidays is not None:
             reg_holidays = regular_holidays.holidays(start_date, end_date)
             if not reg_holidays.empty:
@@ -2805,6 +4416,61 @@ class ExchangeCalendar(ABC):
         )
 
 
+# Cached properties evaluated from the calendar definition, rather than from
+# the schedule.
+_DEFINITION_CACHED_PROPERTIES = ("_regular_holidays", "_adhoc_holidays", "day")
+
+# Schedule fields with a value for each session.
+_SESSION_FIELDS = ("sessions", "opens", "break_starts", "break_ends", "closes")
+
+# Cached properties evaluated for each session or minute, which can be
+# extended by concatenating values evaluated for additional sessions.
+_EXTENDABLE_CACHED_PROPERTIES = (
+    "sessions_nanos",
+    "first_minutes_nanos",
+    "last_minutes_nanos",
+    "last_am_minutes_nanos",
+    "first_pm_minutes_nanos",
+    "minutes",
+    "minutes_nanos",
+    "_session_bounds_nanos",
+    "_subsession_bounds_nanos",
+)
+
+
+@functools.lru_cache
+def _cached_properties(cls: type[ExchangeCalendar]) -> frozenset[str]:
+    """Names of all cached properties of `cls`."""
+    return frozenset(
+        name
+        for klass in cls.__mro__
+        for name, value in vars(klass).items()
+        if isinstance(value, functools.cached_property)
+    )
+
+
+@functools.lru_cache
+def _unpickled_attrs(cls: type[ExchangeCalendar]) -> frozenset[str]:
+    """Names of instance attributes of `cls` excluded from pickled state.
+
+    Excludes attributes that are set from the schedule, all cached
+    properties (which are evaluated from the schedule or the calendar
+    definition) and any resource that cannot be pickled.
+    """
+    attrs = {
+        "schedule",
+        "opens_nanos",
+        "break_starts_nanos",
+        "break_ends_nanos",
+        "closes_nanos",
+        "_late_opens",
+        "_early_closes",
+        "_trading_index_cache",
+        "_shared_memory",  # set by `shared_calendars.SharedCalendar.attach`
+    }
+    return frozenset(attrs) | _cached_properties(cls)
+
+
 def _check_breaks_match(break_starts_nanos: np.ndarray, break_ends_nanos: np.ndarray):
     """Checks that break_starts_nanos and break_ends_nanos match."""
     nats_match = np.equal(NP_NAT == break_starts_nanos, NP_NAT == break_ends_nanos)
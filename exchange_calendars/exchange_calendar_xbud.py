@@ -18,6 +18,7 @@ from __future__ import annotations
 import datetime
 from zoneinfo import ZoneInfo
 
+import pandas as pd
 from pandas.tseries.holiday import Easter, EasterMonday, Holiday
 from pandas.tseries.offsets import Day
 
@@ -31,6 +32,7 @@ from .common_holidays import (
     whit_monday,
 )
 from .exchange_calendar import THURSDAY, TUESDAY, HolidayCalendar, ExchangeCalendar
+from .pandas_extensions.holiday import register_vectorized_observance
 
 
 ONE_DAY = datetime.timedelta(1)
@@ -54,6 +56,16 @@ def bridge_fri(dt: datetime.datetime) -> datetime.datetime | None:
     return dt + ONE_DAY if dt.weekday() == THURSDAY else None
 
 
+@register_vectorized_observance(bridge_mon)
+def vectorized_bridge_mon(dates: pd.DatetimeIndex) -> pd.DatetimeIndex:
+    return (dates - ONE_DAY).where(dates.weekday == TUESDAY)
+
+
+@register_vectorized_observance(bridge_fri)
+def vectorized_bridge_fri(dates: pd.DatetimeIndex) -> pd.DatetimeIndex:
+    return (dates + ONE_DAY).where(dates.weekday == THURSDAY)
+
+
 NewYearsDayExtraMon = new_years_day(observance=bridge_mon)
 NewYearsDayExtraFri = new_years_day(observance=bridge_fri)
 
@@ -50,6 +50,7 @@ from .exchange_calendar import (
     WEDNESDAY,
     HolidayCalendar,
 )
+from .pandas_extensions.holiday import register_vectorized_observance
 from .precomputed_exchange_calendar import PrecomputedExchangeCalendar
 from .utils.pandas_utils import vectorized_sunday_to_monday
 
@@ -244,6 +245,14 @@ def boxing_day_obs(dt):
     return dt
 
 
+@register_vectorized_observance(boxing_day_obs)
+def vectorized_boxing_day_obs(dates):
+    # NB `boxing_day_obs` compares the `weekday` method (rather than its
+    # return) and so never shifts a date. The answers file reflects this
+    # behaviour, which is preserved here.
+    return dates
+
+
 class XHKGExchangeCalendar(PrecomputedExchangeCalendar):
     """
     Exchange calendar for the Hong Kong Stock Exchange (XHKG).
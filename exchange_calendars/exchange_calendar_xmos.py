@@ -385,14 +385,14 @@ class XMOSExchangeCalendar(ExchangeCalendar):
     def day(self):
         if self.special_weekmasks:
             return MultipleWeekmaskCustomBusinessDay(
-                holidays=self.adhoc_holidays,
-                calendar=self.regular_holidays,
+                holidays=self._adhoc_holidays.tolist(),
+                calendar=self._regular_holidays,
                 weekmask=self.weekmask,
                 weekmasks=self.special_weekmasks,
             )
         else:
             return CustomBusinessDay(
-                holidays=self.adhoc_holidays,
-                calendar=self.regular_holidays,
+                holidays=self._adhoc_holidays.tolist(),
+                calendar=self._regular_holidays,
                 weekmask=self.weekmask,
             )
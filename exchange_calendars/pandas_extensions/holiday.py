@@ -1,7 +1,12 @@
 # https://github.com/pandas-dev/pandas/blob/master/pandas/tseries/holiday.py
 
+from __future__ import annotations
+
+from collections.abc import Callable
 import warnings
 
+import numpy as np
+from pandas.tseries import holiday as pandas_holiday
 from pandas.tseries.holiday import (
     Holiday as PandasHoliday,
     AbstractHolidayCalendar as PandasAbstractHolidayCalendar,
@@ -11,11 +16,263 @@ from pandas import (
     DatetimeIndex,
     Series,
     Timestamp,
+    to_timedelta,
 )
 from pandas.errors import PerformanceWarning
 
+from .. import rule_cache
 from .offsets import _is_normalized
 
+# Vectorized implementations of scalar observance functions, keyed by the
+# scalar function they implement.
+_VECTORIZED_OBSERVANCES: dict[Callable, Callable[[DatetimeIndex], DatetimeIndex]] = {}
+
+
+def register_vectorized_observance(observance: Callable) -> Callable:
+    """Register a vectorized implementation of a scalar observance.
+
+    Decorated function should take a DatetimeIndex and return a
+    DatetimeIndex of the same length with each date as `observance` would
+    have returned it, or NaT where `observance` would have returned None.
+
+    Parameters
+    ----------
+    observance
+        Scalar observance function (as passed to a Holiday's `observance`
+        parameter) that the decorated function implements.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import pandas as pd
+    >>> def sunday_to_tuesday(dt):
+    ...     return dt + pd.Timedelta(2, "D") if dt.weekday() == 6 else dt
+    >>> @register_vectorized_observance(sunday_to_tuesday)
+    ... def vectorized_sunday_to_tuesday(dates):
+    ...     return shift_days(dates, np.where(dates.weekday == 6, 2, 0))
+    """
+
+    def decorator(func: Callable[[DatetimeIndex], DatetimeIndex]) -> Callable:
+        _VECTORIZED_OBSERVANCES[observance] = func
+        return func
+
+    return decorator
+
+
+def shift_days(dates: DatetimeIndex, days: np.ndarray) -> DatetimeIndex:
+    """Shift each date of a DatetimeIndex by a number of days.
+
+    Parameters
+    ----------
+    dates
+        Dates to shift.
+
+    days
+        Number of days by which to shift each date (negative to shift
+        back). Same length as `dates`.
+    """
+    if not days.any():
+        return dates
+    return dates + to_timedelta(days, unit="D")
+
+
+def _weekday_observance(shifts: tuple[int, ...]) -> Callable:
+    """Get vectorized observance that shifts dates by weekday.
+
+    Parameters
+    ----------
+    shifts
+        Number of days by which to shift dates that fall on each weekday,
+        Monday through Sunday.
+    """
+    shifts_ = np.array(shifts)
+
+    def observance(dates: DatetimeIndex) -> DatetimeIndex:
+        weekdays = dates.weekday
+        if dates.hasnans:
+            weekdays = weekdays.fillna(0).astype("int64")  # NaT remains NaT
+        return shift_days(dates, shifts_[weekdays])
+
+    return observance
+
+
+for _observance, _shifts in (
+    (pandas_holiday.sunday_to_monday, (0, 0, 0, 0, 0, 0, 1)),
+    (pandas_holiday.weekend_to_monday, (0, 0, 0, 0, 0, 2, 1)),
+    (pandas_holiday.next_monday, (0, 0, 0, 0, 0, 2, 1)),
+    (pandas_holiday.next_monday_or_tuesday, (1, 0, 0, 0, 0, 2, 2)),
+    (pandas_holiday.previous_friday, (0, 0, 0, 0, 0, -1, -2)),
+    (pandas_holiday.nearest_workday, (0, 0, 0, 0, 0, -1, 1)),
+    (pandas_holiday.next_workday, (1, 1, 1, 1, 3, 2, 1)),
+    (pandas_holiday.previous_workday, (-3, -1, -1, -1, -1, -1, -2)),
+    (pandas_holiday.before_nearest_workday, (-3, -1, -1, -1, -1, -2, -2)),
+    (pandas_holiday.after_nearest_workday, (1, 1, 1, 1, 3, 2, 2)),
+):
+    register_vectorized_observance(_observance)(_weekday_observance(_shifts))
+
+
+def apply_observance(dates: DatetimeIndex, observance: Callable) -> DatetimeIndex:
+    """Apply an observance to dates.
+
+    Uses any vectorized implementation registered for `observance` (see
+    `register_vectorized_observance`), otherwise maps `observance` over
+    each date.
+
+    Parameters
+    ----------
+    dates
+        Dates to which to apply observance.
+
+    observance
+        Scalar observance function.
+
+    Returns
+    -------
+    DatetimeIndex
+        `dates` with observance applied. Dates for which the observance
+        returns None are NaT.
+    """
+    if dates.empty:
+        return dates.copy()
+    vectorized = _VECTORIZED_OBSERVANCES.get(observance)
+    if vectorized is not None:
+        return vectorized(dates)
+    return dates.map(observance)
+
+
+def _yearly_dates(
+    month: int, day: int, first_year: int, last_year: int, tz=None
+) -> DatetimeIndex:
+    """Get dates of a given month and day for each year of a range.
+
+    Range of years is inclusive of both `first_year` and `last_year`.
+    """
+    years = np.arange(first_year, last_year + 1) - 1970
+    dates = (
+        years.astype("datetime64[Y]").astype("datetime64[M]") + (month - 1)
+    ).astype("datetime64[D]") + (day - 1)
+    dates = DatetimeIndex(dates.astype("datetime64[ns]"))
+    return dates if tz is None else dates.tz_localize(tz)
+
+
+def _reference_dates(
+    rule: PandasHoliday, start_date: Timestamp, end_date: Timestamp
+) -> DatetimeIndex:
+    """Vectorized implementation of `PandasHoliday._reference_dates`."""
+    if rule.start_date is not None:
+        start_date = rule.start_date.tz_localize(start_date.tz)
+    if rule.end_date is not None:
+        end_date = rule.end_date.tz_localize(start_date.tz)
+    return _yearly_dates(
+        rule.month, rule.day, start_date.year - 1, end_date.year + 1, start_date.tz
+    )
+
+
+def _is_vectorizable(rule: PandasHoliday) -> bool:
+    """Query if holiday dates of a rule can be evaluated by `holiday_dates`.
+
+    True if the rule evaluates its dates with the implementation of pandas
+    Holiday and does not define a fixed year or a February 29th.
+    """
+    cls = type(rule)
+    return (
+        isinstance(rule, PandasHoliday)
+        and cls.dates is PandasHoliday.dates
+        and cls._reference_dates is PandasHoliday._reference_dates
+        and cls._apply_rule is PandasHoliday._apply_rule
+        and rule.year is None
+        and not (rule.month == 2 and rule.day == 29)
+    )
+
+
+def _rule_key(rule: PandasHoliday) -> tuple | None:
+    """Key of a vectorizable rule in the rule cache.
+
+    Key comprises the parameters that determine the date on which the rule
+    is observed in any year. None if the rule cannot be cached.
+    """
+    offset = rule.offset
+    if isinstance(offset, list):
+        offset = tuple(offset)
+    key = (rule.month, rule.day, offset, rule.observance)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _evaluate_years(
+    rule: PandasHoliday, first_year: int, last_year: int, tz=None
+) -> DatetimeIndex:
+    """Evaluate date a vectorizable rule is observed in each of a range of years.
+
+    Returned DatetimeIndex has a date for each year from `first_year`
+    through `last_year`, NaT for any year in which the holiday is not
+    observed.
+    """
+    dates = _yearly_dates(rule.month, rule.day, first_year, last_year, tz)
+    if rule.observance is not None:
+        dates = apply_observance(dates, rule.observance)
+    else:
+        dates = PandasHoliday._apply_rule(rule, dates)
+    # NB observance returning None for all dates would return an object Index
+    return DatetimeIndex(dates)
+
+
+def holiday_dates(
+    rule: PandasHoliday,
+    start_date: Timestamp,
+    end_date: Timestamp,
+    return_name: bool = False,
+) -> Series | DatetimeIndex:
+    """Evaluate the dates of a holiday rule between two dates.
+
+    Equivalent to ``rule.dates(start_date, end_date, return_name)`` although
+    evaluates pandas Holiday rules with vectorized operations, including
+    applying any observance with `apply_observance`. The dates observed by
+    such rules are cached, by year, to the process-wide rule cache (see
+    `exchange_calendars.rule_cache`).
+    """
+    if not _is_vectorizable(rule):
+        return rule.dates(start_date, end_date, return_name=return_name)
+
+    start_date = Timestamp(start_date)
+    end_date = Timestamp(end_date)
+    filter_start_date, filter_end_date = start_date, end_date
+
+    # range of years as evaluated by `PandasHoliday._reference_dates`
+    tz = start_date.tz
+    ref_start = start_date if rule.start_date is None else rule.start_date
+    ref_end = end_date if rule.end_date is None else rule.end_date
+    first_year, last_year = ref_start.year - 1, ref_end.year + 1
+
+    key = _rule_key(rule) if tz is None else None
+    if key is None:
+        dates = _evaluate_years(rule, first_year, last_year, tz)
+    else:
+
+        def evaluate(first_year: int, last_year: int) -> np.ndarray:
+            return _evaluate_years(rule, first_year, last_year).values
+
+        dates = DatetimeIndex(rule_cache.get(key, first_year, last_year, evaluate))
+
+    if rule.days_of_week is not None:
+        dates = dates[np.isin(dates.dayofweek, rule.days_of_week).ravel()]
+
+    if rule.start_date is not None:
+        filter_start_date = max(
+            rule.start_date.tz_localize(filter_start_date.tz), filter_start_date
+        )
+    if rule.end_date is not None:
+        filter_end_date = min(
+            rule.end_date.tz_localize(filter_end_date.tz), filter_end_date
+        )
+    dates = dates[(dates >= filter_start_date) & (dates <= filter_end_date)]
+    if return_name:
+        return Series(rule.name, index=dates)
+    return dates
+
 
 class Holiday(PandasHoliday):
     """
@@ -111,13 +368,11 @@ class Holiday(PandasHoliday):
                 observances = self.observance
             for observance in observances:
                 if isinstance(observance, BaseOffset):
-                    offset = observance
-
-                    def f(d):
-                        return d + offset
-
-                    observance = f
-                dates = dates.map(observance)
+                    with warnings.catch_warnings():
+                        warnings.simplefilter("ignore", PerformanceWarning)
+                        dates = dates + observance
+                else:
+                    dates = apply_observance(dates, observance)
         return dates
 
     def _apply_rule(self, dates, apply_offset=True, apply_observance=True):
@@ -173,7 +428,7 @@ class AbstractHolidayCalendar(PandasAbstractHolidayCalendar):
         # get them again
         if self._cache is None or start < self._cache[0] or end > self._cache[1]:
             pre_holidays = [
-                rule.dates(start, end, return_name=True) for rule in self.rules
+                holiday_dates(rule, start, end, return_name=True) for rule in self.rules
             ]
             if pre_holidays:
                 # This line's behavior is changed to use custom combine()
@@ -1,11 +1,12 @@
 import datetime
+import numpy as np
 import pandas as pd
 from zoneinfo import ZoneInfo
 
 from pandas.tseries.offsets import Day
-from korean_lunar_calendar import KoreanLunarCalendar
 
-from .holiday import Holiday
+from . import korean_lunar_data
+from .holiday import Holiday, _reference_dates
 from .offsets import _is_normalized
 
 
@@ -149,15 +150,137 @@ class KoreanSolarHoliday(KoreanHoliday):
     pass
 
 
-def korean_lunar_to_solar(year, month, day, is_intercalation=False):
-    calendar = KoreanLunarCalendar()
-    is_valid = calendar.setLunarDate(year, month, day, is_intercalation)
-    if not is_valid:
+_EPOCH = datetime.date(1970, 1, 1)
+
+
+def _build_lunar_months():
+    """Build table of lunar months from `korean_lunar_data`.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        Each array has a row for each lunar month, in chronological order:
+            solar date of first day of month, as days since 1970-01-01
+            number of days in month
+            lunar year
+            lunar month
+            bool indicating if month is intercalary
+        Followed by arrays, with a row for each lunar year, of:
+            row of the first month of the year
+            month followed by an intercalary month (0 if none)
+    """
+    new_years = np.array(korean_lunar_data.NEW_YEARS, dtype="int64")
+    month_data = np.array(korean_lunar_data.MONTH_DATA, dtype="int64")
+    leap_months = (month_data >> 13)[:, None]
+    positions = np.arange(13)
+
+    num_months = 12 + (leap_months[:, 0] > 0)
+    valid = positions < num_months[:, None]
+    lengths = np.where(valid, 29 + (month_data[:, None] >> positions & 1), 0)
+    starts = new_years[:, None] + np.cumsum(lengths, axis=1) - lengths
+    has_leap = leap_months > 0
+    months = positions + 1 - (has_leap & (positions >= leap_months))
+    intercalary = has_leap & (positions == leap_months)
+    years = np.arange(korean_lunar_data.FIRST_YEAR, korean_lunar_data.LAST_YEAR + 1)
+    years = np.broadcast_to(years[:, None], valid.shape)
+
+    year_rows = np.cumsum(num_months) - num_months
+    return (
+        starts[valid],
+        lengths[valid],
+        years[valid],
+        months[valid],
+        intercalary[valid],
+        year_rows,
+        leap_months[:, 0],
+    )
+
+
+(
+    _MONTH_STARTS,
+    _MONTH_LENGTHS,
+    _MONTH_YEARS,
+    _MONTHS,
+    _MONTH_INTERCALARY,
+    _YEAR_ROWS,
+    _LEAP_MONTHS,
+) = _build_lunar_months()
+
+
+def _lunar_to_solar_days(years, months, days, is_intercalation=False) -> np.ndarray:
+    """Convert Korean lunar dates to solar dates.
+
+    Parameters
+    ----------
+    years, months, days
+        Array-like of lunar years, months and days.
+
+    is_intercalation
+        True if dates are in intercalary months.
+
+    Returns
+    -------
+    np.ndarray
+        Solar dates as days since 1970-01-01.
+
+    Raises
+    ------
+    ValueError
+        If any date is not a valid lunar date within the supported range.
+    """
+    years, months, days = (np.asarray(a, dtype="int64") for a in (years, months, days))
+    values = years * 10000 + months * 100 + days
+    valid = (
+        (values >= korean_lunar_data.LUNAR_MIN_VALUE)
+        & (values <= korean_lunar_data.LUNAR_MAX_VALUE)
+        & (months >= 1)
+        & (months <= 12)
+        & (days >= 1)
+    )
+    year_idx = np.where(valid, years - korean_lunar_data.FIRST_YEAR, 0)
+    leap_months = _LEAP_MONTHS[year_idx]
+    if is_intercalation:
+        valid &= leap_months == months
+    # months after an intercalary month (or the intercalary month itself) are
+    # one position later in the year
+    after_leap = (leap_months > 0) & (
+        (months > leap_months) | (is_intercalation & (months == leap_months))
+    )
+    rows = _YEAR_ROWS[year_idx] + months - 1 + after_leap
+    rows = np.where(valid, rows, 0)
+    valid &= days <= _MONTH_LENGTHS[rows]
+    if not valid.all():
+        i = np.flatnonzero(~valid)[0]
         raise ValueError(
             "Invalid date for lunar date: (year=%r, month=%r, day=%r, is_intercalation=%r)"
-            % (year, month, day, is_intercalation)
+            % (int(years[i]), int(months[i]), int(days[i]), is_intercalation)
         )
-    return (calendar.solarYear, calendar.solarMonth, calendar.solarDay)
+    return _MONTH_STARTS[rows] + days - 1
+
+
+def _solar_days_to_lunar(solar_days) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert solar dates to Korean lunar dates.
+
+    Parameters
+    ----------
+    solar_days
+        Array-like of solar dates as days since 1970-01-01. All dates must
+        be within the supported range.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        Lunar years, months and days.
+    """
+    solar_days = np.asarray(solar_days, dtype="int64")
+    rows = _MONTH_STARTS.searchsorted(solar_days, side="right") - 1
+    return _MONTH_YEARS[rows], _MONTHS[rows], solar_days - _MONTH_STARTS[rows] + 1
+
+
+def korean_lunar_to_solar(year, month, day, is_intercalation=False):
+    solar_days = _lunar_to_solar_days([year], [month], [day], is_intercalation)
+    date = _EPOCH + datetime.timedelta(days=int(solar_days[0]))
+    return (date.year, date.month, date.day)
 
 
 def korean_lunar_to_solar_datetime(dt, is_intercalation=False):
@@ -167,15 +290,51 @@ def korean_lunar_to_solar_datetime(dt, is_intercalation=False):
     return dt.replace(year, month, day)
 
 
+def korean_lunar_to_solar_dates(
+    dates: pd.DatetimeIndex, is_intercalation: bool = False
+) -> pd.DatetimeIndex:
+    """Vectorized implementation of `korean_lunar_to_solar_datetime`.
+
+    Parameters
+    ----------
+    dates
+        Lunar dates, expressed with year, month and day fields of the
+        lunar calendar.
+
+    is_intercalation
+        True if dates are in intercalary months.
+
+    Returns
+    -------
+    pd.DatetimeIndex
+        Solar dates. Any time component of `dates` is retained.
+    """
+    solar_days = _lunar_to_solar_days(
+        dates.year, dates.month, dates.day, is_intercalation
+    )
+    solar = pd.DatetimeIndex(solar_days.astype("datetime64[D]").astype("M8[ns]"))
+    if dates.tz is not None:
+        solar = solar.tz_localize(dates.tz)
+    return solar + (dates - dates.normalize())
+
+
 def korean_solar_to_lunar(year, month, day):
-    calendar = KoreanLunarCalendar()
-    is_valid = calendar.setSolarDate(year, month, day)
-    if not is_valid:
+    value = year * 10000 + month * 100 + day
+    try:
+        date = datetime.date(year, month, day)
+    except ValueError:
+        date = None
+    if (
+        date is None
+        or value < korean_lunar_data.SOLAR_MIN_VALUE
+        or value > korean_lunar_data.SOLAR_MAX_VALUE
+    ):
         raise ValueError(
             "Invalid date for solar date: (year=%r, month=%r, day=%r)"
             % (year, month, day)
         )
-    return (calendar.lunarYear, calendar.lunarMonth, calendar.lunarDay)
+    years, months, days = _solar_days_to_lunar([(date - _EPOCH).days])
+    return (int(years[0]), int(months[0]), int(days[0]))
 
 
 def korean_solar_to_lunar_datetime(dt, round_down: bool):
@@ -198,17 +357,17 @@ def korean_solar_to_lunar_datetime(dt, round_down: bool):
 
 class KoreanLunarHoliday(KoreanHoliday):
     _max_solar_end_date = pd.to_datetime(
-        str(KoreanLunarCalendar.KOREAN_SOLAR_MAX_VALUE), format="%Y%m%d"
+        str(korean_lunar_data.SOLAR_MAX_VALUE), format="%Y%m%d"
     )
     _max_lunar_end_date = pd.to_datetime(
-        str(KoreanLunarCalendar.KOREAN_LUNAR_MAX_VALUE), format="%Y%m%d"
+        str(korean_lunar_data.LUNAR_MAX_VALUE), format="%Y%m%d"
     )
 
     def _reference_dates(self, start_date, end_date, strict=False):
         solar_start_date = start_date
         solar_end_date = end_date
 
-        # Restrict date range to fall into supported range of korean_lunar_calendar library
+        # Restrict date range to fall into supported range of lunar data
         if solar_end_date > self._max_solar_end_date:
             if not strict and solar_start_date < self._max_solar_end_date:
                 solar_end_date = self._max_solar_end_date
@@ -225,14 +384,12 @@ class KoreanLunarHoliday(KoreanHoliday):
         lunar_end_date = korean_solar_to_lunar_datetime(
             solar_end_date, round_down=False
         )
-        dates = super()._reference_dates(lunar_start_date, lunar_end_date)
+        dates = _reference_dates(self, lunar_start_date, lunar_end_date)
 
-        # Still restrict date range to fall into supported range of korean_lunar_calendar library
+        # Still restrict date range to fall into supported range of lunar data
         dates = dates[dates <= self._max_lunar_end_date]
 
         # Convert lunar dates to solar dates
-        dates = dates.to_series()
-        dates = dates.map(korean_lunar_to_solar_datetime)
-        dates = pd.DatetimeIndex(dates)
+        dates = korean_lunar_to_solar_dates(dates)
 
         return dates[(dates >= start_date) & (dates < end_date)]
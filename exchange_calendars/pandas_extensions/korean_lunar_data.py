@@ -0,0 +1,147 @@
+"""Korean lunar calendar data.
+
+Generated by etc/make_korean_lunar_data.py from korean_lunar_calendar. Do not
+edit by hand.
+
+Data describes each lunar year from `FIRST_YEAR` through `LAST_YEAR`.
+`NEW_YEARS` has the solar date of each lunar new year, as days since
+1970-01-01. `MONTH_DATA` has for each year an int of which bits 0-12 indicate
+if each month of the year, in chronological order and including any
+intercalary month, is long (30 days) or short (29 days) and bits 13-16 give
+the month that is followed by an intercalary month (0 if none).
+"""
+
+FIRST_YEAR = 1583
+LAST_YEAR = 2050
+
+# Supported range of dates, as yyyymmdd
+LUNAR_MIN_VALUE = 15830101
+LUNAR_MAX_VALUE = 20501118
+SOLAR_MIN_VALUE = 15830124
+SOLAR_MAX_VALUE = 20501231
+
+# fmt: off
+NEW_YEARS = (
+    -141326, -140942, -140588, -140205, -139851, -139496, -139112, -138757,
+    -138403, -138019, -137665, -137281, -136927, -136573, -136189, -135834,
+    -135479, -135095, -134741, -134387, -134003, -133649, -133265, -132911,
+    -132556, -132172, -131817, -131463, -131079, -130725, -130342, -129987,
+    -129633, -129249, -128894, -128540, -128156, -127801, -127448, -127064,
+    -126709, -126325, -125971, -125616, -125232, -124878, -124524, -124140,
+    -123786, -123402, -123048, -122693, -122309, -121954, -121600, -121216,
+    -120862, -120508, -120124, -119770, -119385, -119031, -118676, -118292,
+    -117938, -117584, -117201, -116846, -116462, -116107, -115753, -115369,
+    -115015, -114661, -114277, -113923, -113568, -113184, -112830, -112446,
+    -112091, -111737, -111353, -110999, -110645, -110261, -109906, -109552,
+    -109168, -108813, -108429, -108075, -107721, -107337, -106983, -106628,
+    -106244, -105890, -105506, -105152, -104798, -104414, -104060, -103705,
+    -103321, -102966, -102612, -102228, -101874, -101490, -101136, -100782,
+    -100398, -100043, -99688, -99304, -98950, -98566, -98212, -97858,
+    -97474, -97120, -96765, -96381, -96026, -95672, -95288, -94934,
+    -94551, -94196, -93842, -93458, -93103, -92749, -92365, -92011,
+    -91627, -91273, -90918, -90534, -90180, -89825, -89441, -89087,
+    -88733, -88349, -87995, -87611, -87256, -86902, -86518, -86163,
+    -85809, -85425, -85071, -84687, -84333, -83978, -83594, -83240,
+    -82885, -82502, -82148, -81793, -81410, -81055, -80671, -80316,
+    -79962, -79578, -79224, -78870, -78486, -78132, -77748, -77393,
+    -77038, -76654, -76300, -75946, -75562, -75208, -74854, -74470,
+    -74115, -73731, -73376, -73022, -72638, -72284, -71930, -71546,
+    -71192, -70808, -70453, -70099, -69715, -69361, -69007, -68623,
+    -68268, -67914, -67530, -67175, -66791, -66437, -66083, -65699,
+    -65345, -64990, -64606, -64252, -63897, -63513, -63159, -62775,
+    -62421, -62067, -61683, -61328, -60974, -60590, -60235, -59852,
+    -59498, -59143, -58760, -58405, -58050, -57666, -57312, -56958,
+    -56574, -56220, -55836, -55482, -55127, -54743, -54388, -54034,
+    -53650, -53296, -52912, -52558, -52204, -51820, -51465, -51110,
+    -50726, -50372, -49988, -49634, -49280, -48896, -48542, -48187,
+    -47803, -47449, -47094, -46711, -46357, -45973, -45618, -45264,
+    -44880, -44525, -44171, -43787, -43433, -43049, -42695, -42340,
+    -41956, -41602, -41247, -40863, -40509, -40155, -39771, -39417,
+    -39033, -38678, -38324, -37940, -37585, -37231, -36848, -36494,
+    -36110, -35755, -35400, -35016, -34662, -34308, -33924, -33570,
+    -33216, -32832, -32477, -32093, -31738, -31384, -31000, -30646,
+    -30292, -29908, -29554, -29199, -28815, -28460, -28076, -27722,
+    -27368, -26985, -26630, -26276, -25892, -25537, -25153, -24799,
+    -24444, -24061, -23707, -23352, -22968, -22614, -22259, -21875,
+    -21521, -21137, -20783, -20429, -20045, -19690, -19336, -18952,
+    -18597, -18213, -17859, -17505, -17121, -16767, -16413, -16028,
+    -15674, -15319, -14935, -14581, -14198, -13844, -13489, -13105,
+    -12750, -12396, -12012, -11658, -11274, -10920, -10566, -10182,
+    -9827, -9472, -9088, -8734, -8380, -7996, -7642, -7258,
+    -6904, -6549, -6165, -5810, -5456, -5072, -4718, -4334,
+    -3980, -3626, -3242, -2887, -2533, -2149, -1794, -1440,
+    -1057, -702, -318, 36, 391, 775, 1129, 1483,
+    1867, 2221, 2605, 2959, 3314, 3698, 4053, 4407,
+    4791, 5145, 5529, 5883, 6237, 6622, 6976, 7331,
+    7715, 8069, 8423, 8806, 9161, 9545, 9900, 10254,
+    10638, 10992, 11346, 11730, 12084, 12439, 12823, 13177,
+    13562, 13916, 14270, 14654, 15008, 15362, 15746, 16101,
+    16485, 16839, 17194, 17578, 17932, 18286, 18670, 19024,
+    19379, 19763, 20117, 20501, 20856, 21210, 21593, 21948,
+    22302, 22686, 23041, 23425, 23779, 24133, 24517, 24871,
+    25225, 25609, 25964, 26319, 26703, 27057, 27441, 27795,
+    28149, 28533, 28887, 29242,
+)
+
+MONTH_DATA = (
+    24210, 3730, 77094, 1323, 2647, 53974, 2922, 1748,
+    28489, 1865, 95891, 2709, 1323, 68187, 2861, 3434,
+    39780, 2980, 2889, 23187, 2709, 79149, 1366, 2741,
+    54698, 3538, 3492, 32074, 3402, 92821, 2711, 1366,
+    68277, 2777, 1746, 36517, 3877, 1610, 19607, 2731,
+    87386, 1386, 2921, 55122, 1938, 2853, 38475, 2635,
+    95403, 685, 1453, 68521, 3497, 3474, 40229, 3365,
+    2645, 13485, 694, 95669, 1748, 3785, 56978, 3730,
+    3366, 27222, 2651, 94934, 2922, 1876, 61257, 1865,
+    1683, 46379, 1323, 2651, 30042, 1386, 60261, 2981,
+    2889, 55957, 2709, 1325, 35501, 2741, 1450, 19365,
+    3493, 64842, 3402, 3222, 46382, 1366, 2741, 30130,
+    1746, 69285, 1829, 1611, 52375, 1195, 1371, 35542,
+    2922, 1874, 30501, 2853, 64075, 2637, 1195, 42347,
+    1453, 2986, 31570, 3474, 64806, 3365, 2645, 54445,
+    1206, 1461, 36266, 3785, 3730, 32038, 2854, 59990,
+    2651, 1370, 42709, 1877, 1865, 28307, 1683, 70955,
+    1323, 2731, 54618, 1386, 2917, 38730, 2890, 2709,
+    29995, 1325, 60077, 2741, 1450, 43941, 3493, 3402,
+    40213, 3222, 80214, 1366, 2773, 54706, 1746, 3749,
+    36490, 1675, 3223, 26966, 1371, 60122, 2922, 1874,
+    46885, 2885, 2699, 38059, 1197, 76139, 1461, 2986,
+    56148, 3490, 3397, 47757, 2709, 1197, 18861, 1717,
+    60842, 3786, 3746, 48454, 3402, 2710, 30006, 1370,
+    84693, 2917, 1874, 52901, 1701, 1355, 43671, 2731,
+    1370, 27349, 2917, 63314, 3410, 2837, 46411, 1357,
+    2733, 38250, 1458, 2985, 23890, 3474, 56597, 3366,
+    2390, 35501, 2774, 1492, 19881, 3785, 52874, 1675,
+    3367, 43350, 2395, 2778, 30420, 1876, 1861, 22155,
+    2707, 54571, 1197, 2413, 35690, 2986, 2980, 31557,
+    3397, 64149, 2709, 1325, 43693, 2741, 3498, 40356,
+    3748, 81226, 3402, 2710, 54582, 1370, 2773, 38602,
+    1874, 3749, 27978, 1355, 60055, 2731, 1370, 43861,
+    2985, 1874, 39589, 2853, 72267, 2381, 2733, 62826,
+    1460, 2985, 48466, 3474, 3365, 31309, 2390, 70325,
+    2774, 1748, 44457, 3785, 3730, 36134, 1319, 84567,
+    2395, 2906, 54996, 1876, 1865, 46739, 2707, 1323,
+    27227, 2413, 60266, 3498, 2980, 47945, 3401, 2709,
+    38187, 1325, 2733, 21866, 3498, 56740, 3748, 3402,
+    43669, 2711, 1366, 27317, 2773, 71378, 1874, 3749,
+    46666, 1611, 2715, 38230, 1386, 2905, 22354, 1874,
+    56101, 2853, 2635, 45723, 2733, 1386, 19305, 2985,
+    64338, 3474, 3365, 47693, 2390, 693, 38317, 1748,
+    3497, 23954, 3730, 52518, 1319, 2647, 45750, 2778,
+    1748, 28329, 1865, 63123, 2707, 1323, 51803, 2413,
+    2922, 39764, 2980, 2889, 23187, 2709, 62763, 1325,
+    2733, 46442, 3506, 3492, 32073, 3402, 72341, 2710,
+    1366, 51893, 2773, 1746, 36517, 3749, 3658, 27798,
+    2715, 62806, 1386, 2905, 46930, 1874, 1829, 38475,
+    2635, 70315, 685, 1387, 52073, 3497, 3474, 39717,
+    3365, 88653, 2646, 694, 54701, 1748, 3497, 48530,
+    3730, 3366, 27222, 2647, 70326, 2906, 1748, 44745,
+    1865, 1683, 38183, 1323, 2651, 21850, 874, 64341,
+    2980, 2889, 47763, 2709, 1325, 27229, 2733, 79274,
+    1490, 3493, 48458, 3402, 2709, 38189, 1366, 2741,
+    21930, 1746, 52901, 3749, 3658, 44182, 3227, 1370,
+    27349, 2921, 96082, 1874, 2853, 54859, 2635, 1195,
+    42331, 1389, 2921, 23378, 3474, 64805, 3365, 2637,
+    46253, 694, 1461, 28073,
+)
+# fmt: on
@@ -208,6 +208,17 @@ def _to_dt64D(dt):
     return dt
 
 
+def _to_dt64D_array(dts):
+    """Vectorized equivalent of ``[_to_dt64D(dt) for dt in dts]``."""
+    try:
+        index = pd.DatetimeIndex(dts)
+    except (TypeError, ValueError):
+        # e.g. mix of timezone naive and timezone aware
+        return np.array([_to_dt64D(dt) for dt in dts], dtype="datetime64[D]")
+    # NB values of a timezone aware index are UTC, as with `_to_dt64D`
+    return index.values.astype("datetime64[D]")
+
+
 def _get_calendar(weekmask, holidays, calendar):
     """
     Generate busdaycalendar
@@ -227,15 +238,13 @@ def _get_calendar(weekmask, holidays, calendar):
 
     if holidays is None:
         holidays = []
-    # Handle non list holidays also (added)
-    if isinstance(holidays, pd.DatetimeIndex):
-        holidays = holidays.tolist()
+    # Convert with vectorized operations rather than by element (added)
+    holidays = _to_dt64D_array(holidays)
     try:
-        holidays = holidays + calendar.holidays().tolist()
+        holidays = np.concatenate([holidays, _to_dt64D_array(calendar.holidays())])
     except AttributeError:
         pass
-    holidays = [_to_dt64D(dt) for dt in holidays]
-    holidays = tuple(sorted(holidays))
+    holidays = tuple(np.sort(holidays))
 
     kwargs = {"weekmask": weekmask}
     if holidays:
@@ -273,6 +282,9 @@ class MultipleWeekmaskCustomBusinessDay(CompositeCustomBusinessDay):
         weekmasks=None,
     ):
         self._weekmasks = weekmasks
+        if not isinstance(calendar, np.busdaycalendar):
+            # evaluate holidays once for all weekmasks
+            calendar, holidays = _get_calendar(weekmask, holidays, calendar)
         if business_days is None and weekmasks is not None:
             calendars = [
                 _get_calendar(weekmask=weekmask, holidays=holidays, calendar=calendar)
@@ -305,3 +317,54 @@ class MultipleWeekmaskCustomBusinessDay(CompositeCustomBusinessDay):
     @weekmasks.setter
     def weekmasks(self, weekmasks):
         self._weekmasks = weekmasks
+
+
+def business_day_range(start, end, day):
+    """Return business days of a CustomBusinessDay between two dates.
+
+    Rather than stepping through the range with `day`, as does
+    ``pd.date_range(start, end, freq=day)``, business days are evaluated
+    with boolean masks over the daily range. Each period of a
+    CompositeCustomBusinessDay (e.g. a MultipleWeekmaskCustomBusinessDay)
+    is masked with the `numpy.busdaycalendar` of the period. (NB stepping
+    with a CompositeCustomBusinessDay can skip business days at the edges
+    of a period.) Returned index does not have a `freq`.
+
+    Falls back to ``pd.date_range`` if `day` is not a CustomBusinessDay
+    of a single day, or `start` or `end` are not timezone naive dates.
+    """
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    bdays = [day]
+    if isinstance(day, CompositeCustomBusinessDay):
+        bdays += [bday for _, _, bday in day.business_days]
+    if not (
+        all(_is_busday_offset(bday) for bday in bdays)
+        and start.tz is None
+        and end.tz is None
+        and _is_normalized(start)
+        and _is_normalized(end)
+    ):
+        return pd.DatetimeIndex(pd.date_range(start, end, freq=day), freq=None)
+
+    days = np.arange(_to_dt64D(start), _to_dt64D(end) + 1, dtype="datetime64[D]")
+    mask = np.is_busday(days, busdaycal=day.calendar)
+    if isinstance(day, CompositeCustomBusinessDay):
+        for start_date, end_date, bday in day.business_days:
+            i = 0
+            if start_date is not None:
+                i = days.searchsorted(_to_dt64D(pd.Timestamp(start_date)))
+            j = len(days)
+            if end_date is not None:
+                j = days.searchsorted(_to_dt64D(pd.Timestamp(end_date)), "right")
+            mask[i:j] = np.is_busday(days[i:j], busdaycal=bday.calendar)
+    return pd.DatetimeIndex(days[mask].astype("datetime64[ns]"))
+
+
+def _is_busday_offset(day):
+    """Query if `day` offsets by a single business day of its calendar."""
+    return (
+        isinstance(day, CustomBusinessDay)
+        and day.n == 1
+        and not day.offset
+        and isinstance(day.calendar, np.busdaycalendar)
+    )
@@ -0,0 +1,231 @@
+"""Process-wide cache of evaluated holiday rules.
+
+Many calendars define holidays with identical rules, for example the rules
+returned by the factories of `common_holidays`. The cache stores the date
+on which each rule is observed in each year, such that a rule is evaluated
+for any year only once regardless of how many calendars (or calendar
+instances) define it. A request for a range of years that overlaps the
+years already cached for a rule evaluates only the years that are not
+already cached.
+
+Rules are keyed on the parameters that determine the dates on which they
+are observed (month, day, offset and observance), not on the rule object,
+such that identical rules defined separately share a cache entry. Only
+rules evaluated with the implementation of pandas Holiday are cached (see
+`exchange_calendars.pandas_extensions.holiday.holiday_dates`).
+
+The cache is enabled by default. It is bounded by `maxsize`, the total
+number of years that can be cached over all rules. Rules are evicted on a
+least-recently-used basis. Set `maxsize` to 0 to disable the cache.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+import threading
+from typing import NamedTuple
+
+import numpy as np
+
+DEFAULT_MAXSIZE = 500_000
+
+
+class RuleCacheInfo(NamedTuple):
+    """Statistics of the rule cache.
+
+    Attributes
+    ----------
+    hits
+        Number of requests served entirely by years already cached.
+
+    misses
+        Number of requests that required evaluating years not cached.
+
+    evictions
+        Number of rules evicted from the cache to accommodate `maxsize`.
+
+    maxsize
+        Maximum number of years that can be cached, over all rules.
+
+    currsize
+        Number of years currently cached, over all rules.
+
+    rules
+        Number of rules currently cached.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+    rules: int
+
+
+class _RuleCacheEntry(NamedTuple):
+    """Dates of a rule cached by `_RuleCache`."""
+
+    first_year: int
+    # dates[i] is date observed in year `first_year` + i, NaT if not observed.
+    dates: np.ndarray
+
+
+class _RuleCache:
+    """Least-recently-used cache of dates observed by holiday rules.
+
+    Parameters
+    ----------
+    maxsize
+        Maximum number of years that can be cached, over all rules. Years
+        of a rule that would alone exceed `maxsize` are not cached.
+    """
+
+    def __init__(self, maxsize: int):
+        self._lock = threading.RLock()
+        self._cache: OrderedDict[Hashable, _RuleCacheEntry] = OrderedDict()
+        self._currsize = 0
+        self._hits = self._misses = self._evictions = 0
+        self.set_maxsize(maxsize)
+
+    def set_maxsize(self, maxsize: int):
+        """Set maximum number of years that can be cached."""
+        if maxsize < 0:
+            raise ValueError(f"`maxsize` cannot be negative, received {maxsize}.")
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def info(self) -> RuleCacheInfo:
+        """Return statistics of the cache."""
+        with self._lock:
+            return RuleCacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                self._currsize,
+                len(self._cache),
+            )
+
+    def clear(self):
+        """Clear the cache and its statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._currsize = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def _evict(self):
+        """Evict least recently used rules to accommodate `maxsize`."""
+        while self._currsize > self.maxsize:
+            _, evicted = self._cache.popitem(last=False)
+            self._currsize -= len(evicted.dates)
+            self._evictions += 1
+
+    def get(
+        self,
+        key: Hashable,
+        first_year: int,
+        last_year: int,
+        evaluate: Callable[[int, int], np.ndarray],
+    ) -> np.ndarray:
+        """Get dates observed by a rule over a range of years.
+
+        Parameters
+        ----------
+        key
+            Key identifying the rule.
+
+        first_year, last_year
+            Range of years, inclusive of both.
+
+        evaluate
+            Callable that evaluates dates of the rule. Should take
+            parameters `first_year` and `last_year` and return a
+            datetime64[ns] array with the date observed in each year of
+            the range, NaT if not observed.
+
+        Returns
+        -------
+        np.ndarray
+            Read-only datetime64[ns] array with date observed in each year
+            from `first_year` through `last_year`, NaT if not observed.
+        """
+        if last_year < first_year or not self.maxsize:
+            return evaluate(first_year, last_year)
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                entry_last = entry.first_year + len(entry.dates) - 1
+                if entry.first_year <= first_year and last_year <= entry_last:
+                    self._hits += 1
+                    start = first_year - entry.first_year
+                    return entry.dates[start : start + last_year - first_year + 1]
+                # evaluate only years not already cached.
+                arrays = [entry.dates]
+                if first_year < entry.first_year:
+                    arrays.insert(0, evaluate(first_year, entry.first_year - 1))
+                if last_year > entry_last:
+                    arrays.append(evaluate(entry_last + 1, last_year))
+                dates = np.concatenate(arrays)
+                first_year_ = min(first_year, entry.first_year)
+                self._currsize -= len(entry.dates)
+                del self._cache[key]
+            else:
+                dates = evaluate(first_year, last_year)
+                first_year_ = first_year
+            self._misses += 1
+
+            dates.flags.writeable = False
+            if len(dates) <= self.maxsize:
+                self._cache[key] = _RuleCacheEntry(first_year_, dates)
+                self._currsize += len(dates)
+                self._evict()
+            start = first_year - first_year_
+            return dates[start : start + last_year - first_year + 1]
+
+
+_cache = _RuleCache(DEFAULT_MAXSIZE)
+
+
+def get(
+    key: Hashable,
+    first_year: int,
+    last_year: int,
+    evaluate: Callable[[int, int], np.ndarray],
+) -> np.ndarray:
+    """Get dates observed by a rule over a range of years.
+
+    See `_RuleCache.get`.
+    """
+    return _cache.get(key, first_year, last_year, evaluate)
+
+
+def info() -> RuleCacheInfo:
+    """Return statistics of the rule cache."""
+    return _cache.info()
+
+
+def clear():
+    """Clear the rule cache and its statistics."""
+    _cache.clear()
+
+
+def set_maxsize(maxsize: int):
+    """Set maximum number of years that can be cached, over all rules.
+
+    Parameters
+    ----------
+    maxsize
+        Maximum number of years that can be cached. Least recently used
+        rules will be evicted as required to accommodate `maxsize`. Pass 0
+        to disable the cache.
+    """
+    _cache.set_maxsize(maxsize)
+
+
+def get_maxsize() -> int:
+    """Return maximum number of years that can be cached, over all rules."""
+    return _cache.maxsize
@@ -0,0 +1,290 @@
+"""Opt-in persistent on-disk cache of evaluated calendar schedules.
+
+Evaluating a calendar's schedule requires evaluating every holiday rule
+and special open/close rule over the calendar's full range. The cache
+stores the evaluated schedule to disk such that subsequent constructions
+of the same calendar over the same range, including from other
+processes, can load the schedule rather than re-evaluate it.
+
+The cache is disabled by default. Enable it with `enable` or by setting
+the environment variable EXCHANGE_CALENDARS_SCHEDULE_CACHE to the path of
+the cache directory.
+
+Each schedule is stored as a directory of .npy files, one file for each
+array of the schedule (all stored as int64 nanoseconds). Arrays are
+loaded as read-only memory maps.
+
+Cached schedules are keyed on the calendar class and the `start` and
+`end` dates over which the schedule was evaluated. The key also includes
+a digest of the version of exchange_calendars, pandas and the
+dependencies that provide holiday data (tzdata and pyluach), of the
+source of all modules that define the calendar class and, if the
+calendar's timezone is loaded from the system's time zone database, of
+the timezone's zone file. Any change to a calendar's definition will
+result in the schedule being re-evaluated. The cache should not be used
+with calendars that have a schedule that depends on anything other than
+the class and the `start` and `end` dates.
+
+The schedule is independent of the calendar's `side`, hence a schedule
+cached for one side will be used for all sides.
+
+NOTE: The `sessions` of a calendar with a schedule loaded from the cache
+do not have a `freq` (validating the frequency would be as costly as
+evaluating the sessions).
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import importlib.metadata
+import inspect
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+import zoneinfo
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from exchange_calendars import ExchangeCalendar
+
+ENV_VAR = "EXCHANGE_CALENDARS_SCHEDULE_CACHE"
+
+FIELDS = (
+    "sessions",
+    "opens",
+    "break_starts",
+    "break_ends",
+    "closes",
+    "late_opens",
+    "early_closes",
+)
+
+# Distributions, other than pandas, on which evaluated schedules depend.
+_DEPENDENCIES = ("tzdata", "pyluach")
+
+_PACKAGE_DIR = pathlib.Path(__file__).parent
+
+_path: pathlib.Path | None = None
+
+
+def enable(path: str | os.PathLike):
+    """Enable the schedule cache.
+
+    Parameters
+    ----------
+    path
+        Path to the cache directory. Will be created if it does not
+        already exist.
+    """
+    global _path
+    path = pathlib.Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    _path = path
+
+
+def disable():
+    """Disable the schedule cache.
+
+    Cached schedules are not removed from disk (see `clear`).
+    """
+    global _path
+    _path = None
+
+
+def is_enabled() -> bool:
+    """Query if the schedule cache is enabled."""
+    return _path is not None
+
+
+def get_path() -> pathlib.Path | None:
+    """Path to the cache directory, or None if cache not enabled."""
+    return _path
+
+
+def clear():
+    """Remove all schedules from the cache directory."""
+    if _path is None:
+        return
+    for path in _path.iterdir():
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def _get_version() -> str:
+    from exchange_calendars import __version__
+
+    return str(__version__)
+
+
+def _get_dependency_versions() -> dict[str, str]:
+    """Versions of `_DEPENDENCIES`, empty string if not installed."""
+    versions = {}
+    for name in _DEPENDENCIES:
+        try:
+            versions[name] = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            versions[name] = ""
+    return versions
+
+
+@functools.lru_cache
+def _source_digest(filename: str) -> str:
+    return hashlib.sha256(pathlib.Path(filename).read_bytes()).hexdigest()
+
+
+def _zone_file(key: str) -> pathlib.Path | None:
+    """Path to system zone file for timezone `key`.
+
+    Returns None if timezone `key` is not loaded from a system zone file
+    (in which case it is loaded from the tzdata package).
+    """
+    for tzpath in zoneinfo.TZPATH:
+        path = pathlib.Path(tzpath, key)
+        if path.is_file():
+            return path
+    return None
+
+
+@functools.lru_cache
+def _package_digest() -> str:
+    """Digest of all source modules of exchange_calendars."""
+    hasher = hashlib.sha256()
+    hasher.update(_get_version().encode())
+    hasher.update(pd.__version__.encode())
+    for name, version in _get_dependency_versions().items():
+        hasher.update(f"{name}=={version}".encode())
+    for filename in sorted(_PACKAGE_DIR.rglob("*.py")):
+        hasher.update(str(filename.relative_to(_PACKAGE_DIR)).encode())
+        hasher.update(_source_digest(str(filename)).encode())
+    return hasher.hexdigest()
+
+
+def _definition_digest(cls: type[ExchangeCalendar]) -> str:
+    """Digest of all source that could affect the schedule of `cls`.
+
+    Includes digest of all exchange_calendars modules together with any
+    module outside of the package that defines a class in the mro of
+    `cls` and any system zone file from which the calendar's timezone is
+    loaded.
+    """
+    hasher = hashlib.sha256(_package_digest().encode())
+    tz = getattr(cls, "tz", None)
+    if isinstance(tz, zoneinfo.ZoneInfo) and tz.key is not None:
+        path = _zone_file(tz.key)
+        if path is not None:
+            hasher.update(_source_digest(str(path.resolve())).encode())
+    for klass in cls.__mro__:
+        module = sys.modules.get(klass.__module__)
+        if module is None or klass.__module__ == "builtins":
+            continue
+        try:
+            filename = inspect.getsourcefile(module)
+        except TypeError:
+            filename = None
+        if filename is None:
+            # source not available, fall back to identity of class.
+            hasher.update(klass.__qualname__.encode())
+            continue
+        path = pathlib.Path(filename).resolve()
+        if _PACKAGE_DIR.resolve() in path.parents:
+            continue
+        hasher.update(_source_digest(str(path)).encode())
+    return hasher.hexdigest()
+
+
+def _key(cls: type[ExchangeCalendar], start: pd.Timestamp, end: pd.Timestamp) -> str:
+    """Name of directory in which a schedule is cached."""
+    name = f"{cls.__module__}.{cls.__qualname__}"
+    digest = _definition_digest(cls)[:16]
+    return f"{name}_{start:%Y%m%d}_{end:%Y%m%d}_{digest}"
+
+
+def load(
+    cls: type[ExchangeCalendar], start: pd.Timestamp, end: pd.Timestamp
+) -> dict[str, np.ndarray] | None:
+    """Load a schedule from the cache.
+
+    Parameters
+    ----------
+    cls
+        Calendar class.
+
+    start
+        Date from which schedule evaluated.
+
+    end
+        Date through which schedule evaluated.
+
+    Returns
+    -------
+    dict[str, np.ndarray] | None
+        Mapping with keys as `FIELDS` and values as read-only memory
+        mapped int64 arrays. None if cache not enabled or schedule not
+        cached.
+    """
+    if _path is None:
+        return None
+    path = _path / _key(cls, start, end)
+    if not path.is_dir():
+        return None
+    try:
+        return {
+            field: np.load(path / f"{field}.npy", mmap_mode="r") for field in FIELDS
+        }
+    except (OSError, ValueError):
+        # incomplete or corrupt entry, treat as not cached
+        return None
+
+
+def store(
+    cls: type[ExchangeCalendar],
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+    arrays: dict[str, np.ndarray],
+):
+    """Store a schedule to the cache.
+
+    Does nothing if the cache is not enabled.
+
+    Parameters
+    ----------
+    cls
+        Calendar class.
+
+    start
+        Date from which schedule evaluated.
+
+    end
+        Date through which schedule evaluated.
+
+    arrays
+        Mapping with keys as `FIELDS` and values as int64 arrays.
+    """
+    if _path is None:
+        return
+    path = _path / _key(cls, start, end)
+    if path.is_dir():
+        return
+    # write to temporary directory and then move into place such that
+    # other processes never see a partially written entry.
+    tmp = pathlib.Path(tempfile.mkdtemp(dir=_path, prefix=".tmp"))
+    try:
+        for field in FIELDS:
+            np.save(tmp / f"{field}.npy", np.asarray(arrays[field], dtype=np.int64))
+        os.replace(tmp, path)
+    except OSError:
+        # another process stored the same schedule first.
+        pass
+    finally:
+        if tmp.exists():
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+if os.environ.get(ENV_VAR):
+    enable(os.environ[ENV_VAR])
@@ -0,0 +1,272 @@
+"""Share evaluated calendars between processes via shared memory.
+
+A calendar evaluated in one process can be published to a block of shared
+memory with `publish`. The returned `SharedCalendar` is a lightweight,
+picklable handle that can be passed to other processes, for example to the
+workers of a `concurrent.futures.ProcessPoolExecutor`, where `attach`
+returns a calendar backed by the shared arrays, i.e. without re-evaluating
+or copying the calendar's schedule or minutes.
+
+Arrays published to shared memory include the calendar's sessions, the
+bounds of every session, the first and last minutes of every session and
+subsession and, optionally, all trading minutes (`minutes_nanos`). The
+arrays of an attached calendar are read-only.
+
+Lifecycle
+---------
+The process that publishes a calendar owns the shared memory block and is
+responsible for releasing it with `SharedCalendar.unlink`, which can be
+managed by using the `SharedCalendar` as a context manager. On POSIX
+systems calendars already attached in other processes remain valid after
+the block is unlinked. Any calendar attached in a process retains the
+mapped memory until the calendar, and any array taken from it, is no
+longer referenced. Repeated calls to `attach` from the same process
+return the same calendar for as long as that calendar is referenced.
+
+NOTE: On Python versions prior to 3.13 attaching to a shared memory block
+registers the block with the attaching process's resource tracker. Only
+attach from processes that share the resource tracker of the publishing
+process, for example processes started by the publishing process, as
+otherwise the block will be unlinked when the attaching process exits.
+"""
+
+from __future__ import annotations
+
+import sys
+import weakref
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .exchange_calendar import _to_nanos
+
+if TYPE_CHECKING:
+    from exchange_calendars import ExchangeCalendar
+
+# fields evaluated from the schedule, shared as calendar's cached properties
+MINUTE_FIELDS = (
+    "first_minutes_nanos",
+    "last_minutes_nanos",
+    "last_am_minutes_nanos",
+    "first_pm_minutes_nanos",
+)
+
+# calendars attached in this process, keyed by name of shared memory block
+_attached: weakref.WeakValueDictionary[str, ExchangeCalendar] = (
+    weakref.WeakValueDictionary()
+)
+
+
+class _SharedMemory(shared_memory.SharedMemory):
+    """SharedMemory that can be discarded whilst arrays view its buffer.
+
+    The buffer, and hence the mapped memory, remains valid for so long as
+    any array views it.
+    """
+
+    def __del__(self):
+        try:
+            self.close()
+        except (BufferError, OSError):
+            pass
+
+
+def _attach_shared_memory(name: str) -> _SharedMemory:
+    if sys.version_info >= (3, 13):
+        return _SharedMemory(name, track=False)
+    return _SharedMemory(name)
+
+
+class SharedCalendar:
+    """Handle to a calendar published to shared memory.
+
+    Instances are returned by `publish` and should not be created
+    directly. Instances can be pickled to pass the handle to another
+    process, in which `attach` returns the shared calendar.
+
+    Parameters
+    ----------
+    name
+        Name of shared memory block.
+
+    cls
+        Class of published calendar.
+
+    side
+        `side` of published calendar.
+
+    layout
+        Mapping of field name to (start, length) of field's array within
+        the shared memory block, in units of int64.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        cls: type[ExchangeCalendar],
+        side: str,
+        layout: dict[str, tuple[int, int]],
+    ):
+        self._name = name
+        self._cls = cls
+        self._side = side
+        self._layout = layout
+        # shared memory block, only set on instance returned by `publish`
+        self._shm: shared_memory.SharedMemory | None = None
+
+    def __reduce__(self):
+        return (type(self), (self._name, self._cls, self._side, self._layout))
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(name={self._name!r},"
+            f" calendar={self._cls.__qualname__}, side={self._side!r})"
+        )
+
+    def __enter__(self) -> SharedCalendar:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.unlink()
+
+    @property
+    def name(self) -> str:
+        """Name of shared memory block."""
+        return self._name
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Names of arrays published to shared memory."""
+        return tuple(self._layout)
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes of published arrays."""
+        return sum(length for _, length in self._layout.values()) * 8
+
+    def attach(self) -> ExchangeCalendar:
+        """Return calendar backed by the shared memory block.
+
+        Returns
+        -------
+        ExchangeCalendar
+            Calendar of the published class and `side`. All published
+            arrays are read-only views of the shared memory block.
+            Calendar is the same instance as returned by any earlier call
+            from this process for so long as that instance is referenced.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the shared memory block has been unlinked.
+        """
+        cal = _attached.get(self._name)
+        if cal is not None:
+            return cal
+
+        shm = _attach_shared_memory(self._name)
+        size = sum(length for _, length in self._layout.values())
+        buf = np.ndarray(size, dtype=np.int64, buffer=shm.buf)
+        buf.flags.writeable = False
+        arrays = {
+            field: buf[start : start + length]
+            for field, (start, length) in self._layout.items()
+        }
+
+        cal = object.__new__(self._cls)
+        cal._side = self._side
+        cal._evaluation_timings = {}
+        cal._set_schedule_nanos(arrays)
+        cal.__dict__["sessions_nanos"] = arrays["sessions"]
+        for field in MINUTE_FIELDS + ("minutes_nanos",):
+            if field in arrays:
+                cal.__dict__[field] = arrays[field]
+        cal._shared_memory = shm
+        _attached[self._name] = cal
+        return cal
+
+    def unlink(self):
+        """Release the shared memory block.
+
+        Should be called, once, by the publishing process when the block
+        is no longer required. Does nothing if called on a handle that
+        was not returned by `publish` or if the block was already
+        unlinked.
+        """
+        if self._shm is None:
+            return
+        shm, self._shm = self._shm, None
+        shm.close()
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def publish(calendar: ExchangeCalendar, minutes: bool = True) -> SharedCalendar:
+    """Publish a calendar to shared memory.
+
+    Parameters
+    ----------
+    calendar
+        Calendar to publish.
+
+    minutes
+        Whether to publish all trading minutes (`minutes_nanos`), which
+        will be evaluated if not already evaluated. If False, calendars
+        attached to the shared memory block will evaluate trading minutes
+        only if and when required.
+
+    Returns
+    -------
+    SharedCalendar
+        Handle to the published calendar. Pass to other processes and
+        call `attach` to get the shared calendar. Call `unlink` (or use
+        as a context manager) to release the shared memory block when no
+        longer required.
+
+    Examples
+    --------
+    >>> import exchange_calendars as xcals
+    >>> from exchange_calendars import shared_calendars
+    >>> cal = xcals.get_calendar("XHKG", start="2021", end="2021-12-31")
+    >>> with shared_calendars.publish(cal) as shared:
+    ...     attached = shared.attach()  # typically in another process
+    ...     attached.sessions.equals(cal.sessions)
+    True
+    """
+    arrays = {
+        "sessions": calendar.sessions_nanos,
+        "opens": calendar.opens_nanos,
+        "break_starts": calendar.break_starts_nanos,
+        "break_ends": calendar.break_ends_nanos,
+        "closes": calendar.closes_nanos,
+        "late_opens": _to_nanos(calendar.late_opens),
+        "early_closes": _to_nanos(calendar.early_closes),
+    }
+    for field in MINUTE_FIELDS:
+        arrays[field] = getattr(calendar, field)
+    if minutes:
+        arrays["minutes_nanos"] = calendar.minutes_nanos
+
+    layout, size = {}, 0
+    for field, array in arrays.items():
+        layout[field] = (size, len(array))
+        size += len(array)
+
+    # NB a shared memory block cannot have a size of 0
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1) * 8)
+    try:
+        buf = np.ndarray(size, dtype=np.int64, buffer=shm.buf)
+        for field, (start, length) in layout.items():
+            buf[start : start + length] = arrays[field]
+        del buf  # release export of shm.buf
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+
+    shared = SharedCalendar(shm.name, type(calendar), calendar.side, layout)
+    shared._shm = shm
+    return shared
@@ -1,8 +1,13 @@
 """
 Tests for ExchangeCalendarDispatcher.
 """
+
+from concurrent.futures import ThreadPoolExecutor
+import datetime
 from unittest import TestCase
 import re
+import subprocess
+import sys
 
 import pandas as pd
 import pytest
@@ -164,3 +169,157 @@ class CalendarDispatcherTestCase(TestCase):
         self.assertIs(cal3, cal4)
         cal5 = self.dispatcher.get_calendar("IEPA", start=start, end=end, side="left")
         self.assertIsNot(cal4, cal5)
+
+    def test_get_calendar_cache_lru(self):
+        dispatcher = ExchangeCalendarDispatcher(
+            **{k: v.copy() for k, v in self.dispatcher_kwargs.items()}, maxsize=2
+        )
+        ends = [pd.Timestamp(end) for end in ("2020-01-31", "2020-02-28")]
+        start = pd.Timestamp("2020-01-02")
+        cal = dispatcher.get_calendar("IEPA", start=start, end=ends[0])
+        cal2 = dispatcher.get_calendar("IEPA", start=start, end=ends[1])
+        self.assertIs(cal, dispatcher.get_calendar("IEPA", start=start, end=ends[0]))
+        info = dispatcher.cache_info()
+        self.assertEqual((info.hits, info.misses, info.evictions), (1, 2, 0))
+        self.assertEqual((info.maxsize, info.currsize), (2, 2))
+
+        # cal2 now least recently used and should be evicted
+        dispatcher.get_calendar("IEPA", start=start, end=ends[0], side="right")
+        info = dispatcher.cache_info()
+        self.assertEqual((info.hits, info.misses, info.evictions), (1, 3, 1))
+        self.assertEqual(info.currsize, 2)
+        self.assertIsNot(
+            cal2, dispatcher.get_calendar("IEPA", start=start, end=ends[1])
+        )
+        self.assertEqual(dispatcher.cache_info().evictions, 2)
+
+        dispatcher.maxsize = 1
+        info = dispatcher.cache_info()
+        self.assertEqual((info.evictions, info.maxsize, info.currsize), (3, 1, 1))
+
+        dispatcher.cache_clear()
+        self.assertEqual(tuple(dispatcher.cache_info()), (0, 0, 0, 0, 1, 0))
+
+    def test_get_calendar_cache_slices(self):
+        start = pd.Timestamp("2019-01-02")
+        end = pd.Timestamp("2021-12-31")
+        cal = self.dispatcher.get_calendar("IEPA", start=start, end=end, side="right")
+
+        start_ = pd.Timestamp("2020-01-04")  # not a session
+        end_ = pd.Timestamp("2020-06-30")
+        sliced = self.dispatcher.get_calendar(
+            "IEPA", start=start_, end=end_, side="right"
+        )
+        self.assertEqual(self.dispatcher.cache_info().slices, 1)
+        self.assertIsNot(cal, sliced)
+        expected = IEPAExchangeCalendar(start_, end_, side="right")
+        pd.testing.assert_frame_equal(sliced.schedule, expected.schedule)
+        pd.testing.assert_index_equal(sliced.early_closes, expected.early_closes)
+        self.assertEqual(sliced.side, "right")
+        # verify sliced calendar is cached
+        self.assertIs(
+            sliced,
+            self.dispatcher.get_calendar("IEPA", start=start_, end=end_, side="right"),
+        )
+
+        # verify not sliced if range not covered or side differs
+        self.dispatcher.get_calendar("IEPA", start=start_, end=end_)
+        self.dispatcher.get_calendar("IEPA", start=start_, end="2022-01-31")
+        info = self.dispatcher.cache_info()
+        self.assertEqual((info.hits, info.misses, info.slices), (1, 4, 1))
+
+    def test_get_calendar_cache_modified(self):
+        # verify a calendar modified in place is not served by the cache
+        start, end = pd.Timestamp("2020-01-02"), pd.Timestamp("2020-12-31")
+        cal = self.dispatcher.get_calendar("IEPA", start=start, end=end)
+        cal.extend("2021-06-30")
+        self.assertEqual(self.dispatcher.cache_info().currsize, 1)
+        cal2 = self.dispatcher.get_calendar("IEPA", start=start, end=end)
+        self.assertIsNot(cal, cal2)
+        self.assertEqual(cal2.last_session, pd.Timestamp("2020-12-31"))
+        # modified calendar was evicted, not sliced
+        cal2.extend_back("2019-12-02")
+        sliced = self.dispatcher.get_calendar("IEPA", start="2020-02-03", end=end)
+        self.assertIsNot(sliced, cal2)
+        expected = IEPAExchangeCalendar("2020-02-03", end)
+        pd.testing.assert_frame_equal(sliced.schedule, expected.schedule)
+        info = self.dispatcher.cache_info()
+        self.assertEqual((info.hits, info.misses, info.slices), (0, 3, 0))
+        self.assertEqual(info.currsize, 1)
+
+    def test_get_calendar_cache_patched(self):
+        # verify a calendar patched in place is not served by the cache
+        date = pd.Timestamp("2020-03-05")
+        cal = self.dispatcher.get_calendar("IEPA")
+        cal.add_holidays(date)
+        sliced = self.dispatcher.get_calendar(
+            "IEPA", start="2020-01-02", end="2020-06-30"
+        )
+        self.assertTrue(sliced.is_session(date))
+        cal2 = self.dispatcher.get_calendar("IEPA")
+        self.assertIsNot(cal, cal2)
+        self.assertTrue(cal2.is_session(date))
+        self.assertFalse(cal.is_session(date))
+
+        cal2.add_special_closes(datetime.time(12), date)
+        self.assertIsNot(cal2, self.dispatcher.get_calendar("IEPA"))
+        info = self.dispatcher.cache_info()
+        self.assertEqual((info.hits, info.misses, info.slices), (0, 4, 0))
+
+    def test_get_calendar_cache_thread_safe(self):
+        constructed = []
+
+        class Counted(IEPAExchangeCalendar):
+            def __init__(self, *args, **kwargs):
+                constructed.append(None)
+                super().__init__(*args, **kwargs)
+
+        self.dispatcher.register_calendar_type("COUNTED", Counted)
+        kwargs = dict(start="2020-01-02", end="2020-12-31")
+        with ThreadPoolExecutor(8) as executor:
+            futures = [
+                executor.submit(self.dispatcher.get_calendar, "COUNTED", **kwargs)
+                for _ in range(16)
+            ]
+            cals = [future.result() for future in futures]
+        self.assertEqual(len(constructed), 1)
+        self.assertTrue(all(cal is cals[0] for cal in cals))
+        info = self.dispatcher.cache_info()
+        self.assertEqual((info.hits, info.misses), (15, 1))
+
+    def test_deregister_calendar_clears_cache(self):
+        cal = self.dispatcher.get_calendar("IEPA")
+        self.assertEqual(self.dispatcher.cache_info().currsize, 1)
+        self.dispatcher.deregister_calendar("IEPA")
+        self.assertEqual(self.dispatcher.cache_info().currsize, 0)
+        self.dispatcher.register_calendar_type("IEPA", IEPAExchangeCalendar)
+        self.assertIsNot(cal, self.dispatcher.get_calendar("IEPA"))
+
+
+def test_default_calendars_imported_lazily():
+    """Test calendar modules only imported when calendar requested."""
+    code = (
+        "import sys\n"
+        "import exchange_calendars as xcals\n"
+        "def imported():\n"
+        "    prefix = 'exchange_calendars.exchange_calendar_'\n"
+        "    return sorted(m for m in sys.modules if m.startswith(prefix))\n"
+        "assert 'XNYS' in xcals.get_calendar_names()\n"
+        "assert xcals.resolve_alias('NYSE') == 'XNYS'\n"
+        "assert not imported(), imported()\n"
+        "assert xcals.get_calendar('NYSE').name == 'XNYS'\n"
+        "assert imported() == ['exchange_calendars.exchange_calendar_xnys'], imported()\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_calendar_classes_accessible_from_calendar_utils():
+    from exchange_calendars import calendar_utils
+    from exchange_calendars.exchange_calendar_xhkg import XHKGExchangeCalendar
+
+    assert calendar_utils.XHKGExchangeCalendar is XHKGExchangeCalendar
+    factory = calendar_utils._default_calendar_factories["XHKG"]
+    assert factory.resolve() is XHKGExchangeCalendar
+    assert factory.default_start() == XHKGExchangeCalendar.default_start()
+    with pytest.raises(AttributeError):
+        calendar_utils.NotACalendar
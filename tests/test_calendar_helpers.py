@@ -25,7 +25,7 @@ from exchange_calendars.calendar_utils import XTAEExchangeCalendar
 
 from .test_exchange_calendar import Answers
 
-# TODO tests for next_divider_idx, previous_divider_idx, compute_minutes (#15)
+# TODO tests for next_divider_idx, previous_divider_idx (#15)
 
 
 def test_constants():
@@ -369,6 +369,148 @@ def test_parse_session(
         m.parse_session(calendar, date_too_late, param_name)
 
 
+def test_parse_timestamp_nanos(calendar, param_name, minute_too_early, minute_too_late):
+    expected = pd.Timestamp("2021-06-03 01:31", tz=UTC)
+    inputs = [
+        expected,
+        expected.tz_convert(ZoneInfo("Asia/Hong_Kong")),
+        expected.value,
+        np.int64(expected.value),
+        np.datetime64("2021-06-03T01:31"),
+        "2021-06-03 01:31",
+    ]
+    for timestamp in inputs:
+        rtrn = m.parse_timestamp_nanos(timestamp, param_name, calendar)
+        assert rtrn == expected.value
+        assert isinstance(rtrn, int)
+        # verify consistent with parse_timestamp
+        assert m.parse_timestamp(timestamp, param_name, calendar) == expected
+
+    nanos = expected.value + pd.Timedelta(30, "s").value
+    rtrn = m.parse_timestamp_nanos(nanos, param_name, side="left", raise_oob=False)
+    assert rtrn == expected.value
+    rtrn = m.parse_timestamp_nanos(nanos, param_name, side="right", raise_oob=False)
+    assert rtrn == (expected + pd.Timedelta(1, "min")).value
+    with pytest.raises(ValueError, match="cannot have a non-zero second"):
+        m.parse_timestamp_nanos(nanos, param_name, side="both", raise_oob=False)
+    with pytest.raises(ValueError, match="`side` or `calendar` must be passed"):
+        m.parse_timestamp_nanos(nanos, param_name, raise_oob=False)
+
+    for oob in (minute_too_early, minute_too_late):
+        error_msg = f"Parameter `{param_name}` receieved as '{oob}' although"
+        for timestamp in (oob, oob.value, oob.tz_localize(None).to_datetime64()):
+            with pytest.raises(errors.MinuteOutOfBounds, match=re.escape(error_msg)):
+                m.parse_timestamp_nanos(timestamp, param_name, calendar)
+        rtrn = m.parse_timestamp_nanos(oob.value, param_name, raise_oob=False)
+        assert rtrn == oob.value
+
+
+def test_parse_date_nanos(calendar, param_name, date_too_early, date_too_late):
+    expected = pd.Timestamp("2021-06-05")
+    inputs = [expected, expected.value, np.datetime64("2021-06-05"), "2021-06-05"]
+    for date in inputs:
+        rtrn = m.parse_date_nanos(date, param_name, calendar)
+        assert rtrn == expected.value
+        assert isinstance(rtrn, int)
+        assert m.parse_date(date, param_name, calendar) == expected
+
+    with pytest.raises(ValueError, match="a Date must have a time component of 00:00"):
+        m.parse_date_nanos(expected.value + 1, param_name, calendar)
+
+    for oob in (date_too_early, date_too_late):
+        error_msg = f"Parameter `{param_name}` receieved as '{oob}' although"
+        for date in (oob, oob.value):
+            with pytest.raises(errors.DateOutOfBounds, match=re.escape(error_msg)):
+                m.parse_date_nanos(date, param_name, calendar)
+        assert m.parse_date_nanos(oob.value, param_name, raise_oob=False) == oob.value
+
+
+def test_parse_session_nanos(
+    calendar, session, date, date_too_early, date_too_late, param_name
+):
+    expected = pd.Timestamp(session)
+    for session_ in (session, expected.value, expected.to_datetime64()):
+        rtrn = m.parse_session_nanos(calendar, session_, param_name)
+        assert rtrn == expected.value
+        assert m.parse_session(calendar, session_, param_name) == expected
+
+    for date_ in (date, pd.Timestamp(date).value):
+        with pytest.raises(errors.NotSessionError, match="not a session of calendar"):
+            m.parse_session_nanos(calendar, date_, param_name)
+
+    with pytest.raises(
+        errors.NotSessionError, match="is earlier than the first session of calendar"
+    ):
+        m.parse_session_nanos(calendar, date_too_early.value, param_name)
+
+    with pytest.raises(
+        errors.NotSessionError, match="is later than the last session of calendar"
+    ):
+        m.parse_session_nanos(calendar, date_too_late.value, param_name)
+
+
+def test_parse_timestamps(calendar, param_name, minute_too_early, minute_too_late):
+    expected = pd.DatetimeIndex(["2021-06-02 23:00", "2021-06-03 01:31"], tz=UTC)
+    inputs = [
+        expected,
+        expected.tz_convert(ZoneInfo("Asia/Hong_Kong")),
+        expected.tz_localize(None),
+        expected.tz_localize(None).values.astype("datetime64[m]"),
+        expected.asi8,
+        ["2021-06-02 23:00", "2021-06-03 01:31"],
+    ]
+    for timestamps in inputs:
+        rtrn = m.parse_timestamps(timestamps, param_name, calendar)
+        np.testing.assert_array_equal(rtrn, expected.asi8)
+
+    timestamps = expected + pd.Timedelta(30, "s")
+    rtrn = m.parse_timestamps(timestamps, param_name, side="left", raise_oob=False)
+    np.testing.assert_array_equal(rtrn, expected.asi8)
+    rtrn = m.parse_timestamps(timestamps, param_name, side="right", raise_oob=False)
+    np.testing.assert_array_equal(rtrn, (expected + pd.Timedelta(1, "min")).asi8)
+    with pytest.raises(ValueError, match="cannot include a timestamp with a non-zero"):
+        m.parse_timestamps(timestamps, param_name, side="both", raise_oob=False)
+
+    with pytest.raises(ValueError, match="cannot include NaT"):
+        m.parse_timestamps(expected.insert(1, pd.NaT), param_name, calendar)
+
+    with pytest.raises(ValueError, match=f"Parameter `{param_name}` received as"):
+        m.parse_timestamps(["2021-13-13"], param_name, calendar)
+
+    for oob in (minute_too_early, minute_too_late):
+        error_msg = f"Parameter `{param_name}` receieved as '{oob}' although"
+        with pytest.raises(errors.MinuteOutOfBounds, match=re.escape(error_msg)):
+            m.parse_timestamps(expected.insert(1, oob), param_name, calendar)
+        rtrn = m.parse_timestamps([oob], param_name, raise_oob=False)
+        np.testing.assert_array_equal(rtrn, [oob.value])
+
+
+def test_parse_dates(calendar, param_name, date_too_early, date_too_late):
+    expected = pd.DatetimeIndex(["2021-06-02", "2021-06-05"])
+    inputs = [
+        expected,
+        expected.values.astype("datetime64[D]"),
+        expected.asi8,
+        ["2021-06-02", "2021-06-05"],
+    ]
+    for dates in inputs:
+        rtrn = m.parse_dates(dates, param_name, calendar)
+        np.testing.assert_array_equal(rtrn, expected.asi8)
+
+    with pytest.raises(ValueError, match="Dates must be timezone naive"):
+        m.parse_dates(expected.tz_localize(UTC), param_name, calendar)
+
+    with pytest.raises(ValueError, match="a Date must have a time component of 00:00"):
+        m.parse_dates(expected + pd.Timedelta(1, "h"), param_name, calendar)
+
+    for oob in (date_too_early, date_too_late):
+        error_msg = f"Parameter `{param_name}` receieved as '{oob}' although"
+        with pytest.raises(errors.DateOutOfBounds, match=re.escape(error_msg)):
+            m.parse_dates(expected.insert(1, oob), param_name, calendar)
+        rtrn = m.parse_dates([oob], param_name, raise_oob=False)
+        np.testing.assert_array_equal(rtrn, [oob.value])
+
+
 def test_parse_trading_minute(
     calendar, trading_minute, minute, minute_too_early, minute_too_late, param_name
 ):
@@ -393,6 +535,116 @@ def test_parse_trading_minute(
         m.parse_trading_minute(calendar, minute_too_late, param_name)
 
 
+def test_concat_aranges():
+    f = m.concat_aranges
+    starts = np.array([0, 100, 200, 300], dtype=np.int64)
+    counts = np.array([3, 0, 1, 2])
+    expected = np.array([0, 10, 20, 200, 300, 310], dtype=np.int64)
+    rtrn = f(starts, counts, 10)
+    assert rtrn.dtype == np.int64
+    np.testing.assert_array_equal(rtrn, expected)
+
+    rtrn = f(starts, np.array([0, -1, 0, 0]), 10)
+    assert rtrn.dtype == np.int64
+    assert rtrn.size == 0
+
+
+def test_compute_minutes(calendar, sides):
+    """Test `compute_minutes` against a per-session implementation."""
+    side = sides
+    one_min = m.NANOSECONDS_PER_MINUTE
+    start_ext = 0 if side in ["left", "both"] else one_min
+    end_ext = one_min if side in ["right", "both"] else 0
+
+    pieces = []
+    for open_, break_start, break_end, close in zip(
+        calendar.opens_nanos,
+        calendar.break_starts_nanos,
+        calendar.break_ends_nanos,
+        calendar.closes_nanos,
+    ):
+        if break_start != m.NP_NAT:
+            pieces.append(np.arange(open_ + start_ext, break_start + end_ext, one_min))
+            pieces.append(np.arange(break_end + start_ext, close + end_ext, one_min))
+        else:
+            pieces.append(np.arange(open_ + start_ext, close + end_ext, one_min))
+    expected = np.concatenate(pieces).view("datetime64[ns]")
+
+    # verify calendar covers sessions with and without a break
+    has_break = calendar.break_starts_nanos != m.NP_NAT
+    assert has_break.any() and not has_break.all()
+
+    rtrn = m.compute_minutes(
+        calendar.opens_nanos,
+        calendar.break_starts_nanos,
+        calendar.break_ends_nanos,
+        calendar.closes_nanos,
+        side,
+    )
+    assert rtrn.dtype == expected.dtype
+    np.testing.assert_array_equal(rtrn, expected)
+
+
+def test_minute_index(calendar, sides):
+    """Test `_MinuteIndex` against array of all trading minutes."""
+    side = sides
+    args = (
+        calendar.opens_nanos,
+        calendar.break_starts_nanos,
+        calendar.break_ends_nanos,
+        calendar.closes_nanos,
+        side,
+    )
+    minutes = m.compute_minutes(*args).view("int64")
+    index = m._MinuteIndex(*args)
+
+    assert len(index) == len(minutes)
+    assert index.first == minutes[0]
+    assert index.last == minutes[-1]
+    np.testing.assert_array_equal(index.to_numpy(), minutes)
+
+    one_min = m.NANOSECONDS_PER_MINUTE
+    one_sec = one_min // 60
+    # values on, either side of and between trading minutes at session bounds
+    bounds = np.concatenate(
+        [
+            calendar.opens_nanos,
+            calendar.closes_nanos,
+            calendar.break_starts_nanos[calendar.break_starts_nanos != m.NP_NAT],
+            calendar.break_ends_nanos[calendar.break_ends_nanos != m.NP_NAT],
+        ]
+    )
+    values = np.concatenate(
+        [bounds + delta for delta in (-one_min, -one_sec, 0, one_sec, one_min)]
+    )
+    values = np.concatenate([values, minutes[[0, -1]] + [-one_min, one_min]])
+    values.sort()
+    for search_side in ("left", "right"):
+        expected = minutes.searchsorted(values, side=search_side)
+        np.testing.assert_array_equal(index.searchsorted(values, search_side), expected)
+        for value, expected_idx in zip(values[::97], expected[::97]):
+            assert index.searchsorted(value, search_side) == expected_idx
+
+    for value in values[::97]:
+        assert index.contains(value) == (value in minutes)
+
+    for position in (0, 1, 321, len(minutes) // 2, -1, -2):
+        assert index[position] == minutes[position]
+    with pytest.raises(IndexError):
+        index[len(minutes)]
+
+    slices = [
+        slice(None),
+        slice(0, 0),
+        slice(3, 4),
+        slice(100, 2_000),
+        slice(-2_000, -10),
+        slice(len(minutes) // 3, None),
+    ]
+    for slc in slices:
+        np.testing.assert_array_equal(index[slc], minutes[slc])
+
+
 def st_align() -> st.SearchStrategy[pd.Timedelta]:
     """SearchStrategy for a valid alignment."""
     sample_pos = [pd.Timedelta(i, "min") for i in range(1, 31) if not 60 % i]
@@ -1191,6 +1443,268 @@ class TestTradingIndex:
         rtrn = cal_amended.trading_index(**kwargs, ignore_breaks=False)
         assert_index_equal(rtrn, index_true)
 
+    @given(
+        data=st.data(),
+        intervals=st.booleans(),
+        force=st.booleans(),
+        curtail_overlaps=st.booleans(),
+        chunk_sessions=st.integers(1, 30),
+    )
+    @settings(deadline=None, suppress_health_check=[HealthCheck.differing_executors])
+    def test_iter_trading_index_fuzz(
+        self,
+        data,
+        calendars_with_answers,
+        intervals: bool,
+        force: bool,
+        curtail_overlaps: bool,
+        chunk_sessions: int,
+    ):
+        """Verify chunks of `iter_trading_index` unite as `trading_index`."""
+        cal, ans = calendars_with_answers
+        start, end = data.draw(self.st_start_end(ans))
+        # limit minimum period to quicken test, chunking is independent of period
+        period = data.draw(self.st_periods(minimum=pd.Timedelta(15, "min")))
+        closes = ["left", "right"] if intervals else ["left", "right", "both"]
+        closed = data.draw(st.sampled_from(closes))
+        kwargs = dict(
+            start=start,
+            end=end,
+            period=period,
+            intervals=intervals,
+            closed=closed,
+            force=force,
+            curtail_overlaps=curtail_overlaps,
+        )
+        try:
+            expected = cal.trading_index(**kwargs)
+        except (errors.IndicesOverlapError, errors.IntervalsOverlapError) as err:
+            with pytest.raises(type(err)):
+                list(cal.iter_trading_index(**kwargs, chunk_sessions=chunk_sessions))
+            return
+
+        chunks = list(cal.iter_trading_index(**kwargs, chunk_sessions=chunk_sessions))
+        num_sessions = len(ans.sessions[ans.sessions.slice_indexer(start, end)])
+        assert len(chunks) == -(-num_sessions // chunk_sessions)
+        assert_index_equal(chunks[0].append(chunks[1:]), expected)
+
+    def test_iter_trading_index(self, calendars, answers):
+        """Concrete tests for `iter_trading_index`."""
+        cal, ans = calendars["XHKG"], answers["XHKG"]
+        start, end = ans.sessions[-30], ans.sessions[-1]
+
+        # verify can be iterated session by session
+        chunks = list(
+            cal.iter_trading_index(start, end, "1h", force=True, chunk_sessions=1)
+        )
+        assert len(chunks) == 30
+        for session, chunk in zip(ans.sessions[-30:], chunks):
+            assert chunk[0].left == ans.opens[session]
+            assert chunk[-1].right == ans.closes[session]
+
+        # verify overlaps curtailed across chunk boundaries, which for 1 session
+        # chunks are session boundaries.
+        kwargs = dict(start=start, end=end, period="22h")
+        chunks = list(
+            cal.iter_trading_index(**kwargs, curtail_overlaps=True, chunk_sessions=1)
+        )
+        expected = cal.trading_index(**kwargs, curtail_overlaps=True)
+        assert_index_equal(chunks[0].append(chunks[1:]), expected)
+        curtailed = False
+        for chunk, next_chunk in zip(chunks, chunks[1:]):
+            assert chunk[-1].right <= next_chunk[0].left
+            curtailed |= chunk[-1].right == next_chunk[0].left
+        assert curtailed
+
+        # verify overlap error raised by chunk that includes overlapping interval
+        it = cal.iter_trading_index(**kwargs, chunk_sessions=1)
+        with pytest.raises(errors.IntervalsOverlapError):
+            next(it)
+
+        # verify raises on calling if indices would overlap
+        with pytest.raises(errors.IndicesOverlapError):
+            cal.iter_trading_index(**kwargs, intervals=False, closed="right")
+
+        # verify daily period
+        chunks = list(cal.iter_trading_index(start, end, "1D", chunk_sessions=7))
+        assert [len(chunk) for chunk in chunks] == [7, 7, 7, 7, 2]
+        assert_index_equal(chunks[0].append(chunks[1:]), ans.sessions[-30:])
+
+        # verify raises on invalid chunk_sessions
+        for chunk_sessions in [0, -1, 1.5]:
+            with pytest.raises(ValueError, match="`chunk_sessions` must be"):
+                cal.iter_trading_index(start, end, "1h", chunk_sessions=chunk_sessions)
+
+        # verify as_nanos
+        kwargs = dict(start=start, end=end, period="1h", force=True, as_nanos=True)
+        chunks = list(cal.iter_trading_index(**kwargs, chunk_sessions=7))
+        expected = cal.trading_index(**kwargs)
+        assert len(chunks) == 5
+        for i, array in enumerate(expected):
+            np.testing.assert_array_equal(
+                np.concatenate([chunk[i] for chunk in chunks]), array
+            )
+
+    @pytest.mark.parametrize("closed", ["left", "right", "both"])
+    @pytest.mark.parametrize("intervals", [True, False])
+    @pytest.mark.parametrize("force", [True, False])
+    def test_as_nanos(self, calendars_with_answers, intervals, closed, force):
+        """Verify `as_nanos` option of `trading_index`."""
+        if intervals and closed == "both":
+            return
+        cal, ans = calendars_with_answers
+        start, end = ans.sessions[-60], ans.sessions[-10]
+        # start and end as times to verify curtailed
+        start_time = ans.opens[start] + pd.Timedelta(2, "h")
+        end_time = ans.closes[end] - pd.Timedelta(3, "h")
+        for start_, end_ in ((start, end), (start_time, end_time)):
+            kwargs = dict(
+                start=start_,
+                end=end_,
+                period="37min",
+                intervals=intervals,
+                closed=closed,
+                force=force,
+                curtail_overlaps=True,
+            )
+            try:
+                expected = cal.trading_index(**kwargs)
+            except errors.IndicesOverlapError:
+                with pytest.raises(errors.IndicesOverlapError):
+                    cal.trading_index(**kwargs, as_nanos=True)
+                continue
+            rtrn = cal.trading_index(**kwargs, as_nanos=True)
+            if intervals:
+                left, right, sessions = rtrn
+                np.testing.assert_array_equal(left, expected.left.asi8)
+                np.testing.assert_array_equal(right, expected.right.asi8)
+            else:
+                left, sessions = rtrn
+                np.testing.assert_array_equal(left, expected.asi8)
+            assert left.dtype == sessions.dtype == np.int64
+
+            # verify session of each indice
+            opens = cal.opens_nanos[sessions]
+            closes = cal.closes_nanos[sessions]
+            period = pd.Timedelta(37, "min").value
+            assert (left >= opens).all()
+            assert (left <= closes + (0 if intervals else period)).all()
+            if intervals or closed == "left":
+                expected_sessions = cal.minutes_to_sessions(
+                    pd.DatetimeIndex(left, tz=UTC)
+                )
+                np.testing.assert_array_equal(
+                    cal.sessions_nanos[sessions], expected_sessions.asi8
+                )
+
+        # verify daily
+        rtrn = cal.trading_index(start, end, "1D", as_nanos=True)
+        expected = cal.sessions_in_range(start, end)
+        np.testing.assert_array_equal(rtrn[0], expected.asi8)
+        np.testing.assert_array_equal(rtrn[1], cal.sessions.get_indexer(expected))
+
+    def test_cache(self, calendars_with_answers):
+        """Verify trading index cache."""
+        cal, ans = calendars_with_answers
+        cal = cal.slice()  # a new instance, to not enable cache on fixture
+        assert cal.trading_index_cache_info() is None
+
+        sessions = ans.sessions[-60:]
+        start, end = sessions[0], sessions[-1]
+        kwargs = dict(period="30min", force=True, curtail_overlaps=True)
+        expected = cal.trading_index(start, end, **kwargs)
+        expected_nanos = cal.trading_index(start, end, **kwargs, as_nanos=True)
+        expected_sub = cal.trading_index(sessions[10], sessions[-10], **kwargs)
+
+        cal.trading_index_cache_enable()
+        info = cal.trading_index_cache_info()
+        assert info == (0, 0, 0, 0, 256 * 2**20, 0, 0)
+
+        rtrn = cal.trading_index(start, end, **kwargs)
+        assert_index_equal(rtrn, expected)
+        info = cal.trading_index_cache_info()
+        assert info[:4] == (0, 1, 0, 0)
+        assert info.currsize == 1
+        assert info.currbytes >= expected.nbytes
+
+        # verify served from cache
+        assert cal.trading_index(start, end, **kwargs) is rtrn
+        assert cal.trading_index_cache_info()[:3] == (1, 1, 0)
+
+        # verify sub-range served by slicing cached trading index
+        rtrn = cal.trading_index(sessions[10], sessions[-10], **kwargs)
+        assert_index_equal(rtrn, expected_sub)
+        assert cal.trading_index_cache_info()[:3] == (1, 2, 1)
+        assert cal.trading_index_cache_info().currsize == 1
+
+        # verify different options are cached separately
+        rtrn = cal.trading_index(start, end, **kwargs, as_nanos=True)
+        for array, expected_array in zip(rtrn, expected_nanos):
+            np.testing.assert_array_equal(array, expected_array)
+            assert not array.flags.writeable
+        assert cal.trading_index_cache_info()[:3] == (1, 3, 1)
+        assert cal.trading_index_cache_info().currsize == 2
+
+        # verify sub-range requested with times is not served by slicing
+        start_time = ans.opens[sessions[10]] + pd.Timedelta(1, "h")
+        expected = cal.slice().trading_index(start_time, end, **kwargs)
+        rtrn = cal.trading_index(start_time, end, **kwargs)
+        assert_index_equal(rtrn, expected)
+        assert cal.trading_index_cache_info()[:3] == (1, 4, 1)
+        assert cal.trading_index_cache_info().currsize == 3
+
+        # verify sub-range not served by slicing if could have been curtailed
+        # by a session outside of the sub-range.
+        kwargs_ = dict(period="30min", force=False, curtail_overlaps=True)
+        cal.trading_index(start, end, **kwargs_)
+        expected = cal.slice().trading_index(sessions[10], sessions[-10], **kwargs_)
+        rtrn = cal.trading_index(sessions[10], sessions[-10], **kwargs_)
+        assert_index_equal(rtrn, expected)
+        assert cal.trading_index_cache_info()[:3] == (1, 6, 1)
+
+        # verify clear
+        cal.trading_index_cache_clear()
+        assert cal.trading_index_cache_info() == (0, 0, 0, 0, 256 * 2**20, 0, 0)
+
+        # verify evictions
+        options = [("left", True), ("right", True), ("left", False)]
+        kwargs_evict = [
+            dict(
+                start=start,
+                end=end,
+                period="30min",
+                force=True,
+                closed=c,
+                curtail_overlaps=co,
+            )
+            for c, co in options
+        ]  # each evaluates an index of the same size
+        cal.trading_index(**kwargs_evict[0])
+        nbytes = cal.trading_index_cache_info().currbytes
+
+        cal.trading_index_cache_enable(maxbytes=nbytes - 1)
+        cal.trading_index(**kwargs_evict[0])  # will not be cached, too large
+        assert cal.trading_index_cache_info()[:4] == (0, 1, 0, 0)
+        assert cal.trading_index_cache_info().currsize == 0
+
+        cal.trading_index_cache_enable(maxbytes=int(nbytes * 2.5))
+        for kwargs_ in kwargs_evict:
+            cal.trading_index(**kwargs_)
+        info = cal.trading_index_cache_info()
+        assert info.evictions == 1
+        assert info.currsize == 2
+        assert info.currbytes == nbytes * 2
+        # verify least recently used was evicted
+        cal.trading_index(**kwargs_evict[1])
+        assert cal.trading_index_cache_info()[:2] == (1, 3)
+        cal.trading_index(**kwargs_evict[0])
+        assert cal.trading_index_cache_info()[:2] == (1, 4)
+
+        cal.trading_index_cache_disable()
+        assert cal.trading_index_cache_info() is None
+        rtrn = cal.trading_index(**kwargs_evict[0])
+        assert rtrn is not cal.trading_index(**kwargs_evict[0])
+
     @pytest.fixture(scope="class")
     def cal_with_ans_align(self) -> abc.Iterator[tuple[ExchangeCalendar, Answers]]:
         """Calendar with open and break_end times to test align options."""
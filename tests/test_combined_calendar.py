@@ -0,0 +1,288 @@
+"""Tests for combined_calendar module."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pandas.testing as tm
+import pytest
+
+from exchange_calendars import errors
+from exchange_calendars.calendar_helpers import NP_NAT, UTC
+from exchange_calendars.calendar_utils import _default_calendar_factories
+from exchange_calendars.combined_calendar import CombinedCalendar, open_status
+
+
+def get_calendars(names: list[str], side: str = "left") -> list:
+    return [
+        _default_calendar_factories[name]("2020-01-01", "2021-12-31", side=side)
+        for name in names
+    ]
+
+
+@pytest.mark.parametrize("how", ["union", "intersection"])
+@pytest.mark.parametrize(
+    "names, side",
+    [
+        (["XNYS", "XTSE"], "left"),
+        (["XLON", "XPAR", "XETR"], "right"),
+        (["XHKG", "XSHG"], "left"),  # calendars with breaks
+        (["XHKG", "XTKS", "XASX"], "both"),
+        (["XNYS", "CMES"], "right"),  # calendar with sessions that touch
+    ],
+)
+def test_is_open_on_minutes(names, side, how):
+    calendars = get_calendars(names, side)
+    combined = CombinedCalendar(calendars, how)
+    assert combined.side == side
+    assert combined.how == how
+
+    minutes = pd.date_range("2020-06-01", "2020-07-31", freq="min", tz=UTC)
+    is_open = [cal.is_open_on_minutes(minutes) for cal in calendars]
+    reduce = np.logical_or if how == "union" else np.logical_and
+    expected = reduce.reduce(is_open)
+    np.testing.assert_array_equal(combined.is_open_on_minutes(minutes), expected)
+    for i in np.flatnonzero(np.diff(expected))[:20]:
+        for minute in minutes[i : i + 2]:
+            assert combined.is_open_on_minute(minute) == expected[minutes == minute]
+
+    # combined calendar covers range common to all calendars
+    first = max(cal.first_session for cal in calendars)
+    last = min(cal.last_session for cal in calendars)
+    assert combined.first_session == first
+    assert combined.last_session == last
+    sessions = [
+        cal.sessions_nanos[cal.sessions.slice_indexer(first, last)] for cal in calendars
+    ]
+    op = np.union1d if how == "union" else np.intersect1d
+    expected_sessions = sessions[0]
+    for sessions_ in sessions[1:]:
+        expected_sessions = op(expected_sessions, sessions_)
+    np.testing.assert_array_equal(combined.sessions_nanos, expected_sessions)
+
+    # periods are ordered and do not overlap
+    assert (combined.opens_nanos <= combined.closes_nanos).all()
+    assert (combined.closes_nanos[:-1] <= combined.opens_nanos[1:]).all()
+
+
+def test_single_calendar():
+    cal = _default_calendar_factories["XNYS"]("2020-01-01", "2021-12-31")
+    combined = CombinedCalendar([cal])
+    np.testing.assert_array_equal(combined.opens_nanos, cal.opens_nanos)
+    np.testing.assert_array_equal(combined.closes_nanos, cal.closes_nanos)
+    tm.assert_index_equal(combined.sessions, cal.sessions, check_exact=True)
+
+    for minute in ["2020-05-01 13:00", "2020-05-01 13:30", "2020-05-01 15:00"]:
+        for method in ["next_open", "next_close", "previous_open", "previous_close"]:
+            assert getattr(combined, method)(minute) == getattr(cal, method)(minute)
+
+    for start, end in [
+        ("2020-03-02", "2020-06-30"),
+        ("2020-03-02 15:00", "2020-06-30 18:00"),
+    ]:
+        for kwargs in [
+            {},
+            {"force_close": True},
+            {"intervals": False},
+            {"intervals": False, "closed": "both", "force_close": True},
+        ]:
+            tm.assert_index_equal(
+                combined.trading_index(start, end, "7min", **kwargs),
+                cal.trading_index(start, end, "7min", **kwargs),
+            )
+    tm.assert_index_equal(
+        combined.trading_index("2020-03-01", "2020-06-30", "1D"),
+        cal.trading_index("2020-03-01", "2020-06-30", "1D"),
+        exact=False,  # freq not preserved
+    )
+
+    # sessions that touch remain separate periods
+    cmes = _default_calendar_factories["CMES"]("2020-01-01", "2021-12-31")
+    combined = CombinedCalendar([cmes])
+    np.testing.assert_array_equal(combined.opens_nanos, cmes.opens_nanos)
+    with pytest.raises(errors.IntervalsOverlapError):
+        combined.trading_index("2020-03-02", "2020-03-10", "7min")
+    tm.assert_index_equal(
+        combined.trading_index("2020-03-02", "2020-03-10", "7min", force_close=True),
+        cmes.trading_index("2020-03-02", "2020-03-10", "7min", force_close=True),
+    )
+
+
+def test_union_schedule():
+    combined = CombinedCalendar(get_calendars(["XNYS", "XTKS"]))
+    assert repr(combined) == "CombinedCalendar([XNYS, XTKS], how='union')"
+    # XTKS am and pm subsessions and XNYS session are each labelled 2020-01-06
+    expected = pd.DataFrame(
+        {
+            "open": pd.DatetimeIndex(
+                ["2020-01-06 00:00", "2020-01-06 03:30", "2020-01-06 14:30"], tz=UTC
+            ),
+            "close": pd.DatetimeIndex(
+                ["2020-01-06 02:30", "2020-01-06 06:00", "2020-01-06 21:00"], tz=UTC
+            ),
+        },
+        index=pd.DatetimeIndex(["2020-01-06"] * 3),
+    )
+    tm.assert_frame_equal(combined.schedule.loc["2020-01-06"], expected)
+
+    rtrn = combined.trading_index("2020-01-06", "2020-01-06", "2h", force_close=True)
+    expected = pd.IntervalIndex.from_arrays(
+        pd.DatetimeIndex(
+            [
+                "2020-01-06 00:00",
+                "2020-01-06 02:00",
+                "2020-01-06 03:30",
+                "2020-01-06 05:30",
+                "2020-01-06 14:30",
+                "2020-01-06 16:30",
+                "2020-01-06 18:30",
+                "2020-01-06 20:30",
+            ],
+            tz=UTC,
+        ),
+        pd.DatetimeIndex(
+            [
+                "2020-01-06 02:00",
+                "2020-01-06 02:30",
+                "2020-01-06 05:30",
+                "2020-01-06 06:00",
+                "2020-01-06 16:30",
+                "2020-01-06 18:30",
+                "2020-01-06 20:30",
+                "2020-01-06 21:00",
+            ],
+            tz=UTC,
+        ),
+        "left",
+    )
+    tm.assert_index_equal(rtrn, expected)
+
+
+def test_no_periods():
+    xhkg, xnys = get_calendars(["XHKG", "XNYS"])
+    combined = CombinedCalendar([xhkg, xnys], "intersection")
+    assert not len(combined.opens_nanos) and not len(combined.closes_nanos)
+    assert len(combined.sessions)  # sessions in common although never both open
+    assert not combined.is_open_on_minute("2021-01-05 15:00")
+    minutes = pd.DatetimeIndex(["2021-01-05 02:00", "2021-01-05 15:00"], tz=UTC)
+    np.testing.assert_array_equal(combined.is_open_on_minutes(minutes), [False] * 2)
+    with pytest.raises(ValueError, match="cannot be the last open or later"):
+        combined.next_open("2021-01-05 15:00")
+    assert combined.trading_index("2021-01-04", "2021-01-08", "1h").empty
+
+
+def test_overlapping_periods():
+    xlon, xnys = get_calendars(["XLON", "XNYS"])
+    minute = pd.Timestamp("2021-03-01 15:00", tz=UTC)
+
+    union = CombinedCalendar([xlon, xnys], "union")
+    assert union.previous_open(minute) == xlon.previous_open(minute)
+    assert union.next_close(minute) == xnys.next_close(minute)
+
+    intersection = CombinedCalendar([xlon, xnys], "intersection")
+    assert intersection.previous_open(minute) == xnys.previous_open(minute)
+    assert intersection.next_close(minute) == xlon.next_close(minute)
+    assert intersection.next_open(minute) == xnys.next_open(minute)
+
+
+def test_errors():
+    xnys, xtse = get_calendars(["XNYS", "XTSE"])
+    with pytest.raises(ValueError, match="at least one calendar"):
+        CombinedCalendar([])
+    with pytest.raises(ValueError, match="`how` must be"):
+        CombinedCalendar([xnys, xtse], how="outer")
+    xtse_right = _default_calendar_factories["XTSE"](side="right")
+    with pytest.raises(ValueError, match="same `side`"):
+        CombinedCalendar([xnys, xtse_right])
+    xtse_2019 = _default_calendar_factories["XTSE"]("2019-01-01", "2019-12-31")
+    with pytest.raises(ValueError, match="do not have any sessions in common"):
+        CombinedCalendar([xnys, xtse_2019])
+
+    combined = CombinedCalendar([xnys, xtse])
+    with pytest.raises(ValueError, match="cannot be the last open or later"):
+        combined.next_open(combined.opens_nanos[-1])
+    with pytest.raises(ValueError, match="cannot be the first open or earlier"):
+        combined.previous_open(combined.opens_nanos[0])
+    with pytest.raises(ValueError, match="`closed` cannot be 'both'"):
+        combined.trading_index("2021-01-04", "2021-01-05", "1h", closed="both")
+
+
+def assert_open_status(calendars, timestamps, side, ignore_breaks):
+    """Assert `open_status` for `calendars` as evaluated by each calendar."""
+    rtrn = open_status(
+        calendars,
+        timestamps,
+        side,
+        ignore_breaks,
+        sessions=True,
+        next_opens=True,
+        next_closes=True,
+    )
+    assert rtrn.is_open.shape == (len(timestamps), len(calendars))
+    for i, cal in enumerate(calendars):
+        is_open = rtrn.is_open[:, i]
+        expected = cal.is_open_at_times(timestamps, side, ignore_breaks)
+        np.testing.assert_array_equal(is_open, expected)
+        for rtrn_nanos, bounds, method in (
+            (rtrn.next_opens[:, i], cal.opens_nanos, cal.next_opens_nanos),
+            (rtrn.next_closes[:, i], cal.closes_nanos, cal.next_closes_nanos),
+        ):
+            # NaT where calendar methods would raise as no later bound
+            has_next = timestamps < bounds[-1]
+            assert (rtrn_nanos[~has_next] == NP_NAT).all()
+            np.testing.assert_array_equal(
+                rtrn_nanos[has_next], method(timestamps[has_next])
+            )
+
+        sessions = rtrn.sessions[:, i]
+        assert (sessions[~is_open] == NP_NAT).all()
+        idx = cal.sessions_nanos.searchsorted(sessions[is_open])
+        np.testing.assert_array_equal(cal.sessions_nanos[idx], sessions[is_open])
+        assert (cal.opens_nanos[idx] <= timestamps[is_open]).all()
+        assert (timestamps[is_open] <= cal.closes_nanos[idx]).all()
+
+    rtrn = open_status(calendars, timestamps, side, ignore_breaks)
+    assert rtrn.sessions is rtrn.next_opens is rtrn.next_closes is None
+
+
+@pytest.mark.parametrize("side", ["left", "right", "both", "neither"])
+@pytest.mark.parametrize("ignore_breaks", [False, True])
+def test_open_status(side, ignore_breaks):
+    calendars = get_calendars(["XNYS", "XHKG", "CMES", "XASX"])
+    # random timestamps plus timestamps on and either side of bounds
+    rng = np.random.default_rng(3)
+    minutes = pd.date_range("2020-02-01", "2021-11-30", freq="min", tz=UTC).asi8
+    bounds = [cal._subsession_bounds_nanos[100:140] for cal in calendars]
+    timestamps = np.concatenate([minutes[rng.integers(0, len(minutes), 2000)]] + bounds)
+    timestamps = np.concatenate((timestamps - 1, timestamps, timestamps + 1))
+    assert_open_status(calendars, timestamps, side, ignore_breaks)
+
+    # on and either side of each calendar's first and last bounds
+    for cal in calendars:
+        bounds = cal._subsession_bounds_nanos
+        timestamps = np.concatenate((bounds[:4], bounds[-4:]))
+        timestamps = np.concatenate((timestamps - 1, timestamps, timestamps + 1))
+        minute_index = cal._minute_index
+        in_bounds = (timestamps >= minute_index.first) & (
+            timestamps <= minute_index.last
+        )
+        assert_open_status([cal], timestamps[in_bounds], side, ignore_breaks)
+
+
+def test_open_status_last_session():
+    xnys, xlon = calendars = get_calendars(["XNYS", "XLON"])
+    timestamps = pd.DatetimeIndex(["2021-12-30 15:00", "2021-12-31 12:00"], tz=UTC)
+    rtrn = open_status(calendars, timestamps, next_opens=True, next_closes=True)
+    np.testing.assert_array_equal(rtrn.is_open, [[True, True], [False, True]])
+    np.testing.assert_array_equal(
+        rtrn.next_opens,
+        [[xnys.opens_nanos[-1], xlon.opens_nanos[-1]], [xnys.opens_nanos[-1], NP_NAT]],
+    )
+    np.testing.assert_array_equal(
+        rtrn.next_closes[1], [xnys.closes_nanos[-1], xlon.closes_nanos[-1]]
+    )
+
+    with pytest.raises(errors.MinuteOutOfBounds):
+        open_status(calendars, pd.DatetimeIndex(["2022-01-04 15:00"], tz=UTC))
+    with pytest.raises(ValueError, match="cannot include NaT"):
+        open_status(calendars, pd.DatetimeIndex(["2021-06-01 15:00", pd.NaT]))
@@ -14,8 +14,10 @@ from __future__ import annotations
 from collections import abc
 from datetime import time
 import functools
+import inspect
 import itertools
 import pathlib
+import pickle
 import re
 import typing
 from typing import Literal
@@ -25,15 +27,24 @@ import numpy as np
 import pandas as pd
 import pandas.testing as tm
 import pytest
+from pandas.tseries import holiday as pd_holiday
+from pandas.tseries.offsets import CustomBusinessDay
 
-from exchange_calendars import errors
-from exchange_calendars.calendar_helpers import UTC
+from exchange_calendars import errors, exchange_calendar, rule_cache, schedule_cache
+from exchange_calendars.calendar_helpers import NP_NAT, UTC, compute_minutes
 from exchange_calendars.calendar_utils import (
     ExchangeCalendarDispatcher,
     _default_calendar_aliases,
     _default_calendar_factories,
 )
 from exchange_calendars.exchange_calendar import ExchangeCalendar, days_at_time
+from exchange_calendars.exchange_calendar_xbud import bridge_fri, bridge_mon
+from exchange_calendars.exchange_calendar_xhkg import boxing_day_obs
+from exchange_calendars.pandas_extensions import holiday as ext_holiday
+from exchange_calendars.pandas_extensions.offsets import (
+    MultipleWeekmaskCustomBusinessDay,
+    business_day_range,
+)
 from exchange_calendars.utils import pandas_utils
 
 from .test_utils import T
@@ -172,6 +183,533 @@ def test_days_at_time(day, day_offset, time_offset, tz, expected):
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    "observance",
+    [
+        pd_holiday.sunday_to_monday,
+        pd_holiday.weekend_to_monday,
+        pd_holiday.next_monday,
+        pd_holiday.next_monday_or_tuesday,
+        pd_holiday.previous_friday,
+        pd_holiday.nearest_workday,
+        pd_holiday.next_workday,
+        pd_holiday.previous_workday,
+        pd_holiday.before_nearest_workday,
+        pd_holiday.after_nearest_workday,
+        boxing_day_obs,
+        bridge_mon,
+        bridge_fri,
+    ],
+)
+def test_vectorized_observances(observance):
+    assert observance in ext_holiday._VECTORIZED_OBSERVANCES
+    dates = pd.date_range("2019-12-20", "2020-01-20").insert(3, pd.NaT)
+    rtrn = ext_holiday.apply_observance(dates, observance)
+    tm.assert_index_equal(rtrn, dates.map(observance))
+    assert ext_holiday.apply_observance(dates[:0], observance).empty
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        pd_holiday.Holiday("A", month=12, day=26),
+        pd_holiday.Holiday("B", month=1, day=1, observance=pd_holiday.nearest_workday),
+        pd_holiday.Holiday(
+            "C",
+            month=5,
+            day=1,
+            observance=bridge_mon,
+            start_date=T("2005"),
+            end_date=T("2020"),
+        ),
+        pd_holiday.Holiday("D", month=6, day=1, offset=pd.DateOffset(weekday=0)),
+        pd_holiday.Holiday("E", month=12, day=24, days_of_week=(0, 1, 2, 3)),
+        pd_holiday.Holiday("F", year=2010, month=7, day=7),  # evaluated by rule
+        ext_holiday.Holiday(
+            "G", month=3, day=1, offset=pd.DateOffset(days=1), observance=bridge_fri
+        ),
+    ],
+)
+def test_holiday_dates(rule):
+    for start, end in [
+        ("1990", "2030"),
+        ("2010-03-04", "2010-12-28"),
+        ("2021", "2021"),
+    ]:
+        start, end = T(start), T(end)
+        rtrn = ext_holiday.holiday_dates(rule, start, end, return_name=True)
+        expected = rule.dates(start, end, return_name=True)
+        if expected.empty:
+            assert rtrn.empty
+            continue
+        tm.assert_series_equal(rtrn, expected, check_freq=False)
+
+
+def test_business_day_range():
+    holidays = pd.date_range("2021-01-01", "2021-01-08")
+    day = CustomBusinessDay(holidays=holidays.tolist())
+    weekmasks = [
+        (None, T("2021-01-03"), "1111110"),
+        (T("2021-01-04"), T("2021-01-10"), "1111101"),
+        (T("2021-02-01"), None, "0111100"),
+    ]
+    composite_day = MultipleWeekmaskCustomBusinessDay(
+        holidays=holidays.tolist(), weekmasks=weekmasks
+    )
+
+    def expected_composite(start, end):
+        dates = pd.date_range(start, end)
+        weekmask = np.full(len(dates), "1111100")
+        for start_, end_, weekmask_ in weekmasks:
+            start_ = dates[0] if start_ is None else start_
+            end_ = dates[-1] if end_ is None else end_
+            weekmask[(dates >= start_) & (dates <= end_)] = weekmask_
+        is_busday = [mask[d.weekday()] == "1" for mask, d in zip(weekmask, dates)]
+        return dates[is_busday & ~dates.isin(holidays)]
+
+    for start, end in [
+        ("2020-12-01", "2021-03-31"),
+        ("2021-01-09", "2021-01-10"),
+        ("2021-01-08", "2021-01-08"),
+    ]:
+        start, end = T(start), T(end)
+        rtrn = business_day_range(start, end, day)
+        expected = pd.date_range(start, end, freq=day)
+        tm.assert_index_equal(rtrn, expected, check_exact=True)
+        assert rtrn.freq is None
+
+        rtrn = business_day_range(start, end, composite_day)
+        tm.assert_index_equal(rtrn, expected_composite(start, end), check_exact=True)
+
+    # falls back to date_range for offsets that are not a single business day
+    day = CustomBusinessDay(n=2, holidays=holidays.tolist())
+    start, end = T("2020-12-01"), T("2021-03-31")
+    rtrn = business_day_range(start, end, day)
+    tm.assert_index_equal(rtrn, pd.date_range(start, end, freq=day), check_exact=True)
+
+
+@pytest.fixture
+def clear_rule_cache() -> abc.Iterator[None]:
+    """Clear rule cache before and after the test, restoring maxsize."""
+    prior = rule_cache.get_maxsize()
+    rule_cache.clear()
+    yield
+    rule_cache.set_maxsize(prior)
+    rule_cache.clear()
+
+
+def test_rule_cache(clear_rule_cache):
+    evaluated = []
+
+    def get(key, first_year, last_year, dates):
+        def evaluate(first, last):
+            evaluated.append((first, last))
+            return dates[first - 2000 : last - 2000 + 1].values
+
+        return rule_cache.get(key, first_year, last_year, evaluate)
+
+    dates = pd.date_range("2000-01-03", periods=30, freq="366D")
+    np.testing.assert_array_equal(get("a", 2005, 2010, dates), dates[5:11].values)
+    np.testing.assert_array_equal(get("a", 2006, 2008, dates), dates[6:9].values)
+    assert evaluated == [(2005, 2010)]
+    assert rule_cache.info() == (1, 1, 0, rule_cache.DEFAULT_MAXSIZE, 6, 1)
+
+    # evaluates only years not already cached
+    rtrn = get("a", 2003, 2012, dates)
+    np.testing.assert_array_equal(rtrn, dates[3:13].values)
+    assert not rtrn.flags.writeable
+    assert evaluated[1:] == [(2003, 2004), (2011, 2012)]
+
+    # least recently used rule evicted when exceeds maxsize
+    get("b", 2000, 2004, dates)
+    get("a", 2003, 2003, dates)
+    rule_cache.set_maxsize(12)
+    assert rule_cache.info() == (2, 3, 1, 12, 10, 1)
+    get("c", 2000, 2019, dates)  # exceeds maxsize, not cached
+    assert rule_cache.info().rules == 1
+
+    rule_cache.set_maxsize(0)
+    assert rule_cache.info().rules == 0
+    evaluated.clear()
+    get("a", 2003, 2012, dates)
+    get("a", 2003, 2012, dates)
+    assert len(evaluated) == 2
+
+    with pytest.raises(ValueError, match="`maxsize` cannot be negative"):
+        rule_cache.set_maxsize(-1)
+
+
+def test_holiday_dates_rule_cache(clear_rule_cache):
+    # identical rules defined separately share a cache entry
+    rules = [
+        pd_holiday.Holiday(name, month=1, day=1, observance=pd_holiday.sunday_to_monday)
+        for name in ("A", "B")
+    ]
+    start, end = T("1990"), T("2030")
+    for rule in rules:
+        rtrn = ext_holiday.holiday_dates(rule, start, end)
+        tm.assert_index_equal(rtrn, rule.dates(start, end), check_exact=True)
+    info = rule_cache.info()
+    assert (info.hits, info.misses, info.rules) == (1, 1, 1)
+
+
+def test_as_nanos_keyword_only():
+    """Test `as_nanos` does not change position of existing parameters."""
+    signatures = {
+        name: inspect.signature(getattr(ExchangeCalendar, name))
+        for name in dir(ExchangeCalendar)
+        if not name.startswith("_") and callable(getattr(ExchangeCalendar, name))
+    }
+    signatures = {
+        name: sig
+        for name, sig in signatures.items()
+        if {"as_nanos", "_parse"}.issubset(sig.parameters)
+    }
+    assert len(signatures) >= 19
+    for name, sig in signatures.items():
+        params = list(sig.parameters.values())
+        assert params[-1].name == "as_nanos", name
+        assert params[-1].kind is inspect.Parameter.KEYWORD_ONLY, name
+        assert params[-2].name == "_parse", name
+
+
+@pytest.fixture
+def schedule_cache_path(tmp_path) -> abc.Iterator[pathlib.Path]:
+    """Enable schedule cache at a temporary path for the test's duration."""
+    prior = schedule_cache.get_path()
+    schedule_cache.enable(tmp_path)
+    yield tmp_path
+    if prior is None:
+        schedule_cache.disable()
+    else:
+        schedule_cache.enable(prior)
+
+
+@pytest.mark.parametrize("name", ["XHKG", "XKRX"])
+def test_schedule_cache(schedule_cache_path, name, monkeypatch):
+    cal_cls = _default_calendar_factories[name]
+    start, end = "2019-01-01", "2021-12-31"
+    schedule_cache.disable()
+    expected = cal_cls(start, end)
+    schedule_cache.enable(schedule_cache_path)
+
+    cal = cal_cls(start, end)  # evaluates and stores schedule
+    assert cal.opens_nanos.flags.writeable
+    assert len(list(schedule_cache_path.iterdir())) == 1
+
+    cached = cal_cls(start, end, side="right")
+    assert not cached.opens_nanos.flags.writeable  # loaded as memory map
+    tm.assert_frame_equal(cached.schedule, expected.schedule, check_freq=False)
+    tm.assert_index_equal(cached.late_opens, expected.late_opens)
+    tm.assert_index_equal(cached.early_closes, expected.early_closes)
+    for attr in ["opens_nanos", "break_starts_nanos", "closes_nanos"]:
+        np.testing.assert_array_equal(getattr(cached, attr), getattr(expected, attr))
+    assert cached.side == "right"
+    expected = cal_cls(start, end, side="right")
+    np.testing.assert_array_equal(cached.minutes_nanos, expected.minutes_nanos)
+
+    # verify a different range is cached separately
+    cal_cls(start, "2020-12-31")
+    assert len(list(schedule_cache_path.iterdir())) == 2
+
+    # verify change to calendar definition invalidates cached schedule
+    monkeypatch.setattr(schedule_cache, "_package_digest", lambda: "changed")
+    cal = cal_cls(start, end)
+    assert cal.opens_nanos.flags.writeable
+    assert len(list(schedule_cache_path.iterdir())) == 3
+
+    schedule_cache.clear()
+    assert not list(schedule_cache_path.iterdir())
+
+
+def test_schedule_cache_key(tmp_path, monkeypatch):
+    """Test cache key reflects dependency versions and system zone files."""
+    cal_cls = _default_calendar_factories["XKRX"].resolve()
+    start, end = pd.Timestamp("2019-01-01"), pd.Timestamp("2021-12-31")
+    key = schedule_cache._key(cal_cls, start, end)
+
+    digest = schedule_cache._package_digest.__wrapped__()
+    versions = schedule_cache._get_dependency_versions()
+    assert set(versions) == {"tzdata", "pyluach"}
+    for name in versions:
+        changed = {**versions, name: versions[name] + ".post1"}
+        monkeypatch.setattr(schedule_cache, "_get_dependency_versions", lambda: changed)
+        assert schedule_cache._package_digest.__wrapped__() != digest
+    monkeypatch.undo()
+
+    # verify key reflects zone file if loaded from system zone database
+    zone_file = tmp_path / "Seoul"
+    zone_file.write_bytes(b"TZif")
+    monkeypatch.setattr(schedule_cache, "_zone_file", lambda key: None)
+    key_tzdata = schedule_cache._key(cal_cls, start, end)
+    monkeypatch.setattr(schedule_cache, "_zone_file", lambda key: zone_file)
+    key_system = schedule_cache._key(cal_cls, start, end)
+    assert key_tzdata != key_system
+    monkeypatch.undo()
+    assert schedule_cache._key(cal_cls, start, end) == key
+
+
+@pytest.mark.parametrize("name", ["XHKG", "XNYS", "XKRX"])
+def test_pickle(name):
+    cal = _default_calendar_factories[name]("2019-01-01", "2021-12-31", side="right")
+    cal.minutes_nanos, cal.first_minutes_nanos, cal.day  # evaluate derived data
+    cal.trading_index_cache_enable(2**20)
+    cal.trading_index("2020", "2020-12-31", "1h")
+
+    # verify only schedule and constructor parameters are serialized
+    state = cal.__getstate__()
+    assert set(state) == {
+        "_side",
+        "_evaluation_timings",
+        "_schedule_nanos",
+        "_trading_index_cache_maxbytes",
+    }
+    assert set(state["_schedule_nanos"]) == set(schedule_cache.FIELDS)
+    ext = _default_calendar_factories[name]("2019-01-01", "2020-12-31")
+    ext.extend("2021-12-31")
+    assert set(ext.__getstate__()) == {
+        "_side",
+        "_evaluation_timings",
+        "_schedule_nanos",
+        "_modification_count",
+    }
+
+    payload = pickle.dumps(cal)
+    assert len(payload) < cal.minutes_nanos.nbytes / 10
+    rtrn = pickle.loads(payload)
+    assert type(rtrn) is type(cal)
+    assert rtrn.side == "right"
+    # derived data not pickled
+    for attr in ["minutes", "minutes_nanos", "first_minutes_nanos", "day"]:
+        assert attr not in rtrn.__dict__
+
+    tm.assert_frame_equal(rtrn.schedule, cal.schedule, check_freq=False)
+    tm.assert_index_equal(rtrn.late_opens, cal.late_opens)
+    tm.assert_index_equal(rtrn.early_closes, cal.early_closes)
+    for attr in [
+        "opens_nanos",
+        "break_starts_nanos",
+        "break_ends_nanos",
+        "closes_nanos",
+        "minutes_nanos",
+        "first_minutes_nanos",
+    ]:
+        np.testing.assert_array_equal(getattr(rtrn, attr), getattr(cal, attr))
+    assert rtrn.day.holidays == cal.day.holidays
+
+    info = rtrn.trading_index_cache_info()
+    assert info.maxbytes == 2**20 and info.currsize == 0
+    tm.assert_index_equal(
+        rtrn.trading_index("2020", "2020-12-31", "1h"),
+        cal.trading_index("2020", "2020-12-31", "1h"),
+    )
+
+
+@pytest.mark.parametrize("name", ["XHKG", "XKRX"])
+def test_extend(name):
+    factory = _default_calendar_factories[name]
+    expected = factory("2018-01-01", "2021-12-31", side="right")
+    cal = factory("2019-06-05", "2020-06-05", side="right")
+    sliced = cal.slice("2019-07-01", "2019-12-31")
+    # evaluate derived data, to be extended
+    cal.minutes, cal.minutes_nanos, cal.first_minutes_nanos, cal._minute_index
+    cal.trading_index_cache_enable()
+    cal.trading_index("2020", "2020-06-05", "1h")
+    sliced.first_minutes_nanos
+    sliced_opens = sliced.opens_nanos.copy()
+    sliced_last_session = sliced.last_session
+
+    cal.extend("2021-12-31")
+    cal.extend_back("2018-01-01")
+    tm.assert_frame_equal(cal.schedule, expected.schedule, check_freq=False)
+    tm.assert_index_equal(cal.late_opens, expected.late_opens)
+    tm.assert_index_equal(cal.early_closes, expected.early_closes)
+    assert cal.side == "right"
+    for attr in [
+        "sessions_nanos",
+        "opens_nanos",
+        "break_starts_nanos",
+        "break_ends_nanos",
+        "closes_nanos",
+        "minutes_nanos",
+        "first_minutes_nanos",
+    ]:
+        np.testing.assert_array_equal(getattr(cal, attr), getattr(expected, attr))
+    tm.assert_index_equal(cal.minutes, expected.minutes)
+    assert cal.trading_index_cache_info().currsize == 0
+    tm.assert_index_equal(
+        cal.trading_index("2018-01-02", "2021-12-30", "1h"),
+        expected.trading_index("2018-01-02", "2021-12-30", "1h"),
+    )
+    for minute in ["2018-01-03 03:00", "2021-12-20 03:00"]:
+        ts = pd.Timestamp(minute, tz=UTC)
+        assert cal.is_open_on_minute(ts) == expected.is_open_on_minute(ts)
+        assert cal.minute_to_session(ts) == expected.minute_to_session(ts)
+
+    # verify data shared with sliced calendar not modified
+    np.testing.assert_array_equal(sliced.opens_nanos, sliced_opens)
+    assert sliced.last_session == sliced_last_session
+
+    # verify does nothing if range already covered.
+    schedule = cal.schedule
+    cal.extend("2021-06-01")
+    cal.extend_back("2019-01-01")
+    assert cal.schedule is schedule
+
+
+def test_extend_bounds():
+    cal = _default_calendar_factories["XSAU"]("2022-01-01", "2022-12-31")
+    with pytest.raises(ValueError, match="2025-01-01"):
+        cal.extend("2025-01-01")
+    with pytest.raises(ValueError, match="2020-12-31"):
+        cal.extend_back("2020-12-31")
+    cal.extend("2024-12-31")
+    cal.extend_back("2021-01-01")
+    tm.assert_index_equal(
+        cal.sessions, _default_calendar_factories["XSAU"]().sessions, check_exact=True
+    )
+
+
+def test_patch():
+    factory = _default_calendar_factories["XHKG"]
+    expected = factory("2019-01-01", "2021-12-31", side="right")
+    cal = factory("2019-01-01", "2021-12-31", side="right")
+    sliced = cal.slice("2020-01-01", "2020-12-31")
+    sliced_opens = sliced.opens_nanos.copy()
+    cal.minutes, cal.first_minutes_nanos  # evaluate derived data, to be patched
+    cal.trading_index_cache_enable()
+    cal.trading_index("2020", "2020-06-05", "1h")
+
+    def assert_minutes_consistent():
+        minutes = compute_minutes(
+            cal.opens_nanos,
+            cal.break_starts_nanos,
+            cal.break_ends_nanos,
+            cal.closes_nanos,
+            cal.side,
+        ).view(np.int64)
+        np.testing.assert_array_equal(cal.minutes_nanos, minutes)
+        np.testing.assert_array_equal(cal.minutes.asi8, minutes)
+        assert cal.trading_index_cache_info().currsize == 0
+
+    closures = pd.DatetimeIndex(["2020-06-02", "2020-06-03", "2020-06-06"])
+    cal.add_holidays(closures)  # 2020-06-06 is not a session, ignored
+    assert len(cal.sessions) == len(expected.sessions) - 2
+    assert not cal.sessions.isin(closures).any()
+    assert cal.date_to_session("2020-06-02", "next") == pd.Timestamp("2020-06-04")
+    assert_minutes_consistent()
+
+    # opened sessions have standard times
+    cal.remove_holidays(closures[:2].append(pd.DatetimeIndex(["2020-12-25"])))
+    session = pd.Timestamp("2020-12-25")
+    assert cal.is_session(session)
+    assert cal.session_open(session) == pd.Timestamp("2020-12-25 01:30", tz=UTC)
+    assert cal.session_break_start(session) == pd.Timestamp("2020-12-25 04:00", tz=UTC)
+    assert cal.session_close(session) == pd.Timestamp("2020-12-25 08:00", tz=UTC)
+    assert_minutes_consistent()
+    cal.add_holidays(session)
+    tm.assert_frame_equal(cal.schedule, expected.schedule, check_freq=False)
+    np.testing.assert_array_equal(cal.first_minutes_nanos, expected.first_minutes_nanos)
+
+    sessions = pd.DatetimeIndex(["2020-06-02", "2020-06-04"])
+    cal.add_special_closes(time(12), sessions)
+    cal.add_special_opens(time(10, 30), sessions[1])
+    assert sessions.isin(cal.early_closes).all()
+    assert sessions[1:].isin(cal.late_opens).all()
+    assert cal.session_close(sessions[0]) == pd.Timestamp("2020-06-02 04:00", tz=UTC)
+    assert cal.session_open(sessions[1]) == pd.Timestamp("2020-06-04 02:30", tz=UTC)
+    assert not cal.session_has_break(sessions[0])
+    assert_minutes_consistent()
+
+    cal.remove_special_closes(sessions)
+    cal.remove_special_opens(sessions)
+    tm.assert_frame_equal(cal.schedule, expected.schedule, check_freq=False)
+    tm.assert_index_equal(cal.late_opens, expected.late_opens)
+    tm.assert_index_equal(cal.early_closes, expected.early_closes)
+    np.testing.assert_array_equal(cal.minutes_nanos, expected.minutes_nanos)
+    tm.assert_index_equal(
+        cal.trading_index("2020", "2020-06-05", "1h"),
+        expected.trading_index("2020", "2020-06-05", "1h"),
+    )
+
+    # verify data shared with sliced calendar not modified
+    np.testing.assert_array_equal(sliced.opens_nanos, sliced_opens)
+
+    with pytest.raises(errors.NotSessionError, match="2020-06-06"):
+        cal.add_special_closes(time(12), ["2020-06-05", "2020-06-06"])
+    with pytest.raises(errors.DateOutOfBounds):
+        cal.add_holidays("2022-01-03")
+    with pytest.raises(ValueError, match="would not close later than it opens"):
+        cal.add_special_closes(time(9), "2020-06-05")
+    with pytest.raises(errors.NoSessionsError):
+        cal.slice("2020-06-01", "2020-06-05").add_holidays(
+            pd.date_range("2020-06-01", "2020-06-05")
+        )
+    tm.assert_frame_equal(cal.schedule, expected.schedule, check_freq=False)
+
+
+def test_patch_revert_special_times():
+    """Test reverting special times restores times defined by calendar."""
+    # XKRX defines 2019-11-14 as opening and closing an hour late
+    factory = _default_calendar_factories["XKRX"]
+    expected = factory("2019-01-01", "2019-12-31")
+    cal = factory("2019-01-01", "2019-12-31")
+    session = pd.Timestamp("2019-11-14")
+    assert expected.session_open(session) == pd.Timestamp("2019-11-14 01:00", tz=UTC)
+
+    cal.add_special_opens(time(11), session)
+    cal.add_special_closes(time(15), session)
+    assert cal.session_open(session) == pd.Timestamp("2019-11-14 02:00", tz=UTC)
+    assert cal.session_close(session) == pd.Timestamp("2019-11-14 06:00", tz=UTC)
+
+    cal.remove_special_opens(session)
+    cal.remove_special_closes(session)
+    tm.assert_frame_equal(cal.schedule, expected.schedule, check_freq=False)
+    tm.assert_index_equal(cal.late_opens, expected.late_opens)
+    tm.assert_index_equal(cal.early_closes, expected.early_closes)
+    np.testing.assert_array_equal(cal.minutes_nanos, expected.minutes_nanos)
+
+
+@pytest.mark.parametrize("name", ["XHKG", "XNYS", "XKRX"])
+def test_evaluation_pipeline(name, monkeypatch):
+    """Test holidays evaluated once and stages timed during construction."""
+    cal_cls = _default_calendar_factories[name].resolve()
+    evaluated = []
+
+    def holiday_dates(rule, *args, **kwargs):
+        evaluated.append(rule)
+        return ext_holiday.holiday_dates(rule, *args, **kwargs)
+
+    monkeypatch.setattr(exchange_calendar, "holiday_dates", holiday_dates)
+    accesses = []
+    regular_holidays = cal_cls.regular_holidays
+
+    def regular_holidays_(self):
+        accesses.append(self)
+        return regular_holidays.fget(self)
+
+    monkeypatch.setattr(cal_cls, "regular_holidays", property(regular_holidays_))
+
+    cal = cal_cls("2019-01-01", "2021-12-31")
+    assert len(accesses) == 1
+    if name != "XKRX":  # XKRX rules are evaluated by the extension calendar
+        assert evaluated
+    assert len({id(rule) for rule in evaluated}) == len(evaluated)
+
+    timings = cal.evaluation_timings
+    assert list(timings) == [
+        "holidays",
+        "sessions",
+        "standard_times",
+        "special_offsets",
+        "special_dates",
+        "adjust",
+        "schedule",
+    ]
+    assert all(v >= 0 for v in timings.values())
+    assert not cal.slice("2020-01-01", "2020-12-31").evaluation_timings
+
+
 def get_csv(name: str) -> pd.DataFrame:
     """Get csv file as DataFrame for given calendar `name`."""
     filename = name.replace("/", "-").lower() + ".csv"
@@ -2257,6 +2795,53 @@ class ExchangeCalendarTestBase:
             assert cal.first_session == sessions[0]
             assert cal.last_session == sessions[-1]
 
+    def test_slice(self, default_calendar_with_answers):
+        cal, ans = default_calendar_with_answers
+        sessions = ans.sessions
+        i, j = len(sessions) // 4, len(sessions) * 3 // 4
+        start, end = sessions[i], sessions[j]
+        cal.first_minutes_nanos  # evaluate to verify shared with slice
+
+        sliced = cal.slice(start, end)
+        assert type(sliced) is type(cal)
+        assert sliced.side == cal.side
+        tm.assert_index_equal(sliced.sessions, sessions[i : j + 1])
+        tm.assert_frame_equal(sliced.schedule, cal.schedule.iloc[i : j + 1])
+        assert np.shares_memory(sliced.opens_nanos, cal.opens_nanos)
+        assert np.shares_memory(sliced.schedule.close.values, cal.schedule.close.values)
+        assert np.shares_memory(sliced.first_minutes_nanos, cal.first_minutes_nanos)
+        for prop in ("late_opens", "early_closes"):
+            dates = getattr(cal, prop)
+            expected = dates[(dates >= start) & (dates <= end)]
+            tm.assert_index_equal(getattr(sliced, prop), expected)
+
+        minutes = cal.minutes_nanos
+        first, last = cal.first_minutes_nanos[i], cal.last_minutes_nanos[j]
+        expected = minutes[(minutes >= first) & (minutes <= last)]
+        np.testing.assert_array_equal(sliced.minutes_nanos, expected)
+        assert sliced.is_trading_minute(sliced.first_minute)
+        assert sliced.next_session(start) == sessions[i + 1]
+
+        if len(ans.non_sessions) > 1:
+            # start and end as non-sessions
+            (start_, end_), sessions_ = ans.sessions_range_defined_by_non_sessions
+            sliced = cal.slice(start_, end_)
+            tm.assert_index_equal(sliced.sessions, sessions_)
+
+        tm.assert_frame_equal(cal.slice().schedule, cal.schedule)
+
+        with pytest.raises(ValueError, match="`start` cannot be later than `end`"):
+            cal.slice(end, start)
+        with pytest.raises(errors.DateOutOfBounds):
+            cal.slice(ans.first_session - pd.Timedelta(1, "D"))
+        with pytest.raises(errors.DateOutOfBounds):
+            cal.slice(end=ans.last_session + pd.Timedelta(1, "D"))
+
+        run = ans.non_sessions_run
+        if not run.empty:
+            with pytest.raises(errors.NoSessionsError):
+                cal.slice(run[0], run[-1])
+
     def test_invalid_input(self, calendar_cls, sides, default_answers, name):
         ans = default_answers
 
@@ -2874,6 +3459,49 @@ class ExchangeCalendarTestBase:
             with pytest.raises(ValueError, match=re.escape(error_msg)):
                 f(non_session, "not a direction")
 
+    def test_is_sessions_dates_to_session_indices(self, default_calendar_with_answers):
+        """Test array variants of methods that interrogate a date.
+
+        Tests methods:
+            is_sessions
+            dates_to_session_indices
+            session_indices
+        """
+        cal, ans = default_calendar_with_answers
+        sessions = ans.sessions
+
+        dates = pd.date_range(sessions[0], sessions[-1], freq="D")
+        date_is_session = dates.isin(sessions)
+        np.testing.assert_array_equal(cal.is_sessions(dates), date_is_session)
+        np.testing.assert_array_equal(
+            cal.is_sessions(dates.values.astype("datetime64[D]")), date_is_session
+        )
+
+        idxs = sessions.searchsorted(dates)
+        rtrn = cal.dates_to_session_indices(dates, "next")
+        np.testing.assert_array_equal(rtrn, idxs)
+        rtrn = cal.dates_to_session_indices(dates, "previous")
+        np.testing.assert_array_equal(rtrn, np.where(date_is_session, idxs, idxs - 1))
+
+        rtrn = cal.session_indices(sessions)
+        np.testing.assert_array_equal(rtrn, np.arange(len(sessions)))
+
+        if not ans.non_sessions.empty:
+            non_session = ans.non_sessions[0]
+            error_msg = (
+                f"`dates` includes '{non_session}' which does not represent a"
+                " session. Consider passing a `direction`."
+            )
+            with pytest.raises(ValueError, match=re.escape(error_msg)):
+                cal.dates_to_session_indices(dates)
+            with pytest.raises(errors.NotSessionError):
+                cal.session_indices(dates)
+
+        with pytest.raises(errors.DateOutOfBounds):
+            cal.is_sessions([ans.session_too_early, ans.first_session])
+        with pytest.raises(errors.NotSessionError):
+            cal.session_indices([ans.first_session, ans.session_too_late])
+
     # Tests for methods that interrogate a given minute (trading or non-trading)
 
     def test_is_trading_minute(self, all_calendars_with_answers):
@@ -2921,6 +3549,52 @@ class ExchangeCalendarTestBase:
             rtrn = f(break_min)
             assert rtrn is False
 
+    def test_is_trading_break_open_minutes(self, all_calendars_with_answers):
+        """Test array variants of methods that query minutes.
+
+        Tests methods:
+            is_trading_minutes
+            is_break_minutes
+            is_open_on_minutes
+        """
+        calendar, ans = all_calendars_with_answers
+
+        non_trading_mins = pd.DatetimeIndex(list(ans.non_trading_minutes_only()))
+        trading_mins = pd.DatetimeIndex(list(ans.trading_minutes_only()))
+        break_mins = pd.DatetimeIndex(list(ans.break_minutes_only()), tz=UTC)
+        minutes = non_trading_mins.append([trading_mins, break_mins])
+        is_trading = np.repeat(
+            [False, True, False],
+            [len(non_trading_mins), len(trading_mins), len(break_mins)],
+        )
+        is_break = np.repeat(
+            [False, False, True],
+            [len(non_trading_mins), len(trading_mins), len(break_mins)],
+        )
+        # verify input can be unsorted
+        shuffle = np.random.default_rng(7).permutation(len(minutes))
+        minutes, is_trading, is_break = (
+            minutes[shuffle],
+            is_trading[shuffle],
+            is_break[shuffle],
+        )
+
+        rtrn = calendar.is_trading_minutes(minutes)
+        np.testing.assert_array_equal(rtrn, is_trading)
+        rtrn = calendar.is_trading_minutes(minutes.asi8)
+        np.testing.assert_array_equal(rtrn, is_trading)
+        rtrn = calendar.is_break_minutes(minutes)
+        np.testing.assert_array_equal(rtrn, is_break)
+        rtrn = calendar.is_open_on_minutes(minutes)
+        np.testing.assert_array_equal(rtrn, is_trading)
+        rtrn = calendar.is_open_on_minutes(minutes, ignore_breaks=True)
+        np.testing.assert_array_equal(rtrn, is_trading | is_break)
+
+        with pytest.raises(errors.MinuteOutOfBounds):
+            calendar.is_trading_minutes([ans.first_minute, ans.minute_too_early])
+        with pytest.raises(errors.MinuteOutOfBounds):
+            calendar.is_trading_minutes([ans.minute_too_late, ans.last_minute])
+
     def test_is_open_at_time(self, all_calendars_with_answers, one_minute):
         cal, ans = all_calendars_with_answers
 
@@ -3026,6 +3700,44 @@ class ExchangeCalendarTestBase:
                     assert not any(get_returns(ts_, ignore_breaks=False))
                     assert all(get_returns(ts_, ignore_breaks=True))
 
+    def test_is_open_at_times(self, all_calendars_with_answers, one_minute):
+        cal, ans = all_calendars_with_answers
+        one_sec = pd.Timedelta(1, "s")
+
+        sessions = ans.sessions_sample
+        bounds = pd.DatetimeIndex(
+            pd.concat(
+                [
+                    ans.opens[sessions],
+                    ans.closes[sessions],
+                    ans.break_starts[sessions].dropna(),
+                    ans.break_ends[sessions].dropna(),
+                ]
+            )
+        )
+        deltas = (-one_minute, -one_sec, pd.Timedelta(0), one_sec, one_minute)
+        timestamps = bounds.append([bounds + delta for delta in deltas[1:]])
+        timestamps = timestamps.append(bounds + deltas[0])
+        timestamps = timestamps[
+            (timestamps >= ans.first_minute) & (timestamps <= ans.last_minute)
+        ]
+
+        for side, ignore_breaks in itertools.product(
+            ("left", "both", "right", "neither"), (True, False)
+        ):
+            expected = [
+                cal.is_open_at_time(ts, side, ignore_breaks) for ts in timestamps
+            ]
+            rtrn = cal.is_open_at_times(timestamps, side, ignore_breaks)
+            np.testing.assert_array_equal(rtrn, expected)
+            # verify timezone naive timestamps interpreted as UTC
+            rtrn = cal.is_open_at_times(timestamps.tz_localize(None), side)
+            np.testing.assert_array_equal(rtrn, cal.is_open_at_times(timestamps, side))
+
+        oob_time = ans.first_minute - one_sec
+        with pytest.raises(errors.MinuteOutOfBounds):
+            cal.is_open_at_times([ans.first_minute, oob_time])
+
     def test_prev_next_open_close(self, default_calendar_with_answers):
         """Test methods that return previous/next open/close.
 
@@ -3063,6 +3775,126 @@ class ExchangeCalendarTestBase:
             else:
                 assert cal.next_close(minute, _parse=False) == next_close
 
+    def test_prev_next_opens_closes_nanos(self, default_calendar_with_answers):
+        """Test array variants of methods that return previous/next open/close.
+
+        Tests methods:
+            previous_opens_nanos
+            previous_closes_nanos
+            next_opens_nanos
+            next_closes_nanos
+        """
+        cal, ans = default_calendar_with_answers
+        # oob minutes handled by parsing
+        rows = [
+            row
+            for row in ans.prev_next_open_close_minutes()
+            if ans.first_minute <= row[0] <= ans.last_minute
+        ]
+        minutes = pd.DatetimeIndex([row[0] for row in rows])
+
+        methods = (
+            cal.previous_opens_nanos,
+            cal.previous_closes_nanos,
+            cal.next_opens_nanos,
+            cal.next_closes_nanos,
+        )
+        for i, method in enumerate(methods):
+            expected = [row[1][i] for row in rows]
+            valid = np.array([v is not None for v in expected])
+            expected = pd.DatetimeIndex([v for v in expected if v is not None])
+            np.testing.assert_array_equal(method(minutes[valid]), expected.asi8)
+            if not valid.all():
+                with pytest.raises(ValueError):
+                    method(minutes)
+
+    def test_raw_input_and_nanos_output(self, default_calendar_with_answers):
+        """Test methods receiving int / np.datetime64 and returning nanos.
+
+        Verifies methods receiving input as int nanoseconds or as a
+        np.datetime64 return same as when receive a pd.Timestamp, and that
+        methods return the int nanoseconds of the pd.Timestamp that would
+        otherwise be returned when `as_nanos` is True.
+        """
+        cal, ans = default_calendar_with_answers
+
+        def outcome(method, *args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            except Exception as err:
+                return type(err)
+
+        def assert_same(rtrn, expected):
+            if isinstance(expected, type) or not pd.isna(expected):
+                assert rtrn == expected
+            else:
+                assert rtrn is pd.NaT
+
+        def assert_nanos_match(rtrn, expected):
+            if isinstance(expected, type):
+                assert rtrn is expected
+            elif pd.isna(expected):
+                assert rtrn == NP_NAT
+            else:
+                assert rtrn == expected.value
+                assert isinstance(rtrn, int)
+
+        sessions = ans.sessions_sample
+        for session in sessions[[0, -1]].union(sessions[1::5]):
+            inputs = (session.value, session.to_datetime64())
+            for method in (
+                cal.session_open,
+                cal.session_close,
+                cal.session_break_start,
+                cal.session_break_end,
+                cal.session_first_minute,
+                cal.session_last_minute,
+                cal.session_last_am_minute,
+                cal.session_first_pm_minute,
+                cal.next_session,
+                cal.previous_session,
+                cal.date_to_session,
+            ):
+                expected = outcome(method, session)
+                for input_ in inputs:
+                    assert_same(outcome(method, input_), expected)
+                    assert_nanos_match(outcome(method, input_, as_nanos=True), expected)
+            for input_ in inputs:
+                assert cal.is_session(input_)
+
+        minutes = itertools.chain(
+            ans.trading_minutes_only(),
+            ans.break_minutes_only(),
+            ans.non_trading_minutes_only(),
+        )
+        for minute in minutes:
+            if not ans.first_minute <= minute <= ans.last_minute:
+                continue
+            inputs = (minute.value, minute.tz_convert(None).to_datetime64())
+            for method in (
+                cal.next_open,
+                cal.next_close,
+                cal.previous_open,
+                cal.previous_close,
+                cal.next_minute,
+                cal.previous_minute,
+                cal.minute_to_session,
+                cal.minute_to_trading_minute,
+            ):
+                expected = outcome(method, minute)
+                for input_ in inputs:
+                    assert_same(outcome(method, input_), expected)
+                    assert_nanos_match(outcome(method, input_, as_nanos=True), expected)
+            for method in (
+                cal.is_trading_minute,
+                cal.is_break_minute,
+                cal.is_open_on_minute,
+                cal.is_open_at_time,
+            ):
+                expected = method(minute)
+                for input_ in inputs:
+                    assert method(input_) is expected
+
     def test_prev_next_minute(self, all_calendars_with_answers, one_minute):
         """Test methods that return previous/next minute.
 
@@ -3219,6 +4051,42 @@ class ExchangeCalendarTestBase:
             session = f(oob_minute, direction)
             assert session == ans.last_session
 
+    def test_minutes_to_session_indices(
+        self, all_calendars_with_answers, all_directions
+    ):
+        direction = all_directions
+        calendar, ans = all_calendars_with_answers
+        f = calendar.minutes_to_session_indices
+        sessions = ans.sessions
+
+        minutes, expected = [], []
+        for non_trading_mins, prev_session, next_session in ans.non_trading_minutes:
+            if direction == "none":
+                with pytest.raises(ValueError):
+                    f(list(non_trading_mins), direction)
+                continue
+            session = next_session if direction == "next" else prev_session
+            minutes.extend(non_trading_mins)
+            expected.extend([session] * len(non_trading_mins))
+
+        for trading_minutes, session in ans.trading_minutes:
+            minutes.extend(trading_minutes)
+            expected.extend([session] * len(trading_minutes))
+
+        if ans.has_a_session_with_break:
+            for break_minutes, session in ans.break_minutes[:15]:
+                minutes.extend(break_minutes)
+                expected.extend([session] * len(break_minutes))
+
+        rtrn = f(pd.DatetimeIndex(minutes), direction)
+        expected = pd.DatetimeIndex(expected)
+        np.testing.assert_array_equal(rtrn, sessions.get_indexer(expected))
+
+        with pytest.raises(errors.MinuteOutOfBounds):
+            f([ans.first_minute, ans.minute_too_early], direction)
+        with pytest.raises(errors.MinuteOutOfBounds):
+            f([ans.last_minute, ans.minute_too_late], direction)
+
     def test_minute_to_past_session(self, all_calendars_with_answers, one_minute):
         """
         Only lightly tested given method is little more than a wrapper over
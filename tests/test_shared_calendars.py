@@ -0,0 +1,127 @@
+"""Tests for shared_calendars module."""
+
+from __future__ import annotations
+
+from collections import abc
+import concurrent.futures
+import pickle
+
+import numpy as np
+import pandas as pd
+import pandas.testing as tm
+import pytest
+
+from exchange_calendars import shared_calendars
+from exchange_calendars.calendar_utils import _default_calendar_factories
+
+
+@pytest.fixture(scope="module")
+def calendar() -> abc.Iterator:
+    yield _default_calendar_factories["XHKG"]("2019", "2021-12-31", side="right")
+
+
+@pytest.fixture
+def shared(calendar) -> abc.Iterator[shared_calendars.SharedCalendar]:
+    with shared_calendars.publish(calendar) as shared:
+        yield shared
+
+
+def _summary(shared: shared_calendars.SharedCalendar) -> tuple:
+    cal = shared.attach()
+    return type(cal), cal.side, len(cal.sessions), int(cal.minutes_nanos.sum())
+
+
+def assert_calendars_equal(attached, calendar, minutes: bool = True):
+    assert type(attached) is type(calendar)
+    assert attached.side == calendar.side
+    tm.assert_frame_equal(attached.schedule, calendar.schedule, check_freq=False)
+    tm.assert_index_equal(attached.late_opens, calendar.late_opens)
+    tm.assert_index_equal(attached.early_closes, calendar.early_closes)
+    fields = [
+        "sessions_nanos",
+        "opens_nanos",
+        "break_starts_nanos",
+        "break_ends_nanos",
+        "closes_nanos",
+    ]
+    fields += list(shared_calendars.MINUTE_FIELDS)
+    if minutes:
+        fields.append("minutes_nanos")
+    for field in fields:
+        assert field in attached.__dict__
+        array = getattr(attached, field)
+        assert not array.flags.writeable
+        np.testing.assert_array_equal(array, getattr(calendar, field))
+    np.testing.assert_array_equal(attached.minutes_nanos, calendar.minutes_nanos)
+
+
+def test_publish_attach(calendar, shared):
+    attached = shared.attach()
+    assert_calendars_equal(attached, calendar)
+    assert shared.attach() is attached
+
+    # all arrays view a single shared buffer
+    assert attached.opens_nanos.base is attached.minutes_nanos.base
+    assert shared.nbytes >= calendar.minutes_nanos.nbytes
+    assert set(shared.fields) >= set(shared_calendars.MINUTE_FIELDS)
+
+    # verify calendar fully functional
+    minute = pd.Timestamp("2021-06-01 03:00", tz="UTC")
+    assert attached.is_open_on_minute(minute)
+    assert attached.minute_to_session(minute) == calendar.minute_to_session(minute)
+    tm.assert_index_equal(
+        attached.trading_index("2021-06-01", "2021-06-07", "1h"),
+        calendar.trading_index("2021-06-01", "2021-06-07", "1h"),
+    )
+    sliced = attached.slice("2020", "2020-12-31")
+    tm.assert_frame_equal(
+        sliced.schedule, calendar.slice("2020", "2020-12-31").schedule
+    )
+
+    # pickles as a calendar that is not backed by shared memory
+    unpickled = pickle.loads(pickle.dumps(attached))
+    assert "_shared_memory" not in unpickled.__dict__
+    assert unpickled.opens_nanos.flags.writeable
+    tm.assert_frame_equal(unpickled.schedule, calendar.schedule, check_freq=False)
+
+
+def test_pickled_handle(calendar, shared):
+    handle = pickle.loads(pickle.dumps(shared))
+    assert handle.name == shared.name
+    assert len(pickle.dumps(shared)) < 1000
+    assert_calendars_equal(handle.attach(), calendar)
+    handle.unlink()  # only the handle returned by `publish` owns the block
+    assert shared.attach() is handle.attach()
+
+
+def test_attach_in_process_pool(calendar, shared):
+    with concurrent.futures.ProcessPoolExecutor(2) as executor:
+        rtrns = list(executor.map(_summary, [shared] * 2))
+    expected = (
+        type(calendar),
+        calendar.side,
+        len(calendar.sessions),
+        int(calendar.minutes_nanos.sum()),
+    )
+    assert rtrns == [expected] * 2
+
+
+def test_publish_without_minutes(calendar):
+    with shared_calendars.publish(calendar, minutes=False) as shared:
+        assert "minutes_nanos" not in shared.fields
+        attached = shared.attach()
+        assert "minutes_nanos" not in attached.__dict__
+        assert_calendars_equal(attached, calendar, minutes=False)
+
+
+def test_unlink(calendar):
+    shared = shared_calendars.publish(calendar)
+    attached = shared.attach()
+    shared.unlink()
+    shared.unlink()  # does nothing if already unlinked
+    # calendar attached before unlinked remains valid
+    np.testing.assert_array_equal(attached.closes_nanos, calendar.closes_nanos)
+
+    del attached
+    with pytest.raises(FileNotFoundError):
+        pickle.loads(pickle.dumps(shared)).attach()
@@ -1,9 +1,11 @@
 from datetime import date
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from exchange_calendars.exchange_calendar_xkrx import XKRXExchangeCalendar
+from exchange_calendars.pandas_extensions import korean_holiday
 from .test_exchange_calendar import ExchangeCalendarTestBase
 from .test_utils import T
 
@@ -81,7 +83,7 @@ class TestXKRXCalendar(ExchangeCalendarTestBase):
             "2022-10-10",
             # Buddha's birthday was on 27th May (Saturday),
             # so the next monday becomes alternative holiday
-            "2023-05-29"
+            "2023-05-29",
         ]
 
     @pytest.fixture
@@ -135,3 +137,39 @@ class TestXKRXCalendar(ExchangeCalendarTestBase):
     def test_feb_29_2022_in_lunar_calendar(self, default_calendar):
         # This test asserts that the following does not throw an exception.
         default_calendar.regular_holidays.holidays(date(2022, 3, 31), date(2022, 3, 31))
+
+    def test_lunar_conversion_against_library(self):
+        klc = pytest.importorskip("korean_lunar_calendar")
+        calendar = klc.KoreanLunarCalendar()
+        solar = pd.date_range("1700-01-01", "2050-12-31", freq="17D")
+        lunar = korean_holiday._solar_days_to_lunar(
+            solar.values.astype("datetime64[D]").astype("int64")
+        )
+        for dt, year, month, day in zip(solar, *lunar):
+            assert calendar.setSolarDate(dt.year, dt.month, dt.day)
+            assert (calendar.lunarYear, calendar.lunarMonth, calendar.lunarDay) == (
+                year,
+                month,
+                day,
+            )
+            is_intercalation = calendar.isIntercalation
+            assert korean_holiday.korean_lunar_to_solar(
+                year, month, day, is_intercalation
+            ) == (dt.year, dt.month, dt.day)
+
+        lunar_dates = pd.DatetimeIndex(["2020-01-01", "2020-04-08", "2020-08-15"])
+        rtrn = korean_holiday.korean_lunar_to_solar_dates(lunar_dates)
+        expected = pd.DatetimeIndex(["2020-01-25", "2020-04-30", "2020-10-01"])
+        pd.testing.assert_index_equal(rtrn, expected)
+
+        # 2020 has an intercalary 4th month
+        assert korean_holiday.korean_lunar_to_solar(2020, 4, 1, True) == (2020, 5, 23)
+        for args in [(2020, 5, 1, True), (2020, 1, 31), (2051, 1, 1), (2020, 13, 1)]:
+            with pytest.raises(ValueError, match="Invalid date for lunar date"):
+                korean_holiday.korean_lunar_to_solar(*args)
+        with pytest.raises(ValueError, match="Invalid date for solar date"):
+            korean_holiday.korean_solar_to_lunar(2051, 1, 1)
+        assert np.array_equal(
+            korean_holiday.korean_lunar_to_solar_dates(lunar_dates[:0]),
+            pd.DatetimeIndex([]),
+        )
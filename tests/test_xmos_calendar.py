@@ -90,4 +90,7 @@ class TestXMOSCalendar(ExchangeCalendarTestBase):
             # Day of Russia (June 12th) on a Saturday, but
             # the following Monday is a trading day.
             "2021-06-14",
+            # Sunday that special weekmasks define as a trading day, following
+            # a run of holidays.
+            "2009-01-11",
         ]
@@ -109,3 +109,13 @@ class TestXPHSCalendar(ExchangeCalendarTestBase):
             "2017-12-29",
             "2018-01-03",
         ]
+
+    def test_prev_next_opens_closes_nanos(self, default_calendar_with_answers):
+        # overrides base to mark as xfail
+        msg = (
+            "Open/close times of answers differ from those evaluated with the"
+            " installed Asia/Manila zone data (Philippines observed DST in 1990),"
+            " as for the pre-existing failures of test_prev_next_open_close and"
+            " test_opens_closes_break_starts_ends."
+        )
+        pytest.xfail(msg)